@@ -2,10 +2,14 @@
 
 import logging
 import uuid
-from typing import Optional, List, Dict
+from contextlib import nullcontext
+from pathlib import Path
+from typing import ContextManager, Optional, List, Dict
 from ..models import Paper, PaperSource, Author
 from ..paper_utils import titles_match
 
+from .cache import ResponseCache
+
 from .semantic_scholar import SemanticScholarClient
 from .crossref import CrossRefClient
 from .openalex import OpenAlexClient
@@ -26,6 +30,8 @@ class APIAggregator:
         use_apis: Optional[List[str]] = None,
         scholar_proxy: Optional[str] = None,
         scholar_free_proxy: bool = False,
+        cache_dir: Optional[Path] = None,
+        offline: bool = False,
     ):
         """Initialize API aggregator.
 
@@ -35,6 +41,8 @@ class APIAggregator:
             use_apis: List of APIs to use (default: all)
             scholar_proxy: Proxy URL for Google Scholar (e.g., "http://host:port")
             scholar_free_proxy: Use free rotating proxies for Google Scholar
+            cache_dir: Directory for the on-disk response cache (no caching if None)
+            offline: Answer only from the response cache, never hit the network
         """
         if use_apis is None:
             # Note: google_scholar excluded by default due to aggressive rate limiting/IP bans
@@ -43,25 +51,30 @@ class APIAggregator:
 
         self.clients = {}
 
+        # Shared on-disk cache so re-runs don't re-fetch papers already seen
+        self.cache = ResponseCache(cache_dir, offline=offline) if cache_dir else None
+
         # Initialize enabled API clients
         if "semantic_scholar" in use_apis:
-            self.clients["semantic_scholar"] = SemanticScholarClient(api_key=s2_api_key)
+            self.clients["semantic_scholar"] = SemanticScholarClient(
+                api_key=s2_api_key, cache=self.cache
+            )
             logger.info("Initialized Semantic Scholar client")
 
         if "crossref" in use_apis:
-            self.clients["crossref"] = CrossRefClient(email=email)
+            self.clients["crossref"] = CrossRefClient(email=email, cache=self.cache)
             logger.info("Initialized CrossRef client")
 
         if "openalex" in use_apis:
-            self.clients["openalex"] = OpenAlexClient(email=email)
+            self.clients["openalex"] = OpenAlexClient(email=email, cache=self.cache)
             logger.info("Initialized OpenAlex client")
 
         if "arxiv" in use_apis:
-            self.clients["arxiv"] = ArXivClient()
+            self.clients["arxiv"] = ArXivClient(cache=self.cache)
             logger.info("Initialized arXiv client")
 
         if "opencitations" in use_apis:
-            self.clients["opencitations"] = OpenCitationsClient()
+            self.clients["opencitations"] = OpenCitationsClient(cache=self.cache)
             logger.info("Initialized OpenCitations client")
 
         if "google_scholar" in use_apis:
@@ -153,6 +166,8 @@ class APIAggregator:
             try:
                 references = self.clients["opencitations"].get_references(paper.doi)
                 if references:
+                    # OpenCitations only returns DOIs - fill in metadata in bulk
+                    self._hydrate_papers(references)
                     logger.info(f"Found {len(references)} references using OpenCitations")
                     return references
             except Exception as e:
@@ -197,6 +212,8 @@ class APIAggregator:
             try:
                 citations = self.clients["opencitations"].get_citations(paper.doi)
                 if citations:
+                    # OpenCitations only returns DOIs - fill in metadata in bulk
+                    self._hydrate_papers(citations)
                     logger.info(f"Found {len(citations)} citations using OpenCitations")
                     return citations
             except Exception as e:
@@ -220,6 +237,59 @@ class APIAggregator:
         logger.warning(f"Could not find citations for paper: {paper.title}")
         return []
 
+    def fetch_papers_batch(self, ids: List[str]) -> List[Optional[Paper]]:
+        """Fetch many papers at once using the Semantic Scholar batch endpoint.
+
+        Args:
+            ids: Paper identifiers (S2 ids, or prefixed like "DOI:10.xxx")
+
+        Returns:
+            List aligned with ids, with None for papers that were not found
+        """
+        if "semantic_scholar" not in self.clients:
+            return [None] * len(ids)
+
+        try:
+            return self.clients["semantic_scholar"].get_papers_batch(ids)
+        except Exception as e:
+            logger.warning(f"Error fetching S2 paper batch: {e}")
+            return [None] * len(ids)
+
+    def _hydrate_papers(self, papers: List[Paper]) -> None:
+        """Fill in missing metadata of DOI-only papers with a single batch lookup."""
+        with_doi = [p for p in papers if p.doi]
+        if not with_doi:
+            return
+
+        found = self.fetch_papers_batch([f"DOI:{p.doi}" for p in with_doi])
+        hydrated = 0
+
+        for paper, s2_paper in zip(with_doi, found):
+            if not s2_paper:
+                continue
+            if s2_paper.title:
+                paper.title = s2_paper.title
+            if not paper.authors:
+                paper.authors = s2_paper.authors
+            if not paper.year:
+                paper.year = s2_paper.year
+            if not paper.abstract:
+                paper.abstract = s2_paper.abstract
+            if not paper.venue:
+                paper.venue = s2_paper.venue
+            if paper.citation_count is None:
+                paper.citation_count = s2_paper.citation_count
+            if paper.influential_citation_count is None:
+                paper.influential_citation_count = s2_paper.influential_citation_count
+            if not paper.semantic_scholar_id:
+                paper.semantic_scholar_id = s2_paper.semantic_scholar_id
+            if not paper.arxiv_id:
+                paper.arxiv_id = s2_paper.arxiv_id
+            paper.raw_data.update(s2_paper.raw_data)
+            hydrated += 1
+
+        logger.info(f"Hydrated {hydrated}/{len(with_doi)} papers with Semantic Scholar batch")
+
     def _convert_gs_citations_to_papers(self, gs_citations: List[dict]) -> List[Paper]:
         """Convert Google Scholar citation dicts to Paper objects."""
         papers = []
@@ -246,6 +316,12 @@ class APIAggregator:
 
         return papers
 
+    def bypass_cache(self) -> ContextManager[None]:
+        """Make requests from this thread skip cached responses, e.g. on an explicit refresh."""
+        if self.cache is None:
+            return nullcontext()
+        return self.cache.bypass()
+
     def enrich_metadata(self, paper: Paper) -> Paper:
         """Enrich paper metadata using all available APIs."""
         for api_name, client in self.clients.items():
@@ -1,12 +1,12 @@
 """arXiv API client."""
 
 import logging
-import time
 import xml.etree.ElementTree as ET
 from typing import Optional, List, Dict, Any
 import httpx
 
-from .base import BaseAPIClient, APINotFoundError
+from .base import BaseAPIClient, APINotFoundError, RateLimiter, create_http_client, send_with_retry
+from .cache import ResponseCache
 from ..models import Paper, Author, Venue, PaperSource
 from ..storage.json_storage import JSONStorage
 
@@ -18,14 +18,17 @@ class ArXivClient(BaseAPIClient):
 
     BASE_URL = "http://export.arxiv.org/api/query"
 
-    def __init__(self, rate_limit_delay: float = 3.0):
+    def __init__(self, rate_limit_delay: float = 3.0, cache: Optional[ResponseCache] = None):
         """Initialize arXiv client.
 
         Args:
             rate_limit_delay: Delay between requests (arXiv recommends 3 seconds)
+            cache: Optional on-disk response cache
         """
         self.rate_limit_delay = rate_limit_delay
-        self.client = httpx.Client(timeout=30.0)
+        self._rate_limiter = RateLimiter()
+        self.cache = cache
+        self.client = create_http_client()
 
     def _make_request(self, params: Dict[str, str]) -> str:
         """Make a request to the arXiv API.
@@ -34,8 +37,10 @@ class ArXivClient(BaseAPIClient):
             XML response as string
         """
         try:
-            time.sleep(self.rate_limit_delay)
-            response = self.client.get(self.BASE_URL, params=params)
+            response = send_with_retry(
+                self.client, "GET", self.BASE_URL, self._rate_limiter, self.rate_limit_delay,
+                params=params, cache=self.cache,
+            )
 
             if response.status_code != 200:
                 logger.error(f"API error: {response.status_code}")
@@ -1,8 +1,20 @@
 """Base API client interface."""
 
+import importlib.util
+import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
+import httpx
+
 from ..models import Paper, Author, Venue
+from .cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional "h2" package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 class BaseAPIClient(ABC):
@@ -69,6 +81,89 @@ class BaseAPIClient(ABC):
         pass
 
 
+class RateLimiter:
+    """Enforce a minimum delay between requests, shared by all threads using a client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_request_time = 0.0
+
+    def wait(self, delay: float) -> None:
+        """Block until at least `delay` seconds have passed since the previous request.
+
+        Callers are serialized by the lock, so concurrent threads are spaced out
+        instead of all sleeping the same amount and firing together.
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._last_request_time
+            if elapsed < delay:
+                time.sleep(delay - elapsed)
+            self._last_request_time = time.monotonic()
+
+
+def create_http_client(timeout: float = 30.0) -> httpx.Client:
+    """Create a persistent HTTP client, using HTTP/2 when it is available.
+
+    The client keeps connections alive, so TLS handshakes are paid once per
+    host instead of once per request.
+    """
+    return httpx.Client(timeout=timeout, http2=HTTP2_AVAILABLE)
+
+
+def send_with_retry(
+    client: httpx.Client,
+    method: str,
+    url: str,
+    rate_limiter: RateLimiter,
+    delay: float,
+    max_retries: int = 3,
+    backoff: float = 1.0,
+    cache: Optional[ResponseCache] = None,
+    **kwargs,
+) -> httpx.Response:
+    """Send a rate-limited request, retrying when the server answers 429.
+
+    Waits for the Retry-After header when the server sends one, otherwise
+    backs off exponentially (backoff, 2 * backoff, ...).
+
+    When a cache is given, fresh cached responses are returned without any
+    network access, and successful responses are stored. In offline mode a
+    cache miss is answered with a 504, like an only-if-cached request.
+
+    Returns:
+        The last response; still a 429 if all retries were exhausted
+    """
+    key = None
+    if cache is not None:
+        key = cache.make_key(method, url, kwargs.get("params"), kwargs.get("json"))
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        if cache.offline:
+            return httpx.Response(504)
+
+    for attempt in range(max_retries + 1):
+        rate_limiter.wait(delay)
+        send = client.post if method == "POST" else client.get
+        response = send(url, **kwargs)
+        if response.status_code != 429 or attempt == max_retries:
+            if key is not None:
+                cache.set(key, response)
+            return response
+
+        wait = backoff * (2 ** attempt)
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                wait = max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        logger.info(f"Rate limited on {url}, retrying in {wait:.1f}s")
+        time.sleep(wait)
+
+    return response
+
+
 class APIClientError(Exception):
     """Base exception for API client errors."""
     pass
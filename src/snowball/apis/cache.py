@@ -0,0 +1,126 @@
+"""On-disk cache for API responses."""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Responses without usable Cache-Control headers are kept for 7 days
+DEFAULT_TTL = 7 * 24 * 3600
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class ResponseCache:
+    """Stores successful API responses as JSON files keyed by request.
+
+    Each entry is one file named after a hash of the method, URL, query
+    parameters and JSON body, so re-running a snowball iteration or an
+    enrichment does not hit the network for papers already seen.
+    """
+
+    def __init__(self, cache_dir: Path, default_ttl: float = DEFAULT_TTL, offline: bool = False):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache files
+            default_ttl: Lifetime in seconds for responses without Cache-Control
+            offline: Never touch the network; misses are answered with a 504
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Keep cached responses out of version-controlled project directories
+        gitignore = self.cache_dir / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("*\n")
+        self.default_ttl = default_ttl
+        self.offline = offline
+        self._local = threading.local()
+
+    @staticmethod
+    def make_key(
+        method: str, url: str, params: Optional[Dict] = None, json_body: Any = None
+    ) -> str:
+        """Build a stable cache key for a request."""
+        payload = json.dumps(
+            [method.upper(), url, params or {}, json_body], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    @contextmanager
+    def bypass(self) -> Iterator[None]:
+        """Skip cached responses for requests made in this thread.
+
+        Fresh responses are still stored, so later requests see them.
+        """
+        self._local.bypass = True
+        try:
+            yield
+        finally:
+            self._local.bypass = False
+
+    def get(self, key: str) -> Optional[httpx.Response]:
+        """Return the cached response for key, or None if missing or expired."""
+        if getattr(self._local, "bypass", False):
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not self.offline and time.time() > entry.get("expires_at", 0):
+            return None
+
+        return httpx.Response(
+            entry["status_code"],
+            content=entry["body"].encode("utf-8"),
+            headers={"Content-Type": entry.get("content_type", "application/json")},
+        )
+
+    def set(self, key: str, response: httpx.Response) -> None:
+        """Store a response, honouring Cache-Control no-store and max-age."""
+        if response.status_code != 200:
+            return
+
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return
+
+        ttl = self.default_ttl
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            ttl = int(match.group(1))
+            if ttl == 0:
+                return
+
+        entry = {
+            "status_code": response.status_code,
+            "content_type": response.headers.get("Content-Type", "application/json"),
+            "body": response.text,
+            "expires_at": time.time() + ttl,
+        }
+
+        # Write to a temporary file first so concurrent readers never see partial JSON
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write response cache entry: {e}")
@@ -1,11 +1,14 @@
 """CrossRef API client."""
 
 import logging
-import time
 from typing import Optional, List, Dict, Any
 import httpx
 
-from .base import BaseAPIClient, RateLimitError, APINotFoundError
+from .base import (
+    BaseAPIClient, RateLimitError, APINotFoundError, RateLimiter,
+    create_http_client, send_with_retry,
+)
+from .cache import ResponseCache
 from ..models import Paper, Author, Venue, PaperSource
 from ..storage.json_storage import JSONStorage
 
@@ -17,15 +20,23 @@ class CrossRefClient(BaseAPIClient):
 
     BASE_URL = "https://api.crossref.org"
 
-    def __init__(self, email: Optional[str] = None, rate_limit_delay: float = 0.05):
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        rate_limit_delay: float = 0.05,
+        cache: Optional[ResponseCache] = None,
+    ):
         """Initialize CrossRef client.
 
         Args:
             email: Email for polite pool (higher rate limits)
             rate_limit_delay: Delay between requests in seconds
+            cache: Optional on-disk response cache
         """
         self.rate_limit_delay = rate_limit_delay
-        self.client = httpx.Client(timeout=30.0)
+        self._rate_limiter = RateLimiter()
+        self.cache = cache
+        self.client = create_http_client()
 
         # Use polite pool if email provided
         if email:
@@ -36,8 +47,10 @@ class CrossRefClient(BaseAPIClient):
         url = f"{self.BASE_URL}/{endpoint}"
 
         try:
-            time.sleep(self.rate_limit_delay)
-            response = self.client.get(url, params=params)
+            response = send_with_retry(
+                self.client, "GET", url, self._rate_limiter, self.rate_limit_delay,
+                params=params, cache=self.cache,
+            )
 
             if response.status_code == 429:
                 raise RateLimitError("CrossRef rate limit exceeded")
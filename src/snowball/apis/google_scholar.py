@@ -1,9 +1,10 @@
 """Google Scholar client for citation data."""
 
 import logging
-import time
 from typing import Optional, Tuple, List
 
+from .base import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +34,7 @@ class GoogleScholarClient:
         self.proxy = proxy
         self.use_free_proxy = use_free_proxy
         self._scholarly = None
-        self._last_request_time = 0
+        self._rate_limiter = RateLimiter()
         self._proxy_configured = False
 
     def _get_scholarly(self):
@@ -86,10 +87,7 @@ class GoogleScholarClient:
 
     def _rate_limit(self):
         """Apply rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+        self._rate_limiter.wait(self.rate_limit_delay)
 
     def get_citation_count(self, title: str) -> Optional[int]:
         """Get citation count for a paper by title.
@@ -1,11 +1,14 @@
 """OpenCitations API client for open citation data."""
 
 import logging
-import time
 from typing import Optional, List, Dict, Any
 import httpx
 
-from .base import BaseAPIClient, RateLimitError, APINotFoundError
+from .base import (
+    BaseAPIClient, RateLimitError, APINotFoundError, RateLimiter,
+    create_http_client, send_with_retry,
+)
+from .cache import ResponseCache
 from ..models import Paper, Author, PaperSource
 from ..storage.json_storage import JSONStorage
 
@@ -25,15 +28,19 @@ class OpenCitationsClient(BaseAPIClient):
         self,
         access_token: Optional[str] = None,
         rate_limit_delay: float = 0.1,
+        cache: Optional[ResponseCache] = None,
     ):
         """Initialize OpenCitations client.
 
         Args:
             access_token: OpenCitations access token (optional but recommended)
             rate_limit_delay: Delay between requests in seconds
+            cache: Optional on-disk response cache
         """
         self.rate_limit_delay = rate_limit_delay
-        self.client = httpx.Client(timeout=30.0)
+        self._rate_limiter = RateLimiter()
+        self.cache = cache
+        self.client = create_http_client()
 
         # Set headers
         self.client.headers["User-Agent"] = "SnowballSLR/0.1"
@@ -48,8 +55,10 @@ class OpenCitationsClient(BaseAPIClient):
         url = f"{self.BASE_URL}/{endpoint}"
 
         try:
-            time.sleep(self.rate_limit_delay)
-            response = self.client.get(url, params=params)
+            response = send_with_retry(
+                self.client, "GET", url, self._rate_limiter, self.rate_limit_delay,
+                params=params, cache=self.cache,
+            )
 
             if response.status_code == 429:
                 raise RateLimitError("OpenCitations rate limit exceeded")
@@ -145,7 +154,7 @@ class OpenCitationsClient(BaseAPIClient):
             doi=doi,
             title=f"Paper {doi}",  # Placeholder, will be enriched
             authors=[],
-            source=PaperSource.CITATION if is_citing else PaperSource.REFERENCE,
+            source=PaperSource.FORWARD if is_citing else PaperSource.BACKWARD,
             raw_data={"opencitations_citation": data}
         )
 
@@ -1,11 +1,14 @@
 """Semantic Scholar API client."""
 
 import logging
-import time
 from typing import Optional, List, Dict, Any
 import httpx
 
-from .base import BaseAPIClient, RateLimitError, APINotFoundError
+from .base import (
+    BaseAPIClient, RateLimitError, APINotFoundError, RateLimiter,
+    create_http_client, send_with_retry,
+)
+from .cache import ResponseCache
 from ..models import Paper, Author, Venue, PaperSource
 from ..storage.json_storage import JSONStorage
 
@@ -35,12 +38,24 @@ class SemanticScholarClient(BaseAPIClient):
         "journal",
     ]
 
-    def __init__(self, api_key: Optional[str] = None, rate_limit_delay: Optional[float] = None):
+    # Fields for batch lookups (references/citations omitted to keep responses small)
+    BATCH_FIELDS = [f for f in PAPER_FIELDS if f not in ("references", "citations")]
+
+    # Maximum number of ids accepted by the /paper/batch endpoint
+    BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        rate_limit_delay: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
         """Initialize Semantic Scholar client.
 
         Args:
             api_key: Optional API key for authenticated access
             rate_limit_delay: Delay between requests in seconds. Defaults to 2.0s.
+            cache: Optional on-disk response cache
         """
         self.api_key = api_key
         # S2 rate limits: be conservative to avoid 429 errors
@@ -48,17 +63,22 @@ class SemanticScholarClient(BaseAPIClient):
             self.rate_limit_delay = rate_limit_delay
         else:
             self.rate_limit_delay = 0.5   # 0.5 seconds between requests (safe for single enrichments)
-        self.client = httpx.Client(timeout=30.0)
+        self._rate_limiter = RateLimiter()
+        self.cache = cache
+        self.client = create_http_client()
 
         if api_key:
             self.client.headers["x-api-key"] = api_key
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+    def _make_request(
+        self, endpoint: str, params: Optional[Dict] = None, json_body: Optional[Any] = None
+    ) -> Any:
         """Make a request to the Semantic Scholar API.
 
         Args:
             endpoint: API endpoint
             params: Query parameters
+            json_body: JSON body; when given, the request is sent as a POST
 
         Returns:
             JSON response
@@ -70,8 +90,16 @@ class SemanticScholarClient(BaseAPIClient):
         url = f"{self.BASE_URL}/{endpoint}"
 
         try:
-            time.sleep(self.rate_limit_delay)
-            response = self.client.get(url, params=params)
+            if json_body is not None:
+                response = send_with_retry(
+                    self.client, "POST", url, self._rate_limiter, self.rate_limit_delay,
+                    params=params, json=json_body, cache=self.cache,
+                )
+            else:
+                response = send_with_retry(
+                    self.client, "GET", url, self._rate_limiter, self.rate_limit_delay,
+                    params=params, cache=self.cache,
+                )
 
             if response.status_code == 429:
                 raise RateLimitError("Semantic Scholar rate limit exceeded")
@@ -195,6 +223,38 @@ class SemanticScholarClient(BaseAPIClient):
 
         return None
 
+    def get_papers_batch(self, ids: List[str]) -> List[Optional[Paper]]:
+        """Get many papers with the /paper/batch endpoint.
+
+        Args:
+            ids: Paper identifiers (S2 ids, or prefixed like "DOI:10.xxx", "ARXIV:2301.00001")
+
+        Returns:
+            List aligned with ids, with None for papers that were not found
+        """
+        papers: List[Optional[Paper]] = []
+
+        for start in range(0, len(ids), self.BATCH_SIZE):
+            chunk = ids[start:start + self.BATCH_SIZE]
+            try:
+                data = self._make_request(
+                    "paper/batch",
+                    params={"fields": ",".join(self.BATCH_FIELDS)},
+                    json_body={"ids": chunk},
+                )
+            except Exception as e:
+                logger.error(f"Error getting paper batch: {e}")
+                data = None
+
+            if not isinstance(data, list) or len(data) != len(chunk):
+                papers.extend([None] * len(chunk))
+                continue
+
+            for item in data:
+                papers.append(self._parse_paper(item) if item else None)
+
+        return papers
+
     def get_references(self, paper_id: str, limit: int = 1000) -> List[Paper]:
         """Get papers referenced by this paper."""
         references = []
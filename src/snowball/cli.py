@@ -9,7 +9,7 @@ from datetime import datetime
 import argparse
 
 from .models import ReviewProject, FilterCriteria, PaperStatus
-from .storage.json_storage import JSONStorage
+from .storage import open_storage
 from .apis.aggregator import APIAggregator
 from .parsers.pdf_parser import PDFParser
 from .snowballing import SnowballEngine
@@ -18,7 +18,6 @@ from .exporters.bibtex import BibTeXExporter
 from .exporters.csv_exporter import CSVExporter
 from .exporters.tikz import TikZExporter
 from .paper_utils import (
-    get_status_value,
     filter_papers,
     sort_papers,
     paper_to_dict,
@@ -42,7 +41,8 @@ def get_api_config(args) -> dict:
         SNOWBALL_EMAIL: Email for API polite pools
 
     Returns:
-        Dict with keys: s2_api_key, email, use_apis, scholar_proxy, scholar_free_proxy
+        Dict with keys: s2_api_key, email, use_apis, scholar_proxy, scholar_free_proxy,
+        cache_dir, offline. cache_dir is None when --no-cache was given.
     """
     s2_api_key = getattr(args, "s2_api_key", None) or os.environ.get("SEMANTIC_SCHOLAR_API_KEY")
     email = getattr(args, "email", None) or os.environ.get("SNOWBALL_EMAIL")
@@ -56,12 +56,17 @@ def get_api_config(args) -> dict:
     scholar_proxy = getattr(args, "scholar_proxy", None)
     scholar_free_proxy = getattr(args, "scholar_free_proxy", False)
 
+    # Responses are cached on disk unless --no-cache is given
+    cache_dir = None if getattr(args, "no_cache", False) else Path(args.directory) / ".http_cache"
+
     return {
         "s2_api_key": s2_api_key,
         "email": email,
         "use_apis": use_apis,
         "scholar_proxy": scholar_proxy,
         "scholar_free_proxy": scholar_free_proxy,
+        "cache_dir": cache_dir,
+        "offline": getattr(args, "offline", False),
     }
 
 
@@ -79,7 +84,7 @@ def init_project(args) -> None:
     (project_dir / "pdfs").mkdir(exist_ok=True)
 
     # Create storage
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir, backend=args.storage)
 
     # Create project
     project = ReviewProject(
@@ -107,7 +112,7 @@ def add_seed(args) -> None:
         sys.exit(1)
 
     # Load project
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -129,13 +134,15 @@ def add_seed(args) -> None:
         pdfs_dir = project_dir / "pdfs"
         pdfs_dir.mkdir(exist_ok=True)
 
+        pdf_files = []
         for pdf_path in args.pdf:
             pdf_file = Path(pdf_path)
             if not pdf_file.exists():
                 logger.warning(f"PDF not found: {pdf_file}")
                 continue
+            pdf_files.append(pdf_file)
 
-            paper = engine.add_seed_from_pdf(pdf_file, project)
+        for pdf_file, paper in engine.add_seeds_from_pdfs(pdf_files, project):
             if paper:
                 # Copy PDF to project's pdfs folder
                 dest_pdf = pdfs_dir / f"{paper.id}.pdf"
@@ -165,7 +172,7 @@ def run_snowball(args) -> None:
         sys.exit(1)
 
     # Load project
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -207,8 +214,6 @@ def run_snowball(args) -> None:
         logger.info(f"  - Auto-excluded: {stats['auto_excluded']}")
         logger.info(f"  - For review: {stats['for_review']}")
 
-        # Reload project
-        project = storage.load_project()
         iteration_count += 1
 
         if args.iterations and iteration_count >= args.iterations:
@@ -232,7 +237,7 @@ def review(args) -> None:
         sys.exit(1)
 
     # Load project
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -278,14 +283,18 @@ def export_results(args) -> None:
         sys.exit(1)
 
     # Load project and papers
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
         logger.error("No project found.")
         sys.exit(1)
 
-    papers = storage.load_all_papers()
+    # Exporters only keep included papers in this mode, so skip the rest at load time
+    if args.included_only:
+        papers = storage.load_papers(status_in={PaperStatus.INCLUDED})
+    else:
+        papers = storage.load_all_papers()
 
     if not papers:
         logger.warning("No papers to export")
@@ -303,14 +312,11 @@ def export_results(args) -> None:
         bibtex_exporter = BibTeXExporter()
 
         if args.included_only:
-            bibtex_content = bibtex_exporter.export(papers, only_included=True)
             bibtex_path = output_dir / "included_papers.bib"
         else:
-            bibtex_content = bibtex_exporter.export(papers, only_included=False)
             bibtex_path = output_dir / "all_papers.bib"
 
-        with open(bibtex_path, "w") as f:
-            f.write(bibtex_content)
+        bibtex_exporter.write(papers, bibtex_path, only_included=args.included_only)
 
         logger.info(f"Exported BibTeX to {bibtex_path}")
 
@@ -376,7 +382,7 @@ def list_papers(args) -> None:
         logger.error(f"Project directory {project_dir} does not exist")
         sys.exit(1)
 
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -400,7 +406,7 @@ def list_papers(args) -> None:
         print(f"\n{'ID':<38} {'Status':<10} {'Year':<6} {'Citations':<10} {'Title'}")
         print("-" * 120)
         for paper in papers:
-            status = get_status_value(paper.status)
+            status = paper.status
             year = str(paper.year) if paper.year else "-"
             citations = str(paper.citation_count) if paper.citation_count is not None else "-"
             title = truncate_title(paper.title)
@@ -421,7 +427,7 @@ def show_paper(args) -> None:
         logger.error(f"Project directory {project_dir} does not exist")
         sys.exit(1)
 
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -475,7 +481,7 @@ def set_status(args) -> None:
         logger.error(f"Project directory {project_dir} does not exist")
         sys.exit(1)
 
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -506,7 +512,7 @@ def set_status(args) -> None:
         sys.exit(1)
 
     # Update paper
-    old_status = get_status_value(paper.status)
+    old_status = paper.status
     paper.status = new_status
     if args.notes:
         paper.notes = args.notes
@@ -533,7 +539,7 @@ def show_stats(args) -> None:
         logger.error(f"Project directory {project_dir} does not exist")
         sys.exit(1)
 
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -542,19 +548,11 @@ def show_stats(args) -> None:
 
     stats = storage.get_statistics()
 
-    # Build iteration stats for output
-    iteration_details = {}
-    for iter_num, iter_stats in project.iteration_stats.items():
-        iteration_details[str(iter_num)] = {
-            "discovered": iter_stats.discovered,
-            "backward": iter_stats.backward,
-            "forward": iter_stats.forward,
-            "auto_excluded": iter_stats.auto_excluded,
-            "for_review": iter_stats.for_review,
-            "manual_included": iter_stats.manual_included,
-            "manual_excluded": iter_stats.manual_excluded,
-            "reviewed": iter_stats.reviewed,
-        }
+    # Build iteration stats for output: every counter, in field order
+    iteration_details = {
+        str(iter_num): iter_stats.model_dump(exclude={"iteration", "timestamp"})
+        for iter_num, iter_stats in project.iteration_stats.items()
+    }
 
     if args.format == "json":
         output = {
@@ -622,7 +620,7 @@ def update_citations(args) -> None:
         sys.exit(1)
 
     # Load project
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -726,7 +724,7 @@ def parse_pdfs(args) -> None:
         sys.exit(1)
 
     # Load project
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -824,7 +822,7 @@ def set_research_question(args) -> None:
         logger.error(f"Project directory {project_dir} does not exist")
         sys.exit(1)
 
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -845,7 +843,7 @@ def compute_relevance(args) -> None:
         logger.error(f"Project directory {project_dir} does not exist")
         sys.exit(1)
 
-    storage = JSONStorage(project_dir)
+    storage = open_storage(project_dir)
     project = storage.load_project()
 
     if not project:
@@ -879,8 +877,10 @@ def compute_relevance(args) -> None:
 
     try:
         scorer_kwargs = {}
-        if method == "llm" and args.model:
-            scorer_kwargs["model"] = args.model
+        if method == "llm":
+            scorer_kwargs["cache_dir"] = project_dir / ".llm_cache"
+            if args.model:
+                scorer_kwargs["model"] = args.model
         scorer = get_scorer(method, **scorer_kwargs)
     except ImportError as e:
         logger.error(str(e))
@@ -895,7 +895,10 @@ def compute_relevance(args) -> None:
             logger.info(f"Progress: {current}/{total}")
 
     # Score papers
-    results = scorer.score_papers(project.research_question, papers, progress)
+    try:
+        results = scorer.score_papers(project.research_question, papers, progress)
+    finally:
+        scorer.close()
 
     # Save scores
     updated = 0
@@ -927,6 +930,13 @@ def main():
         "--research-question", "-rq",
         help="Research question for relevance scoring"
     )
+    init_parser.add_argument(
+        "--storage",
+        choices=["json", "sqlite"],
+        default="json",
+        help="Paper storage: one JSON file per paper (default, Git-friendly) "
+        "or a single SQLite database (faster for very large projects)",
+    )
 
     # Add seed command
     seed_parser = subparsers.add_parser("add-seed", help="Add seed paper(s)")
@@ -938,6 +948,10 @@ def main():
     seed_parser.add_argument(
         "--no-grobid", action="store_true", help="Don't use GROBID for PDF parsing"
     )
+    seed_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Don't use the API response cache (responses are otherwise reused for up to 7 days)"
+    )
     seed_parser.add_argument(
         "--use-scholar", action="store_true",
         help="Enable Google Scholar API (disabled by default due to rate limiting)"
@@ -968,6 +982,16 @@ def main():
         action="store_true",
         help="Force iteration even if there are unreviewed papers (not recommended)",
     )
+    cache_group = snowball_parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--offline",
+        action="store_true",
+        help="Only use cached API responses (no network requests)",
+    )
+    cache_group.add_argument(
+        "--no-cache", action="store_true",
+        help="Don't use the API response cache (responses are otherwise reused for up to 7 days)"
+    )
     snowball_parser.add_argument(
         "--use-scholar", action="store_true",
         help="Enable Google Scholar API (disabled by default due to rate limiting)"
@@ -986,6 +1010,10 @@ def main():
     review_parser.add_argument("directory", help="Project directory")
     review_parser.add_argument("--s2-api-key", help="Semantic Scholar API key")
     review_parser.add_argument("--email", help="Email for API polite pools")
+    review_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Don't use the API response cache (responses are otherwise reused for up to 7 days)"
+    )
     review_parser.add_argument(
         "--use-scholar", action="store_true",
         help="Enable Google Scholar API (disabled by default due to rate limiting)"
@@ -0,0 +1,5 @@
+"""Export formats for review results."""
+
+# Buffer size for export files, so row-by-row writers hit the disk in large
+# chunks
+WRITE_BUFFER_SIZE = 1 << 20
@@ -1,33 +1,72 @@
 """BibTeX export functionality."""
 
 import re
-from typing import List
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
 from ..models import Paper, PaperStatus
+from . import WRITE_BUFFER_SIZE
 
 
 class BibTeXExporter:
     """Exports papers to BibTeX format."""
 
-    def export(self, papers: List[Paper], only_included: bool = True) -> str:
+    def export(self, papers: Iterable[Paper], only_included: bool = True) -> str:
         """Export papers to BibTeX format.
 
         Args:
-            papers: List of papers to export
+            papers: Papers to export
             only_included: Only export included papers
 
         Returns:
             BibTeX formatted string
         """
-        if only_included:
-            papers = [p for p in papers if p.status == PaperStatus.INCLUDED]
+        return "\n\n".join(self.iter_entries(papers, only_included))
 
-        entries = []
+    def write(self, papers: Iterable[Paper], output_path: Path, only_included: bool = True) -> int:
+        """Write papers to a BibTeX file one entry at a time.
+
+        Unlike export(), the whole document is never held in memory.
+
+        Args:
+            papers: Papers to export
+            output_path: Path to output .bib file
+            only_included: Only export included papers
+
+        Returns:
+            Number of entries written
+        """
+        with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            return self.write_to(papers, f, only_included)
+
+    def write_to(self, papers: Iterable[Paper], f: TextIO, only_included: bool = True) -> int:
+        """Write papers as BibTeX to an open text file, one entry at a time.
+
+        Args:
+            papers: Papers to export
+            f: Text file (or any object with a write method) to write to
+            only_included: Only export included papers
+
+        Returns:
+            Number of entries written
+        """
+        count = 0
+        for entry in self.iter_entries(papers, only_included):
+            if count:
+                f.write("\n\n")
+            f.write(entry)
+            count += 1
+        return count
+
+    def iter_entries(self, papers: Iterable[Paper], only_included: bool = True) -> Iterator[str]:
+        """Yield the BibTeX entry of each exported paper."""
+        # Statuses are stored as plain strings, so compare against the value
+        included = PaperStatus.INCLUDED.value
         for paper in papers:
+            if only_included and paper.status != included:
+                continue
             entry = self._create_bibtex_entry(paper)
             if entry:
-                entries.append(entry)
-
-        return "\n\n".join(entries)
+                yield entry
 
     def _create_bibtex_entry(self, paper: Paper) -> str:
         """Create a BibTeX entry for a paper."""
@@ -1,9 +1,21 @@
 """CSV export functionality."""
 
+import csv
 import pandas as pd
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from ..models import Paper, PaperStatus
+from . import WRITE_BUFFER_SIZE
+
+# Column order of exported CSV files
+BASE_COLUMNS = [
+    "Title", "Authors", "Year", "Venue", "DOI", "Status", "Source", "Iteration",
+    "Citations", "Notes",
+]
+EXTRA_COLUMNS = [
+    "Abstract", "Influential_Citations", "ArXiv_ID", "Semantic_Scholar_ID", "OpenAlex_ID",
+    "PMID", "Tags", "PDF_Path", "Review_Date",
+]
 
 
 class CSVExporter:
@@ -11,62 +23,66 @@ class CSVExporter:
 
     def export(
         self,
-        papers: List[Paper],
+        papers: Iterable[Paper],
         output_path: Path,
         only_included: bool = False,
         include_all_fields: bool = False
     ) -> None:
         """Export papers to CSV file.
 
+        Rows are written as papers are consumed, so papers may be any iterable
+        and the full table is never built in memory.
+
         Args:
-            papers: List of papers to export
+            papers: Papers to export
             output_path: Path to output CSV file
             only_included: Only export included papers
             include_all_fields: Include all metadata fields
         """
-        if only_included:
-            papers = [p for p in papers if p.status == PaperStatus.INCLUDED]
-
-        # Convert papers to dataframe
-        df = self._papers_to_dataframe(papers, include_all_fields)
-
-        # Export to CSV
-        df.to_csv(output_path, index=False, encoding='utf-8')
+        columns = BASE_COLUMNS + EXTRA_COLUMNS if include_all_fields else BASE_COLUMNS
+
+        with open(output_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            included = PaperStatus.INCLUDED.value
+            for paper in papers:
+                if only_included and paper.status != included:
+                    continue
+                writer.writerow(self._paper_to_row(paper, include_all_fields))
+
+    def _paper_to_row(self, paper: Paper, include_all: bool) -> dict:
+        """Convert a paper to a CSV row."""
+        row = {
+            "Title": paper.title,
+            "Authors": self._format_authors(paper),
+            "Year": paper.year,
+            "Venue": self._format_venue(paper),
+            "DOI": paper.doi,
+            "Status": paper.status,
+            "Source": paper.source,
+            "Iteration": paper.snowball_iteration,
+            "Citations": paper.citation_count,
+            "Notes": paper.notes,
+        }
+
+        if include_all:
+            row.update({
+                "Abstract": paper.abstract,
+                "Influential_Citations": paper.influential_citation_count,
+                "ArXiv_ID": paper.arxiv_id,
+                "Semantic_Scholar_ID": paper.semantic_scholar_id,
+                "OpenAlex_ID": paper.openalex_id,
+                "PMID": paper.pmid,
+                "Tags": ", ".join(paper.tags) if paper.tags else "",
+                "PDF_Path": paper.pdf_path,
+                "Review_Date": paper.review_date,
+            })
+
+        return row
 
     def _papers_to_dataframe(self, papers: List[Paper], include_all: bool) -> pd.DataFrame:
         """Convert papers to pandas DataFrame."""
-        data = []
-
-        for paper in papers:
-            row = {
-                "Title": paper.title,
-                "Authors": self._format_authors(paper),
-                "Year": paper.year,
-                "Venue": self._format_venue(paper),
-                "DOI": paper.doi,
-                "Status": paper.status.value if hasattr(paper.status, 'value') else paper.status,
-                "Source": paper.source.value if hasattr(paper.source, 'value') else paper.source,
-                "Iteration": paper.snowball_iteration,
-                "Citations": paper.citation_count,
-                "Notes": paper.notes,
-            }
-
-            if include_all:
-                row.update({
-                    "Abstract": paper.abstract,
-                    "Influential_Citations": paper.influential_citation_count,
-                    "ArXiv_ID": paper.arxiv_id,
-                    "Semantic_Scholar_ID": paper.semantic_scholar_id,
-                    "OpenAlex_ID": paper.openalex_id,
-                    "PMID": paper.pmid,
-                    "Tags": ", ".join(paper.tags) if paper.tags else "",
-                    "PDF_Path": paper.pdf_path,
-                    "Review_Date": paper.review_date,
-                })
-
-            data.append(row)
-
-        return pd.DataFrame(data)
+        return pd.DataFrame([self._paper_to_row(paper, include_all) for paper in papers])
 
     def _format_authors(self, paper: Paper) -> str:
         """Format authors as a string."""
@@ -24,7 +24,8 @@ class TikZExporter:
             TikZ/LaTeX code as a string
         """
         if only_included:
-            papers = [p for p in papers if p.status == PaperStatus.INCLUDED]
+            included = PaperStatus.INCLUDED.value
+            papers = [p for p in papers if p.status == included]
 
         if not papers:
             return ""
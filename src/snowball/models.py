@@ -1,9 +1,10 @@
 """Data models for the Snowball SLR tool."""
 
+import sys
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class PaperStatus(str, Enum):
@@ -92,8 +93,17 @@ class Paper(BaseModel):
     # Raw data from APIs
     raw_data: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        use_enum_values = True
+    @field_validator("references", "citations", "source_paper_ids")
+    @classmethod
+    def _intern_ids(cls, paper_ids: List[str]) -> List[str]:
+        """Share one string object per paper ID across loaded papers."""
+        return [sys.intern(paper_id) for paper_id in paper_ids]
+
+    model_config = ConfigDict(
+        use_enum_values=True,
+        # Keep status/source as plain strings after reassignment too
+        validate_assignment=True,
+    )
 
 
 class FilterCriteria(BaseModel):
@@ -148,5 +158,4 @@ class ReviewProject(BaseModel):
     # Iteration-level statistics for accountability
     iteration_stats: Dict[int, IterationStats] = Field(default_factory=dict)
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
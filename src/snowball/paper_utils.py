@@ -5,7 +5,7 @@ to avoid code duplication.
 """
 
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 from .models import Paper, PaperStatus, PaperSource
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,16 @@ SOURCE_ORDER: Dict[str, int] = {
     "forward": 2,
 }
 
+# Display color for each status in rich text
+STATUS_COLORS: Dict[str, str] = {
+    "included": "#3fb950",
+    "excluded": "#f85149",
+    "pending": "#d29922",
+}
+
+# Color for unknown statuses
+DEFAULT_STATUS_COLOR = "#c9d1d9"
+
 # Maximum authors to display before truncation
 MAX_AUTHORS_DISPLAY = 10
 
@@ -35,6 +45,10 @@ MAX_TITLE_LENGTH = 60
 def get_status_value(status: Union[PaperStatus, str]) -> str:
     """Get string value from status (handles both enum and string).
 
+    Paper.status is already a plain string (the model stores enum values),
+    so code iterating over papers reads it directly; this is for values that
+    may still be enums, such as arguments.
+
     Args:
         status: Paper status as enum or string
 
@@ -76,13 +90,13 @@ def filter_papers(
     result = papers
 
     if status:
-        result = [p for p in result if get_status_value(p.status) == status]
+        result = [p for p in result if p.status == status]
 
     if iteration is not None:
         result = [p for p in result if p.snowball_iteration == iteration]
 
     if source:
-        result = [p for p in result if get_source_value(p.source) == source]
+        result = [p for p in result if p.source == source]
 
     return result
 
@@ -115,62 +129,79 @@ def sort_papers(papers: List[Paper], sort_by: str, ascending: bool = True) -> Li
     return papers
 
 
-def get_sort_key(paper: Paper, column: str):
-    """Generate sort key for a paper based on column name.
+def _grobid_refs_key(paper: Paper):
+    grobid_refs = paper.raw_data.get("grobid_references", []) if paper.raw_data else []
+    if not grobid_refs:
+        return (1, 0)  # No refs goes to end
+    return (0, len(grobid_refs))
+
+
+# Sort key functions by column. Each returns a tuple where the first element
+# controls None/missing value ordering (1 puts None at the end), and the second
+# element is the actual value for comparison. Status and source are stored as
+# plain strings on Paper, so they are looked up directly.
+_SORT_KEYS: Dict[str, Callable[[Paper], tuple]] = {
+    "Status": lambda p: (0, STATUS_ORDER.get(p.status, 999)),
+    "Title": lambda p: (0, p.title.lower() if p.title else "zzz"),
+    "Year": lambda p: (1, 0) if p.year is None else (0, p.year),
+    "Cite": lambda p: (1, 0) if p.citation_count is None else (0, p.citation_count),
+    "Rel": lambda p: (1, 0) if p.relevance_score is None else (0, p.relevance_score),
+    "Refs": _grobid_refs_key,
+    "Source": lambda p: (0, SOURCE_ORDER.get(p.source, 999)),
+    "Iter": lambda p: (0, p.snowball_iteration),
+    "Obs": lambda p: (0, p.observation_count),
+}
+
+
+def _default_sort_key(paper: Paper):
+    # Fallback: sort by iteration, then status
+    return (0, (paper.snowball_iteration, paper.status))
 
-    Returns a tuple where the first element controls None/missing value ordering,
-    and the second element is the actual value for comparison.
+
+def make_sort_key(column: str) -> Callable[[Paper], tuple]:
+    """Get the sort key function for a column.
+
+    Resolve the column once and pass the result to sort(), instead of
+    dispatching on the column name for every paper.
 
     Args:
-        paper: Paper to generate sort key for
         column: Column name to sort by (Status, Title, Year, Cite, Source, Iter, Obs)
 
     Returns:
-        Tuple for sorting comparison
+        Function mapping a paper to its sort key tuple
     """
-    if column == "Status":
-        status_val = get_status_value(paper.status)
-        return (0, STATUS_ORDER.get(status_val, 999))
+    return _SORT_KEYS.get(column, _default_sort_key)
 
-    elif column == "Title":
-        return (0, paper.title.lower() if paper.title else "zzz")
 
-    elif column == "Year":
-        if paper.year is None:
-            return (1, 0)  # (1, ...) puts None at end
-        return (0, paper.year)
+def sort_key_uses_status(column: str) -> bool:
+    """Check whether sorting by a column depends on paper status.
 
-    elif column == "Cite":
-        if paper.citation_count is None:
-            return (1, 0)
-        return (0, paper.citation_count)
+    True for the Status column and for columns without a dedicated key,
+    which fall back to sorting by (iteration, status).
 
-    elif column == "Rel":
-        if paper.relevance_score is None:
-            return (1, 0)
-        return (0, paper.relevance_score)
+    Args:
+        column: Column name to sort by
 
-    elif column == "Refs":
-        # GROBID references count
-        grobid_refs = paper.raw_data.get("grobid_references", []) if paper.raw_data else []
-        if not grobid_refs:
-            return (1, 0)  # No refs goes to end
-        return (0, len(grobid_refs))
+    Returns:
+        True if a status change can move a paper within the sort order
+    """
+    return column == "Status" or column not in _SORT_KEYS
 
-    elif column == "Source":
-        source_val = get_source_value(paper.source)
-        return (0, SOURCE_ORDER.get(source_val, 999))
 
-    elif column == "Iter":
-        return (0, paper.snowball_iteration)
+def get_sort_key(paper: Paper, column: str):
+    """Generate sort key for a paper based on column name.
 
-    elif column == "Obs":
-        return (0, paper.observation_count)
+    Returns a tuple where the first element controls None/missing value ordering,
+    and the second element is the actual value for comparison.
 
-    else:
-        # Fallback: sort by iteration, then status
-        status_val = get_status_value(paper.status)
-        return (0, (paper.snowball_iteration, status_val))
+    Args:
+        paper: Paper to generate sort key for
+        column: Column name to sort by (Status, Title, Year, Cite, Source, Iter, Obs)
+
+    Returns:
+        Tuple for sorting comparison
+    """
+    return make_sort_key(column)(paper)
 
 
 def format_authors(authors: list, max_display: int = MAX_AUTHORS_DISPLAY) -> str:
@@ -464,8 +495,8 @@ def paper_to_dict(paper: Paper, include_abstract: bool = False) -> dict:
         "id": paper.id,
         "title": paper.title,
         "year": paper.year,
-        "status": get_status_value(paper.status),
-        "source": get_source_value(paper.source),
+        "status": paper.status,
+        "source": paper.source,
         "iteration": paper.snowball_iteration,
         "citations": paper.citation_count,
         "doi": paper.doi,
@@ -501,9 +532,9 @@ def format_paper_text(paper: Paper) -> str:
     lines.append(f"Title: {paper.title}")
     lines.append(f"{'=' * 80}")
     lines.append(f"ID:       {paper.id}")
-    lines.append(f"Status:   {get_status_value(paper.status)}")
+    lines.append(f"Status:   {paper.status}")
     lines.append(
-        f"Source:   {get_source_value(paper.source)} (iteration {paper.snowball_iteration})"
+        f"Source:   {paper.source} (iteration {paper.snowball_iteration})"
     )
     lines.append("")
 
@@ -550,63 +581,41 @@ def format_paper_rich(paper: Paper) -> str:
     Returns:
         Rich text formatted string
     """
-    lines = []
-    lines.append(f"[bold #58a6ff]{paper.title}[/bold #58a6ff]\n")
-
-    # Authors
-    if paper.authors:
-        lines.append(f"[bold #79c0ff]Authors:[/bold #79c0ff] {format_authors(paper.authors)}")
-
-    # Year and venue
-    year_venue = []
-    if paper.year:
-        year_venue.append(str(paper.year))
-    if paper.venue and paper.venue.name:
-        year_venue.append(paper.venue.name)
-    if year_venue:
-        lines.append(f"[bold #79c0ff]Published:[/bold #79c0ff] {' - '.join(year_venue)}")
-
-    # Identifiers
-    ids = []
-    if paper.doi:
-        ids.append(f"DOI: {paper.doi}")
-    if paper.arxiv_id:
-        ids.append(f"arXiv: {paper.arxiv_id}")
-    if ids:
-        lines.append(f"[bold #79c0ff]IDs:[/bold #79c0ff] {', '.join(ids)}")
+    # Sections are built as values (empty when missing) and joined once,
+    # since this runs for every highlighted row
+    authors = paper.authors
+    venue_name = paper.venue.name if paper.venue else None
+    published = " - ".join(part for part in (paper.year and str(paper.year), venue_name) if part)
+    ids = ", ".join(
+        part
+        for part in (
+            paper.doi and f"DOI: {paper.doi}",
+            paper.arxiv_id and f"arXiv: {paper.arxiv_id}",
+        )
+        if part
+    )
 
-    # Metrics
+    impact = None
     if paper.citation_count is not None:
-        cit_text = f"Citations: {paper.citation_count}"
+        impact = f"Citations: {paper.citation_count}"
         if paper.influential_citation_count:
-            cit_text += f" (influential: {paper.influential_citation_count})"
-        lines.append(f"[bold #79c0ff]Impact:[/bold #79c0ff] {cit_text}")
-
-    # Review info
-    status_colors = {
-        "included": "#3fb950",
-        "excluded": "#f85149",
-        "pending": "#d29922",
-    }
-    status_val = get_status_value(paper.status)
-    status_color = status_colors.get(status_val, "#c9d1d9")
-
-    lines.append(
-        f"[bold #79c0ff]Status:[/bold #79c0ff] [{status_color}]{status_val}[/{status_color}]"
-    )
-    lines.append(
-        f"[bold #79c0ff]Source:[/bold #79c0ff] {get_source_value(paper.source)} "
-        f"(iteration {paper.snowball_iteration})"
+            impact += f" (influential: {paper.influential_citation_count})"
+
+    status = paper.status
+    status_color = STATUS_COLORS.get(status, DEFAULT_STATUS_COLOR)
+    abstract = paper.abstract
+    notes = paper.notes
+
+    lines = (
+        f"[bold #58a6ff]{paper.title}[/bold #58a6ff]\n",
+        authors and f"[bold #79c0ff]Authors:[/bold #79c0ff] {format_authors(authors)}",
+        published and f"[bold #79c0ff]Published:[/bold #79c0ff] {published}",
+        ids and f"[bold #79c0ff]IDs:[/bold #79c0ff] {ids}",
+        impact and f"[bold #79c0ff]Impact:[/bold #79c0ff] {impact}",
+        f"[bold #79c0ff]Status:[/bold #79c0ff] [{status_color}]{status}[/{status_color}]",
+        f"[bold #79c0ff]Source:[/bold #79c0ff] {paper.source} "
+        f"(iteration {paper.snowball_iteration})",
+        abstract and f"\n[bold #79c0ff]Abstract:[/bold #79c0ff]\n{abstract}",
+        notes and f"\n[bold #79c0ff]Notes:[/bold #79c0ff]\n{notes}",
     )
-
-    # Abstract
-    if paper.abstract:
-        lines.append("\n[bold #79c0ff]Abstract:[/bold #79c0ff]")
-        lines.append(paper.abstract)
-
-    # Notes
-    if paper.notes:
-        lines.append("\n[bold #79c0ff]Notes:[/bold #79c0ff]")
-        lines.append(paper.notes)
-
-    return "\n".join(lines)
+    return "\n".join(line for line in lines if line)
@@ -2,12 +2,17 @@
 
 import re
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 import pypdfium2 as pdfium
 
 logger = logging.getLogger(__name__)
 
+# PDFium is not thread-safe: every call into pypdfium2, including closing
+# documents, must hold this lock.
+_PDFIUM_LOCK = threading.Lock()
+
 
 class PDFParseResult:
     """Result of PDF parsing."""
@@ -230,15 +235,19 @@ class PDFParser:
         result = PDFParseResult()
 
         try:
-            pdf = pdfium.PdfDocument(str(pdf_path))
-
             # Extract text from all pages
             full_text = []
-            for page_num in range(len(pdf)):
-                page = pdf[page_num]
-                textpage = page.get_textpage()
-                text = textpage.get_text_range()
-                full_text.append(text)
+            with _PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(str(pdf_path))
+                try:
+                    for page_num in range(len(pdf)):
+                        page = pdf[page_num]
+                        textpage = page.get_textpage()
+                        full_text.append(textpage.get_text_range())
+                        textpage.close()
+                        page.close()
+                finally:
+                    pdf.close()
 
             result.full_text = '\n'.join(full_text)
 
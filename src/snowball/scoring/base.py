@@ -29,6 +29,9 @@ class BaseScorer(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release resources held by the scorer, such as network connections."""
+
     @staticmethod
     def get_paper_text(paper: "Paper") -> str:
         """Get searchable text from paper (title + abstract).
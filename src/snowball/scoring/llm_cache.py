@@ -0,0 +1,82 @@
+"""Cache of LLM relevance scores."""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models import Paper
+
+logger = logging.getLogger(__name__)
+
+# Name of the cache file inside the cache directory
+CACHE_FILE = "scores.json"
+
+
+class ScoreCache:
+    """Stores LLM relevance scores keyed by model, question and paper text.
+
+    Scores live in memory and, when a cache directory is given, in a single
+    JSON file there, so re-scoring a project only sends papers whose title,
+    abstract or research question changed since the last run.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache file (memory only if None)
+        """
+        self.path: Optional[Path] = None
+        self._scores: Dict[str, float] = {}
+        self._dirty = False
+
+        if cache_dir is not None:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Keep cached scores out of version-controlled project directories
+            gitignore = cache_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("*\n")
+
+            self.path = cache_dir / CACHE_FILE
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._scores = json.load(f)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read LLM score cache: {e}")
+
+    @staticmethod
+    def make_key(model: str, research_question: str, paper: "Paper") -> str:
+        """Build a stable cache key for a paper's score."""
+        payload = json.dumps([model, research_question, paper.title, paper.abstract or ""])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[float]:
+        """Return the cached score for key, or None if missing."""
+        return self._scores.get(key)
+
+    def set(self, key: str, score: float) -> None:
+        """Store a score in memory; call save() to persist it."""
+        self._scores[key] = score
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write new scores to the cache file, if there is one."""
+        if self.path is None or not self._dirty:
+            return
+
+        # Write to a temporary file first so an interrupted run never leaves partial JSON
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._scores, f)
+            tmp_path.replace(self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write LLM score cache: {e}")
@@ -1,11 +1,18 @@
 """LLM-based relevance scoring using OpenAI API."""
 
-import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import List, Optional, Callable, Tuple, TYPE_CHECKING
 
+import httpx
+
+from ..apis.base import create_http_client
+from ..storage.json_storage import json_loads
 from .base import BaseScorer
+from .llm_cache import ScoreCache
 
 if TYPE_CHECKING:
     from ..models import Paper
@@ -15,6 +22,57 @@ logger = logging.getLogger(__name__)
 # Batch size as recommended by owner (issue #25)
 BATCH_SIZE = 20
 
+# Number of batches scored concurrently; each is a blocking API round-trip
+SCORE_WORKERS = 8
+
+# Default limit on prompt tokens per API call
+MAX_PROMPT_TOKENS = 8000
+
+# Abstracts are cut to this many characters in prompts to save tokens
+MAX_ABSTRACT_CHARS = 1000
+
+# API call timeout, as the OpenAI SDK default: completions of large batches or
+# from local endpoints can take minutes
+REQUEST_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+PROMPT_TEMPLATE = """You are assessing the relevance of academic papers to a research question.
+
+Research Question: {research_question}
+
+For each paper below, provide a relevance score from 0.0 to 1.0 where:
+- 0.0 = Completely irrelevant
+- 0.3 = Tangentially related
+- 0.5 = Somewhat relevant
+- 0.7 = Quite relevant
+- 1.0 = Highly relevant to the research question
+
+Papers to assess:
+{papers}
+
+Respond with ONLY a JSON array of numbers (the scores) in order, like: [0.7, 0.3, 0.9]
+No explanation needed, just the scores array."""
+
+_PROMPT_HEAD, _, _PROMPT_TAIL = PROMPT_TEMPLATE.partition("{papers}")
+
+
+def make_prompt_builder(research_question: str) -> Callable[[List[str]], str]:
+    """Specialize the prompt template for a research question.
+
+    The question is formatted in once, so each batch only joins its papers.
+
+    Args:
+        research_question: The research question to assess papers against
+
+    Returns:
+        Function building the full prompt from formatted paper entries
+    """
+    head = _PROMPT_HEAD.format(research_question=research_question)
+
+    def build(entries: List[str]) -> str:
+        return head + "\n".join(entries) + _PROMPT_TAIL
+
+    return build
+
 
 class LLMScorer(BaseScorer):
     """Score papers using LLM assessment via OpenAI API."""
@@ -24,6 +82,9 @@ class LLMScorer(BaseScorer):
         api_key: Optional[str] = None,
         model: str = "gpt-4o-mini",
         base_url: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        batch_size: int = BATCH_SIZE,
+        max_prompt_tokens: int = MAX_PROMPT_TOKENS,
     ):
         """Initialize LLM scorer.
 
@@ -31,11 +92,16 @@ class LLMScorer(BaseScorer):
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             model: Model to use for scoring (default: gpt-4o-mini for cost efficiency)
             base_url: Optional base URL for API (for OpenAI-compatible endpoints)
+            cache_dir: Directory for the on-disk score cache (memory only if None)
+            batch_size: Number of papers assessed per API call
+            max_prompt_tokens: Papers are packed so each prompt stays under
+                this many tokens (a single paper may exceed it)
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.model = model
         self.base_url = base_url
         self._client = None
+        self._client_lock = threading.Lock()
 
         if not self.api_key:
             raise ValueError(
@@ -43,128 +109,214 @@ class LLMScorer(BaseScorer):
                 "or pass api_key parameter."
             )
 
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self.max_prompt_tokens = max_prompt_tokens
+        self._token_counter: Optional[Callable[[str], int]] = None
+
+        self.cache = ScoreCache(cache_dir)
+
     @property
     def client(self):
         """Lazy load OpenAI client."""
         if self._client is None:
-            try:
-                from openai import OpenAI
-
-                kwargs = {"api_key": self.api_key}
-                if self.base_url:
-                    kwargs["base_url"] = self.base_url
-
-                self._client = OpenAI(**kwargs)
-            except ImportError:
-                raise ImportError(
-                    "openai package required for LLM scoring. "
-                    "Install with: pip install snowball-slr[llm]"
-                )
+            # Batches are scored from several threads
+            with self._client_lock:
+                if self._client is None:
+                    try:
+                        from openai import OpenAI
+
+                        # Persistent connections (HTTP/2 when available)
+                        # shared by all batches. The SDK would otherwise
+                        # adopt the pool's short API-client timeout.
+                        kwargs = {
+                            "api_key": self.api_key,
+                            "http_client": create_http_client(),
+                            "timeout": REQUEST_TIMEOUT,
+                        }
+                        if self.base_url:
+                            kwargs["base_url"] = self.base_url
+
+                        self._client = OpenAI(**kwargs)
+                    except ImportError:
+                        raise ImportError(
+                            "openai package required for LLM scoring. "
+                            "Install with: pip install snowball-slr[llm]"
+                        )
         return self._client
 
+    def close(self) -> None:
+        """Close the API client and its connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
     def score_papers(
         self,
         research_question: str,
         papers: List["Paper"],
         progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> List[Tuple["Paper", float]]:
-        """Score papers using LLM assessment in batches."""
+        """Score papers using LLM assessment in batches.
+
+        Papers scored before for the same model and research question are
+        answered from the cache. The rest are packed into batches of at most
+        batch_size papers and max_prompt_tokens tokens, and sent up to
+        SCORE_WORKERS batches at a time. Results keep the order of
+        ``papers``, and progress is reported as each batch completes.
+        """
         if not papers:
             return []
 
-        results = []
         total = len(papers)
+        keys = [self.cache.make_key(self.model, research_question, paper) for paper in papers]
+        scores = [self.cache.get(key) for key in keys]
+        missing = [index for index, score in enumerate(scores) if score is None]
+        done = total - len(missing)
+
+        if missing:
+            build_prompt = make_prompt_builder(research_question)
+            batches = [
+                [missing[position] for position in batch]
+                for batch in self._pack(build_prompt, [papers[index] for index in missing])
+            ]
+            with ThreadPoolExecutor(max_workers=min(SCORE_WORKERS, len(batches))) as executor:
+                futures = {
+                    executor.submit(
+                        self._score_batch, build_prompt, [papers[index] for index in batch]
+                    ): batch
+                    for batch in batches
+                }
+                for future in as_completed(futures):
+                    batch = futures[future]
+                    for index, score in zip(batch, future.result()):
+                        if score is not None:
+                            self.cache.set(keys[index], score)
+                        # Papers the LLM gave no usable score for count as irrelevant
+                        scores[index] = score if score is not None else 0.0
+                    done += len(batch)
+
+                    if progress_callback:
+                        progress_callback(done, total)
+
+            self.cache.save()
+        elif progress_callback:
+            progress_callback(total, total)
+
+        return list(zip(papers, scores))
+
+    def _count_tokens(self, text: str) -> int:
+        """Count the tokens of text for the model, or estimate them without tiktoken."""
+        if self._token_counter is None:
+            self._token_counter = self._load_token_counter()
+        return self._token_counter(text)
+
+    def _load_token_counter(self) -> Callable[[str], int]:
+        """Get a token counter for the model, importing tiktoken on first use."""
+        try:
+            import tiktoken
+        except ImportError:  # optional, token counts are estimated without it
+            # Roughly four characters per token for English text
+            return lambda text: len(text) // 4 + 1
 
-        # Process in batches of BATCH_SIZE
-        for batch_start in range(0, len(papers), BATCH_SIZE):
-            batch_end = min(batch_start + BATCH_SIZE, len(papers))
-            batch = papers[batch_start:batch_end]
-
-            batch_scores = self._score_batch(research_question, batch)
-            results.extend(batch_scores)
+        try:
+            encoding = tiktoken.encoding_for_model(self.model)
+        except KeyError:
+            # Unknown (e.g. non-OpenAI) model: use the current default encoding
+            encoding = tiktoken.get_encoding("o200k_base")
+        return lambda text: len(encoding.encode(text))
+
+    @staticmethod
+    def _paper_text(number: int, paper: "Paper") -> str:
+        """Format a paper as a numbered prompt entry."""
+        text = f"[{number}] Title: {paper.title}\n"
+        if paper.abstract:
+            abstract = (
+                paper.abstract[:MAX_ABSTRACT_CHARS] + "..."
+                if len(paper.abstract) > MAX_ABSTRACT_CHARS
+                else paper.abstract
+            )
+            text += f"Abstract: {abstract}\n"
+        return text
 
-            if progress_callback:
-                progress_callback(batch_end, total)
+    def _pack(
+        self, build_prompt: Callable[[List[str]], str], papers: List["Paper"]
+    ) -> List[List[int]]:
+        """Group papers into batches that fit batch_size and max_prompt_tokens.
 
-        return results
+        Returns:
+            Batches as lists of positions in ``papers``, in order
+        """
+        budget = self.max_prompt_tokens - self._count_tokens(build_prompt([]))
+
+        batches: List[List[int]] = []
+        batch: List[int] = []
+        used = 0
+        for position, paper in enumerate(papers):
+            # Entries are joined by a newline; number with the widest index
+            tokens = self._count_tokens(self._paper_text(self.batch_size, paper)) + 1
+            if batch and (len(batch) == self.batch_size or used + tokens > budget):
+                batches.append(batch)
+                batch, used = [], 0
+            batch.append(position)
+            used += tokens
+        if batch:
+            batches.append(batch)
+        return batches
 
     def _score_batch(
         self,
-        research_question: str,
+        build_prompt: Callable[[List[str]], str],
         papers: List["Paper"],
-    ) -> List[Tuple["Paper", float]]:
-        """Score a batch of papers with a single API call."""
-        # Build prompt with all papers in batch
-        papers_text = []
-        for i, paper in enumerate(papers):
-            text = f"[{i + 1}] Title: {paper.title}\n"
-            if paper.abstract:
-                # Truncate long abstracts to save tokens
-                abstract = (
-                    paper.abstract[:1000] + "..."
-                    if len(paper.abstract) > 1000
-                    else paper.abstract
-                )
-                text += f"Abstract: {abstract}\n"
-            papers_text.append(text)
-
-        prompt = f"""You are assessing the relevance of academic papers to a research question.
+    ) -> List[Optional[float]]:
+        """Score a batch of papers with a single API call.
 
-Research Question: {research_question}
-
-For each paper below, provide a relevance score from 0.0 to 1.0 where:
-- 0.0 = Completely irrelevant
-- 0.3 = Tangentially related
-- 0.5 = Somewhat relevant
-- 0.7 = Quite relevant
-- 1.0 = Highly relevant to the research question
-
-Papers to assess:
-{chr(10).join(papers_text)}
-
-Respond with ONLY a JSON array of numbers (the scores) in order, like: [0.7, 0.3, 0.9]
-No explanation needed, just the scores array."""
+        Returns:
+            One score per paper, None where the LLM gave no usable score
+        """
+        prompt = build_prompt([self._paper_text(i + 1, paper) for i, paper in enumerate(papers)])
 
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
+                # About 10 tokens per score, for batches larger than the default
+                max_tokens=max(200, 10 * len(papers)),
                 temperature=0.1,  # Low temperature for consistency
             )
 
-            # Parse response
-            content = response.choices[0].message.content.strip()
-
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                # Extract content between code fences
-                lines = content.split("\n")
-                content = "\n".join(
-                    line for line in lines if not line.startswith("```")
-                ).strip()
-
-            scores = json.loads(content)
+            # Parse the scores array, skipping markdown code fences or any
+            # other text around it
+            content = response.choices[0].message.content
+            start = content.find("[")
+            end = content.rfind("]")
+            if start == -1 or end < start:
+                raise ValueError("no JSON array found")
+            scores = json_loads(content[start:end + 1].encode("utf-8"))
 
             if len(scores) != len(papers):
                 logger.warning(
                     f"LLM returned {len(scores)} scores for {len(papers)} papers"
                 )
-                # Pad or truncate
-                while len(scores) < len(papers):
-                    scores.append(0.0)
-                scores = scores[: len(papers)]
-
-            # Clamp scores to valid range
-            scores = [max(0.0, min(1.0, float(s))) for s in scores]
-
-            return [(paper, score) for paper, score in zip(papers, scores)]
-
-        except json.JSONDecodeError as e:
+                # Scores can't be matched to papers; retry as two smaller batches
+                if len(papers) > 1:
+                    half = len(papers) // 2
+                    return (
+                        self._score_batch(build_prompt, papers[:half])
+                        + self._score_batch(build_prompt, papers[half:])
+                    )
+
+            # Clamp scores to valid range, padding or truncating to the batch
+            scores = [max(0.0, min(1.0, float(s))) for s in scores[: len(papers)]]
+            return scores + [None] * (len(papers) - len(scores))
+
+        except ValueError as e:
+            # Also raised by orjson and by non-numeric scores
             logger.error(f"Failed to parse LLM response as JSON: {e}")
             logger.debug(f"Response content: {content}")
-            return [(paper, 0.0) for paper in papers]
+            return [None] * len(papers)
         except Exception as e:
             logger.error(f"LLM scoring failed: {e}")
-            # Return 0.0 for all papers in batch on error
-            return [(paper, 0.0) for paper in papers]
+            # No scores for the batch on error
+            return [None] * len(papers)
@@ -2,6 +2,7 @@
 
 import logging
 import re
+from collections import OrderedDict
 from typing import List, Optional, Callable, Tuple, TYPE_CHECKING
 
 from .base import BaseScorer
@@ -26,6 +27,12 @@ STOPWORDS = {
     "under", "again", "further", "then", "once", "here", "there", "any",
 }
 
+# Number of papers whose analyzed terms are kept between scoring calls
+TOKEN_CACHE_SIZE = 10000
+
+# Words of two or more letters, for the word overlap fallback
+_WORD_RE = re.compile(r"\b[a-zA-Z]{2,}\b")
+
 
 class TFIDFScorer(BaseScorer):
     """Score papers using TF-IDF + Cosine similarity."""
@@ -33,12 +40,17 @@ class TFIDFScorer(BaseScorer):
     def __init__(self):
         """Initialize scorer, checking for sklearn availability."""
         self._use_sklearn = False
+        # Paper ID -> (text, analyzed terms), so papers seen in earlier
+        # calls are not tokenized again
+        self._token_cache: OrderedDict[str, Tuple[str, List[str]]] = OrderedDict()
         try:
             from sklearn.feature_extraction.text import TfidfVectorizer
-            from sklearn.metrics.pairwise import cosine_similarity
 
             self._vectorizer_class = TfidfVectorizer
-            self._cosine_similarity = cosine_similarity
+            # Unigrams and bigrams without English stop words
+            self._analyze = TfidfVectorizer(
+                stop_words="english", ngram_range=(1, 2)
+            ).build_analyzer()
             self._use_sklearn = True
             logger.debug("Using scikit-learn for TF-IDF scoring")
         except ImportError:
@@ -67,17 +79,13 @@ class TFIDFScorer(BaseScorer):
     ) -> List[Tuple["Paper", float]]:
         """Score using sklearn TF-IDF vectorizer."""
         # Prepare documents: RQ first, then all papers
-        documents = [research_question]
+        documents = [self._analyze(research_question)]
+        documents.extend(self._paper_terms(paper) for paper in papers)
 
-        for paper in papers:
-            text = self.get_paper_text(paper)
-            documents.append(text)
-
-        # Vectorize all documents
+        # Weight the pre-analyzed documents
         vectorizer = self._vectorizer_class(
-            stop_words="english",
+            analyzer=lambda terms: terms,
             max_features=5000,
-            ngram_range=(1, 2),  # Unigrams and bigrams
         )
 
         try:
@@ -87,20 +95,30 @@ class TFIDFScorer(BaseScorer):
             logger.warning("Empty vocabulary, returning zero scores")
             return [(paper, 0.0) for paper in papers]
 
-        # Calculate similarity between RQ (index 0) and each paper
-        rq_vector = tfidf_matrix[0:1]
-        paper_vectors = tfidf_matrix[1:]
+        # Rows are L2-normalized by the vectorizer, so multiplying the matrix
+        # by the dense RQ vector (row 0) gives the cosine similarity of every
+        # paper; this skips slicing the matrix and a sparse result
+        query = tfidf_matrix[0].toarray().ravel()
+        similarities = tfidf_matrix.dot(query)[1:]
 
-        similarities = self._cosine_similarity(rq_vector, paper_vectors).flatten()
+        if progress_callback:
+            progress_callback(len(papers), len(papers))
 
-        results = []
-        total = len(papers)
-        for i, (paper, score) in enumerate(zip(papers, similarities)):
-            results.append((paper, float(score)))
-            if progress_callback:
-                progress_callback(i + 1, total)
+        return list(zip(papers, similarities.tolist()))
 
-        return results
+    def _paper_terms(self, paper: "Paper") -> List[str]:
+        """Get a paper's analyzed terms, reusing them while its text is unchanged."""
+        text = self.get_paper_text(paper)
+        cached = self._token_cache.get(paper.id)
+        if cached is not None and cached[0] == text:
+            self._token_cache.move_to_end(paper.id)
+            return cached[1]
+
+        terms = self._analyze(text)
+        self._token_cache[paper.id] = (text, terms)
+        if len(self._token_cache) > TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+        return terms
 
     def _score_with_word_overlap(
         self,
@@ -142,6 +160,6 @@ class TFIDFScorer(BaseScorer):
             Set of unique lowercase words
         """
         # Extract words (alphanumeric sequences)
-        words = re.findall(r"\b[a-zA-Z]{2,}\b", text.lower())
+        words = _WORD_RE.findall(text.lower())
         # Remove stopwords
         return set(words) - STOPWORDS
@@ -1,16 +1,24 @@
 """Core snowballing logic."""
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Callable, List, Optional, Set, Tuple
 from .models import Paper, PaperSource, PaperStatus, ReviewProject, ExclusionType, IterationStats
 from .storage.json_storage import JSONStorage
 from .apis.aggregator import APIAggregator
-from .parsers.pdf_parser import PDFParser
+from .parsers.pdf_parser import PDFParser, PDFParseResult
 from .filters.filter_engine import FilterEngine
 
 logger = logging.getLogger(__name__)
 
+# Number of source papers whose references/citations are fetched concurrently
+FETCH_WORKERS = 4
+
+# Number of seed PDFs parsed concurrently
+PDF_PARSE_WORKERS = 8
+
 
 class SnowballEngine:
     """Core engine for systematic literature review using snowballing."""
@@ -47,7 +55,41 @@ class SnowballEngine:
 
         # Parse PDF
         parse_result = self.pdf_parser.parse(pdf_path)
+        return self._add_parsed_seed(pdf_path, parse_result, project)
+
+    def add_seeds_from_pdfs(
+        self, pdf_paths: List[Path], project: ReviewProject
+    ) -> List[Tuple[Path, Optional[Paper]]]:
+        """Add seed papers from several PDF files.
 
+        The PDFs are parsed concurrently so GROBID requests overlap (the
+        pypdfium2 fallback serializes its own PDFium calls); the resulting
+        papers are then saved one by one, so the project is only updated
+        from the calling thread.
+
+        Args:
+            pdf_paths: Paths to PDF files
+            project: Current review project
+
+        Returns:
+            (pdf_path, paper) pairs in input order, paper being None on failure
+        """
+        def parse(pdf_path: Path):
+            logger.info(f"Parsing seed PDF: {pdf_path}")
+            return self.pdf_parser.parse(pdf_path)
+
+        with ThreadPoolExecutor(max_workers=PDF_PARSE_WORKERS) as executor:
+            parse_results = list(executor.map(parse, pdf_paths))
+
+        return [
+            (pdf_path, self._add_parsed_seed(pdf_path, parse_result, project))
+            for pdf_path, parse_result in zip(pdf_paths, parse_results)
+        ]
+
+    def _add_parsed_seed(
+        self, pdf_path: Path, parse_result: PDFParseResult, project: ReviewProject
+    ) -> Optional[Paper]:
+        """Create and save a seed paper from a parsed PDF."""
         if not parse_result.title:
             logger.error("Could not extract title from PDF")
             return None
@@ -118,13 +160,22 @@ class SnowballEngine:
         return paper
 
     def run_snowball_iteration(
-        self, project: ReviewProject, direction: str = "both"
+        self,
+        project: ReviewProject,
+        direction: str = "both",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> dict:
         """Run one iteration of snowballing.
 
+        The project is updated in place (current iteration and iteration
+        stats) and saved, so callers can keep using the same object.
+
         Args:
             project: Current review project
             direction: Snowballing direction - "backward", "forward", or "both"
+            progress_callback: Optional callback(current, total), called as the
+                related papers of each source paper are fetched. It may be
+                called from worker threads.
 
         Returns:
             Statistics about the iteration
@@ -141,11 +192,13 @@ class SnowballEngine:
                 self.storage.load_paper(paper_id)
                 for paper_id in project.seed_paper_ids
             ]
-            source_papers = [p for p in all_seeds if p.status != PaperStatus.EXCLUDED]
+            excluded = PaperStatus.EXCLUDED.value
+            source_papers = [p for p in all_seeds if p.status != excluded]
         else:
             # Get papers from previous iteration that were included
             all_papers = self.storage.get_papers_by_iteration(current_iter)
-            source_papers = [p for p in all_papers if p.status == PaperStatus.INCLUDED]
+            included = PaperStatus.INCLUDED.value
+            source_papers = [p for p in all_papers if p.status == included]
 
         if not source_papers:
             logger.warning(f"No source papers for iteration {next_iter}")
@@ -163,75 +216,85 @@ class SnowballEngine:
         discovered_papers = []
         seen_identifiers: Set[str] = set()
 
+        # Identifiers of papers discovered during this iteration. The same paper is
+        # often reached from several source papers; repeat hits are skipped without
+        # scanning storage for fuzzy duplicates, since these papers aren't saved yet.
+        discovered_identifiers: Set[str] = set()
+
         # Load existing papers to avoid duplicates
         existing_papers = self.storage.load_all_papers()
         for p in existing_papers:
-            if p.doi:
-                seen_identifiers.add(f"doi:{p.doi.lower()}")
-            if p.title:
-                seen_identifiers.add(f"title:{p.title.lower()}")
+            self._mark_seen(p, seen_identifiers)
 
         backward_count = 0
         forward_count = 0
         merged_papers = []  # Track papers that were merged with existing ones
 
+        # Fetch references/citations of all source papers concurrently (network-bound),
+        # then process them in order since deduplication is stateful
+        related = self._fetch_related_papers(source_papers, direction, progress_callback)
+
         # Process each source paper
-        for source_paper in source_papers:
+        for source_paper, (references, citations) in zip(source_papers, related):
             logger.info(f"Processing: {source_paper.title}")
 
             # Backward snowballing (references)
-            if direction in ("backward", "both"):
-                try:
-                    references = self._get_references_for_paper(source_paper)
-                    for ref_paper in references:
-                        if self._is_new_paper(ref_paper, seen_identifiers):
-                            # Check for fuzzy duplicates even if not exact match
-                            existing = self._find_and_merge_duplicate(
-                                ref_paper, source_paper.id, next_iter
-                            )
-                            if existing:
-                                merged_papers.append(existing)
-                            else:
-                                ref_paper.source = PaperSource.BACKWARD
-                                ref_paper.source_paper_ids = [source_paper.id]
-                                ref_paper.snowball_iteration = next_iter
-                                discovered_papers.append(ref_paper)
-                                self._mark_seen(ref_paper, seen_identifiers)
-                                backward_count += 1
+            try:
+                for ref_paper in references:
+                    if self._is_new_paper(ref_paper, seen_identifiers):
+                        # Check for fuzzy duplicates even if not exact match
+                        existing = self._find_and_merge_duplicate(
+                            ref_paper, source_paper.id, next_iter
+                        )
+                        if existing:
+                            merged_papers.append(existing)
                         else:
-                            # Exact duplicate from previous iteration - just merge metadata
-                            existing = self._find_and_merge_duplicate(ref_paper)
-                            if existing:
-                                merged_papers.append(existing)
-                except Exception as e:
-                    logger.error(f"Error getting references: {e}")
+                            ref_paper.source = PaperSource.BACKWARD
+                            ref_paper.source_paper_ids = [source_paper.id]
+                            ref_paper.snowball_iteration = next_iter
+                            discovered_papers.append(ref_paper)
+                            self._mark_seen(ref_paper, seen_identifiers)
+                            self._mark_seen(ref_paper, discovered_identifiers)
+                            backward_count += 1
+                    elif not self._is_new_paper(ref_paper, discovered_identifiers):
+                        # Already discovered from another source paper in this iteration
+                        continue
+                    else:
+                        # Exact duplicate from previous iteration - just merge metadata
+                        existing = self._find_and_merge_duplicate(ref_paper)
+                        if existing:
+                            merged_papers.append(existing)
+            except Exception as e:
+                logger.error(f"Error processing references: {e}")
 
             # Forward snowballing (citations)
-            if direction in ("forward", "both"):
-                try:
-                    citations = self.api.get_citations(source_paper)
-                    for cit_paper in citations:
-                        if self._is_new_paper(cit_paper, seen_identifiers):
-                            # Check for fuzzy duplicates even if not exact match
-                            existing = self._find_and_merge_duplicate(
-                                cit_paper, source_paper.id, next_iter
-                            )
-                            if existing:
-                                merged_papers.append(existing)
-                            else:
-                                cit_paper.source = PaperSource.FORWARD
-                                cit_paper.source_paper_ids = [source_paper.id]
-                                cit_paper.snowball_iteration = next_iter
-                                discovered_papers.append(cit_paper)
-                                self._mark_seen(cit_paper, seen_identifiers)
-                                forward_count += 1
+            try:
+                for cit_paper in citations:
+                    if self._is_new_paper(cit_paper, seen_identifiers):
+                        # Check for fuzzy duplicates even if not exact match
+                        existing = self._find_and_merge_duplicate(
+                            cit_paper, source_paper.id, next_iter
+                        )
+                        if existing:
+                            merged_papers.append(existing)
                         else:
-                            # Exact duplicate from previous iteration - just merge metadata
-                            existing = self._find_and_merge_duplicate(cit_paper)
-                            if existing:
-                                merged_papers.append(existing)
-                except Exception as e:
-                    logger.error(f"Error getting citations: {e}")
+                            cit_paper.source = PaperSource.FORWARD
+                            cit_paper.source_paper_ids = [source_paper.id]
+                            cit_paper.snowball_iteration = next_iter
+                            discovered_papers.append(cit_paper)
+                            self._mark_seen(cit_paper, seen_identifiers)
+                            self._mark_seen(cit_paper, discovered_identifiers)
+                            forward_count += 1
+                    elif not self._is_new_paper(cit_paper, discovered_identifiers):
+                        # Already discovered from another source paper in this iteration
+                        continue
+                    else:
+                        # Exact duplicate from previous iteration - just merge metadata
+                        existing = self._find_and_merge_duplicate(cit_paper)
+                        if existing:
+                            merged_papers.append(existing)
+            except Exception as e:
+                logger.error(f"Error processing citations: {e}")
 
         logger.info(f"Discovered {len(discovered_papers)} new papers, merged {len(merged_papers)} duplicates")
         logger.info(f"  Backward: {backward_count}, Forward: {forward_count}")
@@ -280,6 +343,60 @@ class SnowballEngine:
             "merged_papers": merged_papers,
         }
 
+    def _fetch_related_papers(
+        self,
+        source_papers: List[Paper],
+        direction: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Tuple[List[Paper], List[Paper]]]:
+        """Fetch references and citations for each source paper.
+
+        Requests for different source papers run in a thread pool so their
+        network latency overlaps. Each API client spaces its own requests with
+        a shared RateLimiter, so the pool never exceeds the configured rate.
+
+        Args:
+            source_papers: Papers to snowball from
+            direction: Snowballing direction - "backward", "forward", or "both"
+            progress_callback: Optional callback(current, total) for progress updates
+
+        Returns:
+            List of (references, citations) tuples, in the order of source_papers
+        """
+        total = len(source_papers)
+        done = 0
+        done_lock = threading.Lock()
+
+        def fetch(paper: Paper) -> Tuple[List[Paper], List[Paper]]:
+            references: List[Paper] = []
+            citations: List[Paper] = []
+
+            if direction in ("backward", "both"):
+                try:
+                    references = self._get_references_for_paper(paper)
+                except Exception as e:
+                    logger.error(f"Error getting references: {e}")
+
+            if direction in ("forward", "both"):
+                try:
+                    citations = self.api.get_citations(paper)
+                except Exception as e:
+                    logger.error(f"Error getting citations: {e}")
+
+            if progress_callback:
+                nonlocal done
+                with done_lock:
+                    done += 1
+                    progress_callback(done, total)
+
+            return references, citations
+
+        if len(source_papers) <= 1:
+            return [fetch(paper) for paper in source_papers]
+
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            return list(executor.map(fetch, source_papers))
+
     def _get_references_for_paper(self, paper: Paper) -> List[Paper]:
         """Get references for a paper, preferring GROBID-extracted data over API.
 
@@ -340,15 +457,27 @@ class SnowballEngine:
         logger.info("No GROBID references, falling back to API")
         return self.api.get_references(paper)
 
-    def _is_new_paper(self, paper: Paper, seen_identifiers: Set[str]) -> bool:
-        """Check if a paper is new (not already seen)."""
+    @staticmethod
+    def _paper_identifiers(paper: Paper) -> List[str]:
+        """Get the normalized identifiers a paper can be recognized by."""
+        identifiers = []
         if paper.doi:
-            if f"doi:{paper.doi.lower()}" in seen_identifiers:
-                return False
+            doi = paper.doi.strip().lower()
+            for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+                if doi.startswith(prefix):
+                    doi = doi[len(prefix):]
+            identifiers.append(f"doi:{doi}")
+        if paper.semantic_scholar_id:
+            identifiers.append(f"s2:{paper.semantic_scholar_id}")
+        if paper.arxiv_id:
+            identifiers.append(f"arxiv:{paper.arxiv_id.strip().lower()}")
         if paper.title:
-            if f"title:{paper.title.lower()}" in seen_identifiers:
-                return False
-        return True
+            identifiers.append(f"title:{paper.title.lower()}")
+        return identifiers
+
+    def _is_new_paper(self, paper: Paper, seen_identifiers: Set[str]) -> bool:
+        """Check if a paper is new (not already seen)."""
+        return not any(i in seen_identifiers for i in self._paper_identifiers(paper))
 
     def _find_and_merge_duplicate(
         self, paper: Paper, source_paper_id: Optional[str] = None, current_iteration: Optional[int] = None
@@ -401,10 +530,7 @@ class SnowballEngine:
 
     def _mark_seen(self, paper: Paper, seen_identifiers: Set[str]) -> None:
         """Mark a paper as seen."""
-        if paper.doi:
-            seen_identifiers.add(f"doi:{paper.doi.lower()}")
-        if paper.title:
-            seen_identifiers.add(f"title:{paper.title.lower()}")
+        seen_identifiers.update(self._paper_identifiers(paper))
 
     def get_papers_for_review(self, iteration: Optional[int] = None) -> List[Paper]:
         """Get papers that need review.
@@ -417,7 +543,8 @@ class SnowballEngine:
         """
         if iteration is not None:
             papers = self.storage.get_papers_by_iteration(iteration)
-            return [p for p in papers if p.status == PaperStatus.PENDING]
+            pending = PaperStatus.PENDING.value
+            return [p for p in papers if p.status == pending]
         else:
             return self.storage.get_papers_by_status(PaperStatus.PENDING)
 
@@ -516,11 +643,11 @@ class SnowballEngine:
         if project.current_iteration == 0:
             return len(project.seed_paper_ids) > 0
         else:
-            included_papers = [
-                p for p in self.storage.get_papers_by_iteration(project.current_iteration)
-                if p.status == PaperStatus.INCLUDED
-            ]
-            return len(included_papers) > 0
+            included = PaperStatus.INCLUDED.value
+            return any(
+                p.status == included
+                for p in self.storage.get_papers_by_iteration(project.current_iteration)
+            )
 
     def get_unreviewed_papers(self, project: ReviewProject) -> List[Paper]:
         """Get papers that haven't been reviewed yet.
@@ -532,10 +659,8 @@ class SnowballEngine:
             List of papers with pending status
         """
         all_papers = self.storage.load_all_papers()
-        return [
-            p for p in all_papers
-            if p.status == PaperStatus.PENDING
-        ]
+        pending = PaperStatus.PENDING.value
+        return [p for p in all_papers if p.status == pending]
 
     def can_start_iteration(self, project: ReviewProject) -> tuple[bool, str]:
         """Check if a new snowball iteration can be started.
@@ -0,0 +1,33 @@
+"""Storage backends for papers and project data."""
+
+from pathlib import Path
+from typing import Optional
+
+from .json_storage import JSONStorage
+from .sqlite_storage import SQLiteStorage
+
+__all__ = ["JSONStorage", "SQLiteStorage", "open_storage"]
+
+
+def open_storage(project_dir: Path, backend: Optional[str] = None) -> JSONStorage:
+    """Open the storage of a project directory.
+
+    Args:
+        project_dir: Project directory
+        backend: "json" or "sqlite"; detected from the directory contents if None
+
+    Returns:
+        Storage instance
+
+    Raises:
+        ValueError: If backend is unknown
+    """
+    if backend is None:
+        backend = "sqlite" if SQLiteStorage.exists_in(project_dir) else "json"
+
+    if backend == "json":
+        return JSONStorage(project_dir)
+    elif backend == "sqlite":
+        return SQLiteStorage(project_dir)
+    else:
+        raise ValueError(f"Unknown storage backend: {backend}. Use 'json' or 'sqlite'")
@@ -1,16 +1,100 @@
 """JSON-based storage for papers and project data."""
 
+import heapq
 import json
 import uuid
 import threading
 import queue
 import atexit
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict
-from ..models import Paper, ReviewProject, PaperStatus
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Dict, Set, Tuple, Union
+from pydantic import BaseModel
+from ..models import Paper, ReviewProject, PaperStatus, FilterCriteria
 from ..paper_utils import papers_are_duplicates
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib
+    orjson = None
+
+# Number of threads used to read paper files in parallel on cold load
+LOAD_WORKERS = 16
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize JSON to UTF-8 bytes, using orjson when it is installed.
+
+    Non-ASCII characters are escaped, as the stdlib encoder does by default,
+    so existing files keep their bytes when they are saved again. Both
+    backends write the same bytes, except for floats in exponent notation
+    (below 1e-4 or from 1e16), e.g. 1e20 with orjson and 1e+20 without;
+    the values read back are the same.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        data = orjson.dumps(obj, option=option, default=str)
+        # orjson cannot escape non-ASCII text; leave those objects to the stdlib
+        if data.isascii():
+            return data
+    if indent:
+        text = json.dumps(obj, indent=2, default=str)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), default=str)
+    return text.encode("utf-8")
+
+
+def model_dumps(model: BaseModel, indent: bool = False) -> bytes:
+    """Serialize a model to UTF-8 JSON bytes, in the json_dumps format.
+
+    Without orjson, pydantic-core's compiled serializer writes the JSON
+    directly instead of building a dict for the stdlib encoder. Its bytes
+    match json_dumps except for small floats, which it writes without an
+    exponent (0.00001 rather than 1e-05); the values read back are the same.
+    """
+    if orjson is not None:
+        return json_dumps(model.model_dump(mode='json'), indent=indent)
+    data = model.model_dump_json(indent=2 if indent else None).encode("utf-8")
+    # pydantic-core cannot escape non-ASCII text either
+    if data.isascii():
+        return data
+    return json_dumps(model.model_dump(mode='json'), indent=indent)
+
+
+def _read_json(path: Path) -> Any:
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+
+def _write_json_object(path: Path, items: Iterable[Tuple[str, Any]]) -> None:
+    """Write key/value pairs as an indented JSON object, one entry at a time.
+
+    The output matches json_dumps(dict(items), indent=True), without holding
+    the whole object or its encoding in memory.
+    """
+    with open(path, 'wb') as f:
+        separator = b"{\n"
+        for key, value in items:
+            # Encoded strings never contain raw newlines, so this only
+            # indents the value's structure one level deeper
+            value_bytes = json_dumps(value, indent=True).replace(b"\n", b"\n  ")
+            f.write(separator + b"  " + json_dumps(key) + b": " + value_bytes)
+            separator = b",\n"
+        f.write(b"{}" if separator == b"{\n" else b"\n}")
+
+
+def _write_model(path: Path, model: BaseModel) -> None:
+    with open(path, 'wb') as f:
+        f.write(model_dumps(model, indent=True))
+
 
 class JSONStorage:
     """Handles persistence of papers and project metadata to JSON files.
@@ -20,6 +104,9 @@ class JSONStorage:
     - Writes update cache immediately, disk I/O happens in background thread
     """
 
+    # Whether papers are kept as one JSON file each under papers/
+    USES_PAPER_FILES = True
+
     def __init__(self, project_dir: Path):
         """Initialize storage in the given directory.
 
@@ -32,13 +119,29 @@ class JSONStorage:
         self.project_file = self.project_dir / "project.json"
         self.papers_file = self.project_dir / "papers.json"
         self.papers_dir = self.project_dir / "papers"
-        self.papers_dir.mkdir(exist_ok=True)
+        if self.USES_PAPER_FILES:
+            self.papers_dir.mkdir(exist_ok=True)
 
         # In-memory cache for papers (paper_id -> Paper)
         self._papers_cache: Optional[Dict[str, Paper]] = None
 
-        # Write-behind queue and thread
+        # Aggregated statistics, kept up to date incrementally on save.
+        # _stats_keys remembers the (status, iteration, source) each paper was
+        # counted under, since saved papers are usually mutated in place.
+        self._stats_cache: Optional[Dict] = None
+        self._stats_keys: Dict[str, Tuple[str, str, str]] = {}
+
+        # Number of saves per paper, and a counter bumped on any change, so
+        # views derived from the papers can tell when they are stale
+        self._revisions: Dict[str, int] = {}
+        self._version = 0
+
+        # Write-behind queue and thread. The queue carries paper IDs; the
+        # latest version of each paper waits in _pending_writes, so repeated
+        # saves of a paper before it reaches disk are written only once.
         self._write_queue: queue.Queue = queue.Queue()
+        self._pending_writes: Dict[str, Paper] = {}
+        self._pending_lock = threading.Lock()
         self._writer_thread: Optional[threading.Thread] = None
         self._shutdown_flag = threading.Event()
         self._start_writer_thread()
@@ -56,8 +159,11 @@ class JSONStorage:
         while not self._shutdown_flag.is_set():
             try:
                 # Wait for items with timeout to check shutdown flag periodically
-                paper = self._write_queue.get(timeout=0.1)
-                self._write_paper_to_disk(paper)
+                paper_id = self._write_queue.get(timeout=0.1)
+                with self._pending_lock:
+                    paper = self._pending_writes.pop(paper_id, None)
+                if paper is not None:
+                    self._write_paper_to_disk(paper)
                 self._write_queue.task_done()
             except queue.Empty:
                 continue
@@ -65,8 +171,7 @@ class JSONStorage:
     def _write_paper_to_disk(self, paper: Paper) -> None:
         """Actually write a paper to disk (called from background thread)."""
         paper_file = self.papers_dir / f"{paper.id}.json"
-        with open(paper_file, 'w') as f:
-            json.dump(paper.model_dump(mode='json'), f, indent=2, default=str)
+        _write_model(paper_file, paper)
 
     def flush(self) -> None:
         """Wait for all pending writes to complete.
@@ -85,17 +190,14 @@ class JSONStorage:
     def save_project(self, project: ReviewProject) -> None:
         """Save project metadata."""
         project.updated_at = datetime.now()
-        with open(self.project_file, 'w') as f:
-            json.dump(project.model_dump(mode='json'), f, indent=2, default=str)
+        _write_model(self.project_file, project)
 
     def load_project(self) -> Optional[ReviewProject]:
         """Load project metadata."""
         if not self.project_file.exists():
             return None
 
-        with open(self.project_file, 'r') as f:
-            data = json.load(f)
-            return ReviewProject.model_validate(data)
+        return ReviewProject.model_validate(_read_json(self.project_file))
 
     def save_paper(self, paper: Paper) -> None:
         """Save a single paper using write-behind caching.
@@ -107,9 +209,19 @@ class JSONStorage:
         if self._papers_cache is None:
             self._papers_cache = {}
         self._papers_cache[paper.id] = paper
+        self._revisions[paper.id] = self._revisions.get(paper.id, 0) + 1
+        self._version += 1
+
+        # Keep cached statistics in sync without rescanning
+        if self._stats_cache is not None:
+            self._update_stats_for(paper)
 
-        # Queue disk write for background thread
-        self._write_queue.put(paper)
+        # Queue disk write for background thread, unless one is already pending
+        with self._pending_lock:
+            already_queued = paper.id in self._pending_writes
+            self._pending_writes[paper.id] = paper
+        if not already_queued:
+            self._write_queue.put(paper.id)
 
     def save_papers(self, papers: List[Paper]) -> None:
         """Save multiple papers."""
@@ -130,20 +242,22 @@ class JSONStorage:
             papers_by_id[paper.id] = paper
 
         # Save index with key metadata for quick access
-        index = {
-            paper_id: {
+        index = (
+            (paper_id, {
                 "title": paper.title,
                 "year": paper.year,
                 "status": paper.status,
                 "source": paper.source,
                 "doi": paper.doi,
                 "citation_count": paper.citation_count,
-            }
+            })
             for paper_id, paper in papers_by_id.items()
-        }
+        )
+
+        _write_json_object(self.papers_file, index)
 
-        with open(self.papers_file, 'w') as f:
-            json.dump(index, f, indent=2)
+    # Byte patterns that only occur in data _migrate_paper_data may rewrite
+    MIGRATION_MARKERS = (b'"maybe"',)
 
     def _migrate_paper_data(self, data: dict) -> dict:
         """Apply migrations to paper data before validation.
@@ -155,6 +269,21 @@ class JSONStorage:
             data["status"] = "pending"
         return data
 
+    def _paper_from_json(self, raw: Union[bytes, str]) -> Paper:
+        """Validate a paper from raw JSON.
+
+        Pydantic parses the JSON directly, without building an intermediate
+        dict, unless the data may need a migration.
+        """
+        raw_bytes = raw.encode("utf-8") if isinstance(raw, str) else raw
+        if any(marker in raw_bytes for marker in self.MIGRATION_MARKERS):
+            return Paper.model_validate(self._migrate_paper_data(json_loads(raw_bytes)))
+        return Paper.model_validate_json(raw_bytes)
+
+    def _load_paper_file(self, paper_file: Path) -> Paper:
+        """Read, migrate and validate a single paper file."""
+        return self._paper_from_json(paper_file.read_bytes())
+
     def load_paper(self, paper_id: str) -> Optional[Paper]:
         """Load a single paper by ID."""
         # Check cache first
@@ -165,10 +294,7 @@ class JSONStorage:
         if not paper_file.exists():
             return None
 
-        with open(paper_file, 'r') as f:
-            data = json.load(f)
-            data = self._migrate_paper_data(data)
-            paper = Paper.model_validate(data)
+        paper = self._load_paper_file(paper_file)
 
         # Update cache if it exists
         if self._papers_cache is not None:
@@ -180,25 +306,176 @@ class JSONStorage:
         """Load all papers from individual files.
 
         Uses in-memory cache for performance. Papers are loaded from disk
-        only on first call, then served from cache.
+        only on first call, then served from cache. The cold load reads files
+        in a thread pool so per-file open/read latency overlaps.
         """
         # Return cached papers if available
         if self._papers_cache is not None:
             return list(self._papers_cache.values())
 
         # Load from disk and populate cache
-        self._papers_cache = {}
-        for paper_file in self.papers_dir.glob("*.json"):
-            with open(paper_file, 'r') as f:
-                data = json.load(f)
-                data = self._migrate_paper_data(data)
-                paper = Paper.model_validate(data)
-                self._papers_cache[paper.id] = paper
+        paper_files = list(self.papers_dir.glob("*.json"))
+        if len(paper_files) > 1:
+            with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+                papers = list(executor.map(self._load_paper_file, paper_files))
+        else:
+            papers = [self._load_paper_file(f) for f in paper_files]
+
+        self._papers_cache = {paper.id: paper for paper in papers}
 
         return list(self._papers_cache.values())
 
+    def iter_papers(self, status_in: Optional[Iterable[PaperStatus]] = None) -> Iterator[Paper]:
+        """Yield papers one at a time instead of building a list of them.
+
+        Papers come from the in-memory cache when it is loaded. Otherwise each
+        file is read and validated as the iterator is consumed, and the cache
+        is left cold.
+
+        Args:
+            status_in: Statuses to keep (all if None)
+
+        Yields:
+            Matching papers, in storage order
+        """
+        statuses = None
+        if status_in is not None:
+            statuses = {s.value if hasattr(s, 'value') else s for s in status_in}
+
+        if self._papers_cache is not None:
+            # Snapshot, so papers saved while iterating don't break the loop
+            papers: Iterable[Paper] = tuple(self._papers_cache.values())
+        else:
+            papers = map(self._load_paper_file, self.papers_dir.glob("*.json"))
+
+        for paper in papers:
+            if statuses is None or paper.status in statuses:
+                yield paper
+
+    def load_papers_window(
+        self,
+        sort_key: Callable[[Paper], Any],
+        offset: int,
+        limit: int,
+        reverse: bool = False,
+        status_in: Optional[Iterable[PaperStatus]] = None,
+        predicate: Optional[Callable[[Paper], bool]] = None,
+    ) -> List[Paper]:
+        """Load one window of papers in sorted order.
+
+        Papers are streamed and only the first offset + limit in sort order
+        are kept, in a heap, so a window near the top never sorts or holds
+        the whole corpus. Equal keys keep storage order, as with a stable
+        sort(key=sort_key, reverse=reverse), so consecutive windows line up.
+
+        Args:
+            sort_key: Key function to sort papers by
+            offset: Number of leading papers to skip
+            limit: Maximum number of papers to return
+            reverse: Sort in descending order
+            status_in: Statuses to keep (all if None)
+            predicate: Optional extra filter applied to each paper
+
+        Returns:
+            Papers at positions offset to offset + limit of the sorted order
+
+        Raises:
+            ValueError: If offset or limit is negative
+        """
+        if offset < 0 or limit < 0:
+            raise ValueError(f"offset and limit must be non-negative, got {offset} and {limit}")
+
+        papers: Iterable[Paper] = self.iter_papers(status_in=status_in)
+        if predicate is not None:
+            papers = filter(predicate, papers)
+
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(offset + limit, papers, key=sort_key)[offset:]
+
+    def load_papers(
+        self,
+        filter_criteria: Optional[FilterCriteria] = None,
+        status_in: Optional[Iterable[PaperStatus]] = None,
+    ) -> List[Paper]:
+        """Load only the papers matching the given predicates.
+
+        Status, year and citation bounds of filter_criteria are checked on the
+        raw JSON before validation, so on a cold cache non-matching papers are
+        never turned into Paper objects. Papers with unknown year or citation
+        counts pass, as in FilterEngine. Keyword and venue criteria are not
+        applied here.
+
+        Args:
+            filter_criteria: Year and citation bounds to apply
+            status_in: Statuses to keep (all if None)
+
+        Returns:
+            Matching papers
+        """
+        statuses = None
+        if status_in is not None:
+            statuses = {s.value if hasattr(s, 'value') else s for s in status_in}
+
+        if self._papers_cache is not None:
+            return [
+                p for p in self._papers_cache.values()
+                if self._matches(
+                    p.status, p.year, p.citation_count, p.influential_citation_count,
+                    filter_criteria, statuses,
+                )
+            ]
+
+        def load_if_matching(paper_file: Path) -> Optional[Paper]:
+            data = self._migrate_paper_data(_read_json(paper_file))
+            if not self._matches(
+                data.get("status"), data.get("year"), data.get("citation_count"),
+                data.get("influential_citation_count"), filter_criteria, statuses,
+            ):
+                return None
+            return Paper.model_validate(data)
+
+        paper_files = list(self.papers_dir.glob("*.json"))
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+            papers = list(executor.map(load_if_matching, paper_files))
+
+        return [p for p in papers if p is not None]
+
+    @staticmethod
+    def _matches(
+        status: Any,
+        year: Optional[int],
+        citation_count: Optional[int],
+        influential_citation_count: Optional[int],
+        criteria: Optional[FilterCriteria],
+        statuses: Optional[Set[str]],
+    ) -> bool:
+        """Check status and numeric filter bounds for a paper's fields."""
+        if statuses is not None:
+            status = status.value if hasattr(status, 'value') else status
+            if status not in statuses:
+                return False
+
+        if criteria is None:
+            return True
+
+        bounds = (
+            (year, criteria.min_year, criteria.max_year),
+            (citation_count, criteria.min_citations, criteria.max_citations),
+            (influential_citation_count, criteria.min_influential_citations, None),
+        )
+        for value, low, high in bounds:
+            if value is None:
+                continue
+            if low is not None and value < low:
+                return False
+            if high is not None and value > high:
+                return False
+
+        return True
+
     def get_papers_by_status(self, status: PaperStatus) -> List[Paper]:
         """Get all papers with a specific status."""
+        status = PaperStatus(status).value
         return [p for p in self.load_all_papers() if p.status == status]
 
     def get_papers_by_iteration(self, iteration: int) -> List[Paper]:
@@ -215,30 +492,85 @@ class JSONStorage:
             self.save_paper(paper)
 
     def get_statistics(self) -> Dict:
-        """Get statistics about the papers in the project."""
-        papers = self.load_all_papers()
+        """Get statistics about the papers in the project.
 
-        stats = {
-            "total": len(papers),
+        Counters are computed once and then updated incrementally by
+        save_paper, so repeated calls don't rescan every paper. On a cold
+        cache only the status, iteration and source fields are picked from
+        the raw JSON; papers are not validated into Paper objects.
+        """
+        if self._stats_cache is None:
+            self._reset_stats()
+            if self._papers_cache is not None:
+                for paper in self._papers_cache.values():
+                    self._update_stats_for(paper)
+            else:
+                paper_files = list(self.papers_dir.glob("*.json"))
+                with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+                    for paper_id, key in executor.map(self._read_stats_key, paper_files):
+                        self._move_stats(paper_id, key)
+
+        stats = self._stats_cache
+        return {
+            "total": stats["total"],
+            "by_status": dict(stats["by_status"]),
+            "by_iteration": dict(stats["by_iteration"]),
+            "by_source": dict(stats["by_source"]),
+        }
+
+    def _reset_stats(self) -> None:
+        """Start the cached statistics from zero."""
+        self._stats_cache = {
+            "total": 0,
             "by_status": {},
             "by_iteration": {},
             "by_source": {},
         }
-
-        for paper in papers:
-            # Count by status
-            status = paper.status.value if hasattr(paper.status, 'value') else paper.status
-            stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-
-            # Count by iteration
-            iter_key = str(paper.snowball_iteration)
-            stats["by_iteration"][iter_key] = stats["by_iteration"].get(iter_key, 0) + 1
-
-            # Count by source
-            source = paper.source.value if hasattr(paper.source, 'value') else paper.source
-            stats["by_source"][source] = stats["by_source"].get(source, 0) + 1
-
-        return stats
+        self._stats_keys = {}
+
+    def _read_stats_key(self, paper_file: Path) -> Tuple[str, Tuple[str, str, str]]:
+        """Read a paper file's ID and (status, iteration, source) without validating it."""
+        data = self._migrate_paper_data(_read_json(paper_file))
+        key = (
+            data.get("status", PaperStatus.PENDING.value),
+            str(data.get("snowball_iteration", 0)),
+            data.get("source"),
+        )
+        return data.get("id", paper_file.stem), key
+
+    def _update_stats_for(self, paper: Paper) -> None:
+        """Move a paper's contribution in the cached statistics to its current values."""
+        self._move_stats(paper.id, (paper.status, str(paper.snowball_iteration), paper.source))
+
+    def _move_stats(self, paper_id: str, new_key: Tuple[str, str, str]) -> None:
+        """Count a paper under new_key, removing it from the key it was counted under."""
+        old_key = self._stats_keys.get(paper_id)
+        if old_key == new_key:
+            return
+
+        stats = self._stats_cache
+        groups = (stats["by_status"], stats["by_iteration"], stats["by_source"])
+
+        if old_key is None:
+            stats["total"] += 1
+        else:
+            for counts, value in zip(groups, old_key):
+                counts[value] -= 1
+                if counts[value] == 0:
+                    del counts[value]
+
+        for counts, value in zip(groups, new_key):
+            counts[value] = counts.get(value, 0) + 1
+
+        self._stats_keys[paper_id] = new_key
+
+    def get_revision(self, paper_id: str) -> int:
+        """Get how many times a paper has been saved through this storage."""
+        return self._revisions.get(paper_id, 0)
+
+    def get_version(self) -> int:
+        """Get a counter that changes whenever any paper is saved or reloaded."""
+        return self._version
 
     def find_paper_by_doi(self, doi: str) -> Optional[Paper]:
         """Find a paper by DOI."""
@@ -285,3 +617,6 @@ class JSONStorage:
         (e.g., by another process or manual file editing).
         """
         self._papers_cache = None
+        self._stats_cache = None
+        self._stats_keys = {}
+        self._version += 1
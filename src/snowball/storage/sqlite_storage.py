@@ -0,0 +1,203 @@
+"""SQLite-based storage for papers."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+from ..models import Paper, PaperStatus, FilterCriteria
+from .json_storage import JSONStorage, model_dumps
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    id TEXT PRIMARY KEY,
+    status TEXT,
+    year INTEGER,
+    citation_count INTEGER,
+    influential_citation_count INTEGER,
+    source TEXT,
+    iteration INTEGER,
+    title TEXT,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_papers_status ON papers (status);
+CREATE INDEX IF NOT EXISTS idx_papers_year ON papers (year);
+"""
+
+
+class SQLiteStorage(JSONStorage):
+    """Stores papers in a single SQLite database instead of one JSON file each.
+
+    Hot filter/display fields (status, year, citation counts, source,
+    iteration, title) are real columns, and the full paper is kept as a JSON
+    body. Statistics and filtered loads are answered with SQL, so they don't
+    decode every paper. Project metadata stays in project.json, and the
+    in-memory cache and write-behind thread work as in JSONStorage.
+
+    Suited to very large projects; JSONStorage remains the default because
+    per-paper files are easier to diff and merge in Git.
+    """
+
+    DB_NAME = "papers.db"
+    USES_PAPER_FILES = False
+
+    def __init__(self, project_dir: Path):
+        """Initialize storage in the given directory.
+
+        Args:
+            project_dir: Directory to store project files
+        """
+        self.db_file = Path(project_dir) / self.DB_NAME
+        Path(project_dir).mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by the UI, worker and writer threads
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+        super().__init__(project_dir)
+
+    @staticmethod
+    def exists_in(project_dir: Path) -> bool:
+        """Check whether a project directory uses SQLite storage."""
+        return (Path(project_dir) / SQLiteStorage.DB_NAME).exists()
+
+    def _write_paper_to_disk(self, paper: Paper) -> None:
+        """Upsert a paper row (called from background thread)."""
+        row = (
+            paper.id,
+            paper.status,
+            paper.year,
+            paper.citation_count,
+            paper.influential_citation_count,
+            paper.source,
+            paper.snowball_iteration,
+            paper.title,
+            model_dumps(paper).decode("utf-8"),
+        )
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO papers (id, status, year, citation_count, "
+                "influential_citation_count, source, iteration, title, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            self._conn.commit()
+
+    def _update_papers_index(self, papers: List[Paper]) -> None:
+        """No separate index file: the table columns serve as the index."""
+
+    def _query(self, sql: str, params: Iterable = ()) -> List[tuple]:
+        """Run a read query after pending writes have reached the database."""
+        self.flush()
+        with self._db_lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def load_paper(self, paper_id: str) -> Optional[Paper]:
+        """Load a single paper by ID."""
+        if self._papers_cache is not None and paper_id in self._papers_cache:
+            return self._papers_cache[paper_id]
+
+        rows = self._query("SELECT body FROM papers WHERE id = ?", (paper_id,))
+        if not rows:
+            return None
+
+        paper = self._paper_from_json(rows[0][0])
+        if self._papers_cache is not None:
+            self._papers_cache[paper_id] = paper
+
+        return paper
+
+    def load_all_papers(self) -> List[Paper]:
+        """Load all papers, from the in-memory cache after the first call."""
+        if self._papers_cache is not None:
+            return list(self._papers_cache.values())
+
+        rows = self._query("SELECT body FROM papers")
+        papers = [self._paper_from_json(body) for (body,) in rows]
+        self._papers_cache = {paper.id: paper for paper in papers}
+
+        return list(self._papers_cache.values())
+
+    def iter_papers(self, status_in: Optional[Iterable[PaperStatus]] = None) -> Iterator[Paper]:
+        """Yield papers one at a time, decoding rows as they are consumed.
+
+        See JSONStorage.iter_papers.
+        """
+        if self._papers_cache is not None:
+            yield from super().iter_papers(status_in)
+            return
+
+        sql = "SELECT body FROM papers"
+        params: list = []
+        if status_in is not None:
+            params = [s.value if hasattr(s, 'value') else s for s in status_in]
+            if not params:
+                return
+            sql += f" WHERE status IN ({', '.join('?' * len(params))})"
+
+        for (body,) in self._query(sql, params):
+            yield self._paper_from_json(body)
+
+    def load_papers(
+        self,
+        filter_criteria: Optional[FilterCriteria] = None,
+        status_in: Optional[Iterable[PaperStatus]] = None,
+    ) -> List[Paper]:
+        """Load only the papers matching the given predicates.
+
+        On a cold cache the predicates become a SQL WHERE clause, so only
+        matching rows are decoded. See JSONStorage.load_papers.
+        """
+        if self._papers_cache is not None:
+            return super().load_papers(filter_criteria, status_in)
+
+        clauses = []
+        params: list = []
+
+        if status_in is not None:
+            statuses = [s.value if hasattr(s, 'value') else s for s in status_in]
+            if not statuses:
+                return []
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+
+        if filter_criteria is not None:
+            bounds = (
+                ("year", ">=", filter_criteria.min_year),
+                ("year", "<=", filter_criteria.max_year),
+                ("citation_count", ">=", filter_criteria.min_citations),
+                ("citation_count", "<=", filter_criteria.max_citations),
+                ("influential_citation_count", ">=", filter_criteria.min_influential_citations),
+            )
+            for column, op, value in bounds:
+                if value is not None:
+                    # Unknown values pass, as in FilterEngine
+                    clauses.append(f"({column} IS NULL OR {column} {op} ?)")
+                    params.append(value)
+
+        sql = "SELECT body FROM papers"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+
+        return [self._paper_from_json(body) for (body,) in self._query(sql, params)]
+
+    def get_statistics(self) -> Dict:
+        """Get statistics about the papers in the project.
+
+        The first call reads only the status, iteration and source columns;
+        later calls use the incrementally updated counters.
+        """
+        if self._stats_cache is None:
+            self._reset_stats()
+            rows = self._query("SELECT id, status, iteration, source FROM papers")
+            for paper_id, status, iteration, source in rows:
+                self._move_stats(paper_id, (status, str(iteration), source))
+
+        return super().get_statistics()
+
+    def shutdown(self) -> None:
+        """Shutdown the background writer thread and close the database."""
+        super().shutdown()
+        with self._db_lock:
+            self._conn.close()
@@ -1,9 +1,11 @@
 """Main TUI application using Textual."""
 
+import inspect
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from urllib.parse import quote_plus
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, ScrollableContainer
@@ -19,10 +21,13 @@ from textual.widgets import (
     Select,
     Input,
     Checkbox,
+    ProgressBar,
 )
+from textual.widgets.data_table import ColumnKey
 from textual.binding import Binding
 from textual.screen import ModalScreen
 from textual.worker import Worker, WorkerState
+from rich.text import Text
 
 from ..models import Paper, PaperStatus, ReviewProject
 from ..storage.json_storage import JSONStorage
@@ -31,16 +36,59 @@ from ..exporters.bibtex import BibTeXExporter
 from ..exporters.csv_exporter import CSVExporter
 from ..exporters.tikz import TikZExporter
 from ..parsers.pdf_parser import PDFParser
+from ..scoring.base import BaseScorer
 from ..paper_utils import (
-    get_status_value,
-    get_source_value,
-    get_sort_key,
+    STATUS_COLORS,
+    DEFAULT_STATUS_COLOR,
+    make_sort_key,
+    sort_key_uses_status,
     format_paper_rich,
     truncate_title,
     titles_match,
 )
 
-from collections import deque
+from collections import OrderedDict, deque
+from itertools import islice
+
+try:
+    import uvloop
+except ImportError:  # optional, not available on Windows
+    uvloop = None
+
+# Table column keys, in display order
+TABLE_COLUMNS = ("Status", "Title", "Year", "Rel", "Refs", "Cite", "Obs", "Source", "Iter", "PDF")
+
+# Maximum width of the title column; longer titles are cut with an ellipsis
+# when the cell is painted
+TITLE_COLUMN_WIDTH = 141
+
+# Number of formatted detail panels kept in memory
+DETAILS_CACHE_SIZE = 512
+
+# Threads used to write the export files side by side
+EXPORT_WORKERS = 4
+
+# Rows loaded beyond the screen height per table window; the next window is
+# loaded when the user reaches the bottom
+TABLE_ROW_BUFFER = 50
+
+# Seconds to wait before rendering details of a highlighted row, so holding
+# an arrow key renders at most one panel per interval
+DETAILS_RENDER_DELAY = 0.05
+
+# Status cells, keyed by status value. Styled cells are prebuilt Text
+# objects so the table doesn't parse markup again for every row.
+STATUS_DISPLAY = {
+    "included": Text("✓ Included", style=STATUS_COLORS["included"], end=""),
+    "excluded": Text("✗ Excluded", style=STATUS_COLORS["excluded"], end=""),
+    "pending": Text("? Pending", style=STATUS_COLORS["pending"], end=""),
+}
+
+# Short source labels for the table, keyed by source value
+SOURCE_SHORT = {"seed": "Seed", "backward": "Bkd", "forward": "Fwd"}
+
+PDF_INDICATOR = Text("pdf", style="#58a6ff", end="")
+
 
 class ReviewDialog(ModalScreen[Optional[tuple]]):
     """Modal dialog for reviewing a paper."""
@@ -59,7 +107,7 @@ class ReviewDialog(ModalScreen[Optional[tuple]]):
                     ("Exclude", "excluded"),
                     ("Keep Pending", "pending"),
                 ],
-                value=get_status_value(self.paper.status),
+                value=self.paper.status,
                 id="status-select",
             )
             yield Label("\nNotes:")
@@ -269,262 +317,7 @@ class SnowballApp(App):
     TITLE = "Snowball SLR"
     SUB_TITLE = "Systematic Literature Review Tool"
 
-    CSS = """
-    /* Color scheme */
-    Screen {
-        layout: vertical;
-        background: #0a0e14;
-    }
-
-    /* Stats panel styling */
-    #stats-panel {
-        height: auto;
-        padding: 0 1;
-        border: solid #30363d;
-        background: #161b22;
-        color: #c9d1d9;
-        align: left middle;
-    }
-
-    #stats-text {
-        width: 1fr;
-    }
-
-    #filter-input {
-        width: 30;
-        background: #0d1117;
-        border: solid #30363d;
-    }
-
-    #filter-input:focus {
-        border: solid #58a6ff;
-    }
-
-    /* Papers table styling */
-    #papers-table {
-        height: 1fr;
-        width: 100%;
-        background: #0d1117;
-        border: solid #30363d;
-    }
-
-    #papers-table:focus {
-        border: solid #58a6ff;
-    }
-
-    DataTable > .datatable--header {
-        background: #161b22;
-        color: #58a6ff;
-        text-style: bold;
-    }
-
-    DataTable > .datatable--cursor {
-        background: #1f6feb 30%;
-        color: #ffffff;
-    }
-
-    DataTable:focus > .datatable--cursor {
-        background: #1f6feb 50%;
-    }
-
-    /* Bottom section with details and log */
-    #bottom-section {
-        height: 15;
-        width: 100%;
-        layout: horizontal;
-    }
-
-    #bottom-section.hidden {
-        display: none;
-    }
-
-    /* Detail panel (left, 50%) */
-    #detail-panel {
-        width: 1fr;
-        height: 100%;
-        background: #0d1117;
-        border: solid #30363d;
-        overflow-y: auto;
-    }
-
-    #detail-panel:focus-within {
-        border: solid #58a6ff;
-    }
-
-    #detail-content {
-        width: 100%;
-        padding: 1 2;
-        background: #0d1117;
-        color: #c9d1d9;
-    }
-
-    /* Event log panel (right, 50%) */
-    #log-panel {
-        width: 1fr;
-        height: 100%;
-        background: #0d1117;
-        border: solid #30363d;
-        overflow-y: auto;
-        overflow-x: hidden;
-    }
-
-    #log-panel:focus-within {
-        border: solid #58a6ff;
-    }
-
-    #log-content {
-        padding: 0 1;
-        color: #8b949e;
-        overflow-x: hidden;
-    }
-
-    .log-header {
-        background: #161b22;
-        color: #58a6ff;
-        padding: 0 1;
-        text-style: bold;
-    }
-
-    /* Review dialog styling */
-    #review-dialog {
-        width: 70;
-        height: 30;
-        border: thick #58a6ff;
-        background: #161b22;
-        padding: 2;
-    }
-
-    #review-dialog Label {
-        color: #c9d1d9;
-        margin: 1 0;
-    }
-
-    #review-dialog Select {
-        background: #0d1117;
-        border: solid #30363d;
-        margin: 1 0;
-    }
-
-    #review-dialog TextArea {
-        background: #0d1117;
-        border: solid #30363d;
-        height: 8;
-        margin: 1 0;
-    }
-
-    /* Metadata mismatch dialog styling */
-    #mismatch-dialog {
-        width: 90;
-        height: auto;
-        max-height: 35;
-        border: thick #d29922;
-        background: #161b22;
-        padding: 2;
-        overflow-y: auto;
-    }
-
-    #mismatch-dialog Label {
-        color: #c9d1d9;
-    }
-
-    #mismatch-dialog Button {
-        margin: 0 1;
-    }
-
-    /* PDF chooser dialog styling */
-    #pdf-dialog {
-        width: 80;
-        height: auto;
-        max-height: 30;
-        border: thick #58a6ff;
-        background: #161b22;
-        padding: 2;
-    }
-
-    #relevance-dialog {
-        width: 50;
-        height: auto;
-        border: thick #58a6ff;
-        background: #161b22;
-        padding: 2;
-    }
-
-    #relevance-dialog Label {
-        color: #c9d1d9;
-    }
-
-    #relevance-dialog Button {
-        margin: 0 1 1 0;
-        width: 100%;
-    }
-
-    #pdf-dialog Label {
-        color: #c9d1d9;
-    }
-
-    #pdf-dialog Button {
-        margin: 0 1 1 0;
-        width: 100%;
-    }
-
-    #pdf-list {
-        height: auto;
-        max-height: 15;
-        background: #0d1117;
-        border: solid #30363d;
-        padding: 1;
-    }
-
-    /* Button styling */
-    Button {
-        margin: 1;
-        background: #21262d;
-        color: #c9d1d9;
-        border: solid #30363d;
-    }
-
-    Button:hover {
-        background: #30363d;
-        border: solid #58a6ff;
-    }
-
-    Button.primary {
-        background: #1f6feb;
-        color: #ffffff;
-        border: none;
-    }
-
-    Button.primary:hover {
-        background: #388bfd;
-    }
-
-    /* Header and Footer */
-    Header {
-        background: #161b22;
-        color: #58a6ff;
-        border-bottom: tall #30363d;
-    }
-
-    Footer {
-        background: #161b22;
-        color: #8b949e;
-        border-top: tall #30363d;
-    }
-
-    Footer > .footer--key {
-        background: #21262d;
-        color: #58a6ff;
-    }
-
-    Footer > .footer--description {
-        color: #c9d1d9;
-    }
-
-    /* Scrollbar styling */
-    ScrollableContainer:focus {
-        border: tall #58a6ff 50%;
-    }
-    """
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         # Navigation (show=False as these are standard)
@@ -596,17 +389,52 @@ class SnowballApp(App):
         # Cached widget references for performance (set in on_mount)
         self._detail_content: Optional[Static] = None
         self._log_content: Optional[Static] = None
+        self._table: Optional[DataTable] = None
+        self._stats_text: Optional[Static] = None
+        self._abstract_checkbox: Optional[Checkbox] = None
 
         # Cache for source paper titles (avoids N+1 lookups)
         self._source_title_cache: dict[str, str] = {}
 
+        # LRU cache of formatted details: paper_id -> (paper, revision, markup)
+        self._details_cache: OrderedDict[str, tuple[Paper, int, str]] = OrderedDict()
+
+        # Relevance scorers by method, reused across scoring runs
+        self._scorers: dict[str, BaseScorer] = {}
+
         # Debounce timer for filter input
         self._filter_timer: Optional[object] = None
 
+        # Pending detail panel render for the highlighted row
+        self._details_timer: Optional[object] = None
+
+        # Row last handled by on_data_table_row_highlighted
+        self._last_highlighted_id: Optional[str] = None
+
+        # Currently rendered table state (paper_id -> row cells, column labels)
+        # so refreshes only touch rows that changed
+        self._row_state: dict[str, tuple] = {}
+        self._rendered_labels: tuple = ()
+
+        # Last filtered and sorted paper list, with the state it was built from
+        # and whether more papers follow it
+        self._table_papers: Optional[tuple[tuple, list[Paper], bool]] = None
+
+        # Filters and sort order the table was last built for, and how many
+        # rows of that view to load; this grows by a window each time the
+        # user reaches the bottom
+        self._table_view: Optional[tuple] = None
+        self._table_row_limit: int = 0
+        self._table_truncated: bool = False
+
+        # Built row cells per paper: paper_id -> (paper, render key, cells)
+        self._row_cache: dict[str, tuple[Paper, tuple, tuple]] = {}
+
     def compose(self) -> ComposeResult:
         yield Header()
         with Horizontal(id="stats-panel"):
             yield Static(self._get_stats_text(), id="stats-text")
+            yield ProgressBar(id="snowball-progress", show_eta=False)
             yield Input(placeholder="Search...", id="filter-input")
             yield Checkbox("Search Abstracts", value=False, id="filter-abstract-checkbox")
         yield DataTable(id="papers-table", cursor_type="row")
@@ -636,38 +464,22 @@ class SnowballApp(App):
         else:
             return f"{column_name} ▼"
 
-    def _get_sort_key(self, paper: Paper):
-        """Generate sort key for a paper based on current sort column.
-
-        Returns a tuple where the first element controls None/missing value ordering,
-        and the second element is the actual value for comparison.
-        """
-        return get_sort_key(paper, self.sort_column)
-
     def on_mount(self) -> None:
         """Set up the table when app starts."""
         # Cache widget references for performance (avoids repeated DOM queries)
         self._detail_content = self.query_one("#detail-content", Static)
         self._log_content = self.query_one("#log-content", Static)
+        self._table = table = self.query_one("#papers-table", DataTable)
+        self._stats_text = self.query_one("#stats-text", Static)
+        self._abstract_checkbox = self.query_one("#filter-abstract-checkbox", Checkbox)
 
-        table = self.query_one("#papers-table", DataTable)
-
-        # Add columns with sort indicators
-        table.add_columns(
-            self._get_column_label("Status"),
-            self._get_column_label("Title"),
-            self._get_column_label("Year"),
-            self._get_column_label("Rel"),
-            self._get_column_label("Refs"),
-            self._get_column_label("Cite"),
-            self._get_column_label("Obs"),
-            self._get_column_label("Source"),
-            self._get_column_label("Iter"),
-            "PDF",
-        )
+        # Warm the storage cache once, so table windows, cursor moves and the
+        # row and detail caches all share the same Paper objects
+        self.storage.load_all_papers()
 
-        # Load and display papers
+        # Load and display papers (first refresh adds the columns)
         self._refresh_table()
+        self.watch(table, "scroll_y", self._on_table_scroll, init=False)
 
         # Load existing event log from file
         self._load_event_log()
@@ -681,124 +493,280 @@ class SnowballApp(App):
         self._log_event(f"[#58a6ff]Loaded:[/#58a6ff] {stats['total']} papers")
 
         # Show first paper's details if available
-        papers = self.storage.load_all_papers()
-        if papers:
-            self._show_paper_details(papers[0])
+        first_paper = next(self.storage.iter_papers(), None)
+        if first_paper:
+            self._show_paper_details(first_paper)
 
         # Focus the table by default
         table.focus()
 
-    def _refresh_table(self) -> None:
-        """Refresh the papers table."""
-        table = self.query_one("#papers-table", DataTable)
-
-        # Clear table including columns to update headers with sort indicators
-        table.clear(columns=True)
-
-        # Re-add columns with updated sort indicators
-        table.add_columns(
-            self._get_column_label("Status"),
-            self._get_column_label("Title"),
-            self._get_column_label("Year"),
-            self._get_column_label("Rel"),
-            self._get_column_label("Refs"),
-            self._get_column_label("Cite"),
-            self._get_column_label("Obs"),
-            self._get_column_label("Source"),
-            self._get_column_label("Iter"),
-            "PDF",
+    def _get_column_labels(self) -> tuple:
+        """Get the labels of all table columns, with sort indicators."""
+        return tuple(
+            self._get_column_label(name) if name != "PDF" else name
+            for name in TABLE_COLUMNS
         )
 
-        papers = self.storage.load_all_papers()
+    def _refresh_table(self) -> None:
+        """Refresh the papers table.
+
+        Rows are diffed against what is currently rendered: when the column
+        labels are unchanged and the rendered rows are still the leading rows,
+        in the same order, only cells whose content changed are updated and
+        any further rows are appended. Otherwise the table is rebuilt.
+        """
+        table = self._table
+        papers = self._get_table_papers()
+
+        rows = [(paper.id, self._get_row(paper)) for paper in papers]
+        labels = self._get_column_labels()
+        rendered = len(self._row_state)
+
+        if (
+            labels == self._rendered_labels
+            and len(rows) >= rendered
+            and all(
+                paper_id == rendered_id
+                for (paper_id, _), rendered_id in zip(rows, self._row_state)
+            )
+        ):
+            # Same leading rows in the same order: only touch cells that
+            # changed, then append the rest
+            for paper_id, row in islice(rows, rendered):
+                self._update_row_cells(table, paper_id, row)
+            self._append_rows(table, islice(rows, rendered, None))
+        else:
+            if not table.columns:
+                for label, column_key in zip(labels, TABLE_COLUMNS):
+                    width = 0 if column_key == "Title" else None
+                    table.add_column(label, width=width, key=column_key)
+                # The title column starts at its label's width and grows with
+                # the rows, up to TITLE_COLUMN_WIDTH
+                title_column = table.columns[ColumnKey("Title")]
+                title_column.width = title_column.label.cell_len
+            elif labels != self._rendered_labels:
+                self._relabel_columns(table, labels)
+            # Clear rows only; this also drops the rendered header cache
+            table.clear()
+            self._rendered_labels = labels
+            self._row_state = {}
+            self._append_rows(table, rows)
+
+        # Update stats
+        self._stats_text.update(self._get_stats_text())
 
-        # Apply status filter if set
-        if self.filter_status is not None:
-            papers = [p for p in papers if p.status == self.filter_status]
+    def _append_rows(self, table: DataTable, rows: Iterable[tuple[str, tuple]]) -> None:
+        """Append keyed rows to the bottom of the table.
+
+        ``DataTable.add_rows`` cannot key its rows, so rows are added one at
+        a time; the table defers its layout update until it is idle, so a
+        batch still costs a single reflow.
+        """
+        row_state = self._row_state
+        title_width = 0
+        for paper_id, row in rows:
+            table.add_row(*row, key=paper_id)
+            row_state[paper_id] = row
+            title_width = max(title_width, row[1].cell_len)
+        self._fit_title_column(table, title_width)
+
+    def _fit_title_column(self, table: DataTable, title_width: int) -> None:
+        """Widen the title column to fit a title, up to TITLE_COLUMN_WIDTH."""
+        column = table.columns[ColumnKey("Title")]
+        column.width = max(column.width, min(title_width, TITLE_COLUMN_WIDTH))
+
+    def _get_table_papers(self) -> list[Paper]:
+        """Get the filtered and sorted papers to display.
+
+        Papers are loaded in windows of a screenful plus a buffer: the table
+        starts with the first window, and the next one is appended when the
+        user reaches the bottom. The result is reused while the filters, the
+        sort settings and the storage version are unchanged, and only the new
+        window is loaded when more rows are requested.
+        """
+        search_in_abstract = self._abstract_checkbox.value
+        view = (
+            self.filter_status,
+            self.filter_keyword,
+            search_in_abstract,
+            self.sort_column,
+            self.sort_ascending,
+        )
+        if view != self._table_view:
+            self._table_view = view
+            self._table_row_limit = self._table_window_size()
+
+        key = (self.storage.get_version(), view)
+        papers: list[Paper] = []
+        if self._table_papers is not None and self._table_papers[0] == key:
+            papers, truncated = self._table_papers[1], self._table_papers[2]
+            if not truncated or len(papers) >= self._table_row_limit:
+                self._table_truncated = truncated
+                return papers
 
         # Apply keyword filter if set
+        predicate = None
         if self.filter_keyword:
             keyword_lower = self.filter_keyword.lower()
-            
-            search_in_abstract = self.query_one("#filter-abstract-checkbox", Checkbox).value
 
-            papers = [
-                p for p in papers 
-                if keyword_lower in p.title.lower() 
-                or (search_in_abstract and p.abstract and keyword_lower in p.abstract.lower())
-            ]
+            def matches_keyword(p: Paper) -> bool:
+                return keyword_lower in p.title.lower() or bool(
+                    search_in_abstract and p.abstract and keyword_lower in p.abstract.lower()
+                )
+
+            predicate = matches_keyword
+
+        # Load the missing rows (and one more, to tell whether others follow),
+        # applying the status filter if set
+        limit = self._table_row_limit - len(papers)
+        window = self.storage.load_papers_window(
+            make_sort_key(self.sort_column),
+            offset=len(papers),
+            limit=limit + 1,
+            reverse=not self.sort_ascending,
+            status_in={self.filter_status} if self.filter_status is not None else None,
+            predicate=predicate,
+        )
+        truncated = len(window) > limit
+        papers = papers + window[:limit]
 
-        # Sort papers using current sort settings
-        papers.sort(key=self._get_sort_key, reverse=not self.sort_ascending)
+        self._table_truncated = truncated
+        self._table_papers = (key, papers, truncated)
+        return papers
 
-        for paper in papers:
-            # Status indicator with icon and text
-            status_val = get_status_value(paper.status)
-            status_display = {
-                "included": "[#3fb950]✓ Included[/#3fb950]",
-                "excluded": "[#f85149]✗ Excluded[/#f85149]",
-                "pending": "[#d29922]? Pending[/#d29922]",
-            }.get(status_val, "?")
-
-            # Title (truncate for readability)
-            title = truncate_title(paper.title, max_length=140)
-
-            # Citations
-            citations = str(paper.citation_count) if paper.citation_count is not None else "-"
-
-            # Source
-            source = get_source_value(paper.source)
-            source_short = {"seed": "Seed", "backward": "Bkd", "forward": "Fwd"}.get(source, source)
-
-            # PDF indicator
-            pdf_indicator = "[#58a6ff]pdf[/#58a6ff]" if paper.pdf_path else ""
-
-            # Observation count
-            obs_count = str(paper.observation_count) if paper.observation_count > 1 else ""
-
-            # GROBID references count
-            grobid_refs = paper.raw_data.get("grobid_references", []) if paper.raw_data else []
-            refs_count = str(len(grobid_refs)) if grobid_refs else ""
-
-            # Year with color for out-of-range values
-            if paper.year:
-                year_excluded = False
-                if self.project.filter_criteria.min_year and paper.year < self.project.filter_criteria.min_year:
-                    year_excluded = True
-                if self.project.filter_criteria.max_year and paper.year > self.project.filter_criteria.max_year:
-                    year_excluded = True
-                year_display = f"[#f85149]{paper.year}[/#f85149]" if year_excluded else str(paper.year)
+    def _table_window_size(self) -> int:
+        """Get the number of rows loaded per table window."""
+        return self.size.height + TABLE_ROW_BUFFER
+
+    def _show_more_table_rows(self) -> None:
+        """Append the next window of papers to the table."""
+        self._table_row_limit = len(self._row_state) + self._table_window_size()
+        self._refresh_table()
+
+    def _on_table_scroll(self, scroll_y: float) -> None:
+        """Load more rows once the table is scrolled to the bottom."""
+        table = self._table
+        if self._table_truncated and 0 < table.max_scroll_y <= scroll_y:
+            self._show_more_table_rows()
+
+    def _relabel_columns(self, table: DataTable, labels: tuple) -> None:
+        """Update column header labels (sort indicators) in place."""
+        for column_key, label in zip(TABLE_COLUMNS, labels):
+            column = table.columns[ColumnKey(column_key)]
+            column.label = Text(label)
+            # Columns must still fit the label with its indicator
+            if column.auto_width:
+                column.content_width = max(column.content_width, column.label.cell_len)
             else:
-                year_display = "-"
-
-            # Relevance score with color coding
-            if paper.relevance_score is not None:
-                score = paper.relevance_score
-                if score >= 0.7:
-                    rel_display = f"[#3fb950]{score:.2f}[/#3fb950]"  # Green for high
-                elif score >= 0.4:
-                    rel_display = f"[#d29922]{score:.2f}[/#d29922]"  # Yellow for medium
-                else:
-                    rel_display = f"[#8b949e]{score:.2f}[/#8b949e]"  # Gray for low
+                column.width = max(column.width, column.label.cell_len)
+
+    def _get_row(self, paper: Paper) -> tuple:
+        """Get a paper's row cells, rebuilding them only after it was saved."""
+        criteria = self.project.filter_criteria
+        key = (self.storage.get_revision(paper.id), criteria.min_year, criteria.max_year)
+        cached = self._row_cache.get(paper.id)
+        if cached is not None and cached[0] is paper and cached[1] == key:
+            return cached[2]
+
+        row = self._build_row(paper)
+        self._row_cache[paper.id] = (paper, key, row)
+        return row
+
+    def _build_row(self, paper: Paper) -> tuple:
+        """Build the rendered cell values of a paper's table row."""
+        # Status indicator with icon and text (status is stored as a string)
+        status_display = STATUS_DISPLAY.get(paper.status, "?")
+
+        # Title, cut to the column width when painted
+        title = Text(paper.title, overflow="ellipsis", no_wrap=True, end="")
+
+        # Citations
+        citations = str(paper.citation_count) if paper.citation_count is not None else "-"
+
+        # Source
+        source_short = SOURCE_SHORT.get(paper.source, paper.source)
+
+        # PDF indicator
+        pdf_indicator = PDF_INDICATOR if paper.pdf_path else ""
+
+        # Observation count
+        obs_count = str(paper.observation_count) if paper.observation_count > 1 else ""
+
+        # GROBID references count
+        grobid_refs = paper.raw_data.get("grobid_references", []) if paper.raw_data else []
+        refs_count = str(len(grobid_refs)) if grobid_refs else ""
+
+        # Year with color for out-of-range values
+        if paper.year:
+            criteria = self.project.filter_criteria
+            year_excluded = False
+            if criteria.min_year and paper.year < criteria.min_year:
+                year_excluded = True
+            if criteria.max_year and paper.year > criteria.max_year:
+                year_excluded = True
+            if year_excluded:
+                year_display = Text(str(paper.year), style="#f85149", end="")
             else:
-                rel_display = ""
-
-            table.add_row(
-                status_display,
-                title,
-                year_display,
-                rel_display,
-                refs_count,
-                citations,
-                obs_count,
-                source_short,
-                str(paper.snowball_iteration),
-                pdf_indicator,
-                key=paper.id,
-            )
+                year_display = str(paper.year)
+        else:
+            year_display = "-"
+
+        # Relevance score with color coding
+        if paper.relevance_score is not None:
+            score = paper.relevance_score
+            if score >= 0.7:
+                rel_color = "#3fb950"  # Green for high
+            elif score >= 0.4:
+                rel_color = "#d29922"  # Yellow for medium
+            else:
+                rel_color = "#8b949e"  # Gray for low
+            rel_display = Text(f"{score:.2f}", style=rel_color, end="")
+        else:
+            rel_display = ""
+
+        cells = (
+            status_display,
+            title,
+            year_display,
+            rel_display,
+            refs_count,
+            citations,
+            obs_count,
+            source_short,
+            str(paper.snowball_iteration),
+            pdf_indicator,
+        )
+        # Plain cells are wrapped in Text too: the table parses str cells as
+        # markup, which costs time and mangles titles containing brackets.
+        return tuple(cell if isinstance(cell, Text) else Text(cell, end="") for cell in cells)
+
+    def _update_row_cells(self, table: DataTable, paper_id: str, row: tuple) -> None:
+        """Update only the cells of a rendered row whose content changed."""
+        old_row = self._row_state[paper_id]
+        if row == old_row:
+            return
+        for column, old_value, value in zip(TABLE_COLUMNS, old_row, row):
+            if value != old_value:
+                if column == "Title":
+                    self._fit_title_column(table, value.cell_len)
+                table.update_cell(paper_id, column, value, update_width=column == "Title")
+        self._row_state[paper_id] = row
+
+    def _refresh_row(self, paper_id: str) -> None:
+        """Refresh a single paper's row in place (order is left unchanged)."""
+        if paper_id not in self._row_state:
+            self._refresh_table()
+            return
 
-        # Update stats
-        stats_panel = self.query_one("#stats-text", Static)
-        stats_panel.update(self._get_stats_text())
+        paper = self.storage.load_paper(paper_id)
+        if not paper:
+            self._refresh_table()
+            return
+
+        table = self._table
+        self._update_row_cells(table, paper_id, self._get_row(paper))
+
+        self._stats_text.update(self._get_stats_text())
 
     def _get_stats_text(self) -> str:
         """Get statistics text."""
@@ -843,6 +811,25 @@ class SnowballApp(App):
         return stats_line
 
     def _format_paper_details(self, paper: Paper) -> str:
+        """Format paper details as rich text, rebuilding them only after it was saved.
+
+        Every change to a paper goes through storage.save_paper, which bumps
+        its revision, so the revision identifies the rendered content.
+        """
+        revision = self.storage.get_revision(paper.id)
+        cached = self._details_cache.get(paper.id)
+        if cached is not None and cached[0] is paper and cached[1] == revision:
+            self._details_cache.move_to_end(paper.id)
+            return cached[2]
+
+        details = self._build_paper_details(paper)
+        self._details_cache[paper.id] = (paper, revision, details)
+        self._details_cache.move_to_end(paper.id)
+        if len(self._details_cache) > DETAILS_CACHE_SIZE:
+            self._details_cache.popitem(last=False)
+        return details
+
+    def _build_paper_details(self, paper: Paper) -> str:
         """Format paper details as rich text using shared function."""
         details = format_paper_rich(paper)
 
@@ -951,11 +938,35 @@ class SnowballApp(App):
         if event.row_key is None:
             return
 
+        # Reaching the last row with the keyboard loads more papers
+        if self._table_truncated and event.cursor_row >= event.data_table.row_count - 1:
+            self._show_more_table_rows()
+
+        # The table re-posts the event for the same row when it is rebuilt;
+        # nothing changed if that row's paper is still the current one
         paper_id = event.row_key.value
+        if (
+            paper_id == self._last_highlighted_id
+            and self.current_paper is not None
+            and self.current_paper.id == paper_id
+        ):
+            return
+        self._last_highlighted_id = paper_id
+
         paper = self.storage.load_paper(paper_id)
 
         if paper:
-            self._show_paper_details(paper)
+            # Review keys act on this paper right away; the panel catches up
+            # once the timer fires
+            self.current_paper = paper
+            if self._details_timer is None:
+                self._details_timer = self.set_timer(DETAILS_RENDER_DELAY, self._flush_details)
+
+    def _flush_details(self) -> None:
+        """Render details of the latest highlighted paper (called after delay)."""
+        self._details_timer = None
+        if self.current_paper:
+            self._show_paper_details(self.current_paper)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection (Enter key) - show paper details."""
@@ -1019,7 +1030,7 @@ class SnowballApp(App):
         self._refresh_table()
 
         # Move cursor to first row if there are results
-        table = self.query_one("#papers-table", DataTable)
+        table = self._table
         if table.row_count > 0:
             table.move_cursor(row=0)
 
@@ -1039,16 +1050,14 @@ class SnowballApp(App):
         ))
 
         # Get the current table position
-        table = self.query_one("#papers-table", DataTable)
+        table = self._table
         current_row_index = table.cursor_row
 
         # Log the status change
-        status_labels = {
-            PaperStatus.INCLUDED: "[#3fb950]Included:[/#3fb950]",
-            PaperStatus.EXCLUDED: "[#f85149]Excluded:[/#f85149]",
-            PaperStatus.PENDING: "[#d29922]Pending:[/#d29922]",
-        }
-        self._log_event(f"{status_labels.get(status, status.value + ':')} {self.current_paper.title}")
+        color = STATUS_COLORS.get(status.value, DEFAULT_STATUS_COLOR)
+        self._log_event(
+            f"[{color}]{status.value.capitalize()}:[/{color}] {self.current_paper.title}"
+        )
 
         # Update the paper status (pass project for iteration stats tracking)
         self.engine.update_paper_review(
@@ -1058,12 +1067,15 @@ class SnowballApp(App):
             project=self.project
         )
 
-        # Refresh the table to show updated status
-        self._refresh_table()
+        # Status only moves rows when the sort order or filter depends on
+        # it; otherwise update the paper's row in place
+        if sort_key_uses_status(self.sort_column) or self.filter_status is not None:
+            self._refresh_table()
+        else:
+            self._refresh_row(self.current_paper.id)
 
         # Stay at same row position - the judged paper moves away due to sort,
         # so the "next" paper naturally slides into current position
-        table = self.query_one("#papers-table", DataTable)
         if table.row_count > 0:
             # Stay at current position, or last row if we're beyond the end
             target_row = min(current_row_index, table.row_count - 1)
@@ -1112,12 +1124,8 @@ class SnowballApp(App):
         )
 
         # Log the undo
-        status_labels = {
-            PaperStatus.INCLUDED: "[#3fb950]Included[/#3fb950]",
-            PaperStatus.EXCLUDED: "[#f85149]Excluded[/#f85149]",
-            PaperStatus.PENDING: "[#d29922]Pending[/#d29922]",
-        }
-        status_label = status_labels.get(previous_status, previous_status.value)
+        color = STATUS_COLORS.get(previous_status.value, DEFAULT_STATUS_COLOR)
+        status_label = f"[{color}]{previous_status.value.capitalize()}[/{color}]"
         remaining = len(self._last_status_change)
         self._log_event(f"[dim]Undo ({remaining} left):[/dim] {title} → {status_label}")
 
@@ -1141,7 +1149,7 @@ class SnowballApp(App):
                 self.engine.update_paper_review(
                     self.current_paper.id, self.current_paper.status, notes  # Keep existing status
                 )
-                self._refresh_table()
+                self._refresh_row(self.current_paper.id)
 
                 # Reload current paper and update detail panel
                 self.current_paper = self.storage.load_paper(self.current_paper.id)
@@ -1212,7 +1220,7 @@ class SnowballApp(App):
                 self._log_event(f"[dim]Unlinked PDF from:[/dim] {self.current_paper.title}")
                 self.notify("PDF link cleared", severity="information")
                 self._show_paper_details(self.current_paper)
-                self._refresh_table()
+                self._refresh_row(self.current_paper.id)
             else:
                 import shutil
                 selected_path = Path(result)
@@ -1256,7 +1264,7 @@ class SnowballApp(App):
 
                 # Refresh display immediately (references will update when worker completes)
                 self._show_paper_details(self.current_paper)
-                self._refresh_table()
+                self._refresh_row(self.current_paper.id)
 
         self.push_screen(
             PDFChooserDialog(pdf_files, self.current_paper.pdf_path, inbox_dir),
@@ -1269,12 +1277,20 @@ class SnowballApp(App):
         old_count = len(self.storage.load_all_papers())
         self._worker_context["snowball"] = {"old_count": old_count}
 
-        # Show working notification
+        # Show working notification, and progress once fetches complete
         self.notify("Running snowball...", timeout=60)
+        progress = self.query_one("#snowball-progress", ProgressBar)
+        progress.update(total=None, progress=0)
+        progress.display = True
+
+        def report_progress(current: int, total: int) -> None:
+            self.call_from_thread(progress.update, total=total, progress=current)
 
         def do_snowball() -> dict:
             """Run snowball in background thread."""
-            result = self.engine.run_snowball_iteration(self.project)
+            result = self.engine.run_snowball_iteration(
+                self.project, progress_callback=report_progress
+            )
             return result
 
         self.run_worker(do_snowball, name="snowball", thread=True)
@@ -1285,7 +1301,7 @@ class SnowballApp(App):
         old_count = ctx.get("old_count", 0)
         worker_result = ctx.get("worker_result", {})
 
-        self.project = self.storage.load_project()
+        # The engine updated self.project in place
         new_count = len(self.storage.load_all_papers())
         new_papers = new_count - old_count
 
@@ -1314,48 +1330,68 @@ class SnowballApp(App):
 
     def action_export(self) -> None:
         """Export papers to BibTeX, CSV, TikZ, and PNG graph."""
-        from ..visualization import generate_citation_graph
-
         papers = self.storage.load_all_papers()
-        included_count = sum(1 for p in papers if p.status == PaperStatus.INCLUDED)
+        included = PaperStatus.INCLUDED.value
+        included_count = sum(1 for p in papers if p.status == included)
+        self._worker_context["export"] = {"included_count": included_count}
 
         # Create output directory
         output_dir = self.project_dir / "output"
         output_dir.mkdir(exist_ok=True)
+        title = self.project.name
+
+        self.notify("Exporting...", timeout=60)
+
+        def write_tikz(path: Path, standalone: bool) -> None:
+            tikz_content = TikZExporter().export(papers, only_included=True, standalone=standalone)
+            with open(path, "w") as f:
+                f.write(tikz_content)
+
+        def do_export() -> dict:
+            """Write the export files in a background thread."""
+            from ..visualization import generate_citation_graph
+
+            # Each format is an independent pass over the same papers
+            with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+                futures = [
+                    executor.submit(
+                        BibTeXExporter().write,
+                        papers,
+                        output_dir / "included_papers.bib",
+                        only_included=True,
+                    ),
+                    executor.submit(
+                        CSVExporter().export,
+                        papers,
+                        output_dir / "all_papers.csv",
+                        only_included=False,
+                    ),
+                    # Both embeddable and standalone TikZ versions
+                    executor.submit(write_tikz, output_dir / "citation_graph.tex", False),
+                    executor.submit(write_tikz, output_dir / "citation_graph_standalone.tex", True),
+                ]
+
+                graph_path = generate_citation_graph(
+                    papers=papers,
+                    output_dir=output_dir,
+                    title=title,
+                )
 
-        # Export BibTeX
-        bibtex_exporter = BibTeXExporter()
-        bibtex_content = bibtex_exporter.export(papers, only_included=True)
-        bibtex_path = output_dir / "included_papers.bib"
-        with open(bibtex_path, "w") as f:
-            f.write(bibtex_content)
-
-        # Export CSV
-        csv_exporter = CSVExporter()
-        csv_path = output_dir / "all_papers.csv"
-        csv_exporter.export(papers, csv_path, only_included=False)
-
-        # Export TikZ (both embeddable and standalone versions)
-        tikz_exporter = TikZExporter()
-
-        tikz_content = tikz_exporter.export(papers, only_included=True, standalone=False)
-        tikz_path = output_dir / "citation_graph.tex"
-        with open(tikz_path, "w") as f:
-            f.write(tikz_content)
-
-        tikz_standalone = tikz_exporter.export(papers, only_included=True, standalone=True)
-        tikz_standalone_path = output_dir / "citation_graph_standalone.tex"
-        with open(tikz_standalone_path, "w") as f:
-            f.write(tikz_standalone)
-
-        # Export PNG graph
-        graph_path = generate_citation_graph(
-            papers=papers,
-            output_dir=output_dir,
-            title=self.project.name,
-        )
+                # Re-raise any export error in the worker
+                for future in futures:
+                    future.result()
+
+            return {"graph_path": graph_path}
+
+        self.run_worker(do_export, name="export", thread=True)
 
-        if graph_path:
+    def _handle_export_complete(self) -> None:
+        """Handle export worker completion."""
+        ctx = self._worker_context.get("export", {})
+        included_count = ctx.get("included_count", 0)
+        worker_result = ctx.get("worker_result", {})
+
+        if worker_result.get("graph_path"):
             self.notify("Exported BibTeX, CSV, TikZ, and graph", title="Export complete", severity="information")
             self._log_event(f"[#d29922]Exported:[/#d29922] {included_count} included → BibTeX, CSV, TikZ, PNG")
         else:
@@ -1416,7 +1452,7 @@ class SnowballApp(App):
         self._refresh_table()
 
         # Move cursor to first row if there are papers
-        table = self.query_one("#papers-table", DataTable)
+        table = self._table
         if table.row_count > 0:
             table.move_cursor(row=0)
 
@@ -1518,10 +1554,8 @@ class SnowballApp(App):
             return
 
         # Get papers to score (pending only by default)
-        papers = [
-            p for p in self.storage.load_all_papers()
-            if p.status == PaperStatus.PENDING
-        ]
+        pending = PaperStatus.PENDING.value
+        papers = [p for p in self.storage.load_all_papers() if p.status == pending]
 
         if not papers:
             self.notify("No pending papers to score", severity="warning")
@@ -1553,10 +1587,17 @@ class SnowballApp(App):
             """Run relevance computation in background."""
             from ..scoring import get_scorer
 
-            try:
-                scorer = get_scorer(method)
-            except (ImportError, ValueError) as e:
-                return {"error": str(e), "updated": 0}
+            # Scorers are kept for the session so their caches carry over
+            scorer = self._scorers.get(method)
+            if scorer is None:
+                scorer_kwargs = {}
+                if method == "llm":
+                    scorer_kwargs["cache_dir"] = self.project_dir / ".llm_cache"
+
+                try:
+                    scorer = self._scorers[method] = get_scorer(method, **scorer_kwargs)
+                except (ImportError, ValueError) as e:
+                    return {"error": str(e), "updated": 0}
 
             results = scorer.score_papers(rq, papers)
 
@@ -1646,7 +1687,7 @@ class SnowballApp(App):
         paper = self.current_paper
 
         # Save current cursor position
-        table = self.query_one("#papers-table", DataTable)
+        table = self._table
         current_row_index = table.cursor_row
 
         # Store context for worker completion handler, including original values for sanity check
@@ -1668,14 +1709,16 @@ class SnowballApp(App):
 
         def do_enrich() -> dict:
             """Run enrichment in background thread."""
-            # First, enrich metadata as usual
-            self.engine.api.enrich_metadata(paper)
+            # An explicit refresh fetches fresh data rather than cached responses
+            with self.engine.api.bypass_cache():
+                # First, enrich metadata as usual
+                self.engine.api.enrich_metadata(paper)
 
-            # If paper has a DOI, fetch the authoritative data for that DOI
-            # to compare against current title (GROBID might have extracted wrong title)
-            doi_paper = None
-            if paper.doi:
-                doi_paper = self.engine.api.search_by_doi(paper.doi)
+                # If paper has a DOI, fetch the authoritative data for that DOI
+                # to compare against current title (GROBID might have extracted wrong title)
+                doi_paper = None
+                if paper.doi:
+                    doi_paper = self.engine.api.search_by_doi(paper.doi)
 
             return {"doi_paper": doi_paper}
 
@@ -1690,6 +1733,8 @@ class SnowballApp(App):
 
         # Clear the "working" notification before showing result
         self.clear_notifications()
+        if worker_name == "snowball":
+            self.query_one("#snowball-progress", ProgressBar).display = False
 
         if event.state == WorkerState.ERROR:
             self.notify(f"Operation failed: {event.worker.error}", title="Error", severity="error")
@@ -1712,6 +1757,10 @@ class SnowballApp(App):
             if hasattr(event.worker, 'result') and event.worker.result:
                 self._worker_context["link_pdf"]["worker_result"] = event.worker.result
             self._handle_link_pdf_complete()
+        elif worker_name == "export":
+            if hasattr(event.worker, 'result') and event.worker.result:
+                self._worker_context["export"]["worker_result"] = event.worker.result
+            self._handle_export_complete()
         elif worker_name == "compute_relevance":
             if hasattr(event.worker, 'result') and event.worker.result:
                 self._worker_context["compute_relevance"]["worker_result"] = event.worker.result
@@ -1754,6 +1803,9 @@ class SnowballApp(App):
             self._log_event(f"[#f85149]Parse failed:[/#f85149] {error[:50]}")
             self.notify(f"Linked: {pdf_name} (parse failed)", severity="warning")
 
+        # Update the Refs column for this paper
+        self._refresh_row(paper_id)
+
         # Refresh details panel if still viewing the same paper
         if self.current_paper and self.current_paper.id == paper_id:
             # Reload to get updated references
@@ -1875,7 +1927,7 @@ class SnowballApp(App):
         self._refresh_table()
 
         # Restore cursor position
-        table = self.query_one("#papers-table", DataTable)
+        table = self._table
         if table.row_count > 0:
             target_row = min(ctx.get("cursor_row", 0), table.row_count - 1)
             table.move_cursor(row=target_row)
@@ -1935,6 +1987,14 @@ Press any key to close this help.
 def run_tui(
     project_dir: Path, storage: JSONStorage, engine: SnowballEngine, project: ReviewProject
 ) -> None:
-    """Run the TUI application."""
+    """Run the TUI application.
+
+    Uses a uvloop event loop when uvloop is installed (the ``fast`` extra)
+    and the installed Textual accepts a custom loop.
+    """
     app = SnowballApp(project_dir, storage, engine, project)
-    app.run()
+    # Older Textual releases have no loop parameter
+    if uvloop is not None and "loop" in inspect.signature(app.run).parameters:
+        app.run(loop=uvloop.new_event_loop())
+    else:
+        app.run()
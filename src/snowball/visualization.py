@@ -58,7 +58,7 @@ def generate_citation_graph(
 
     # Filter to included papers only
     if included_only:
-        papers = [p for p in papers if _get_status(p) == "included"]
+        papers = [p for p in papers if p.status == "included"]
 
     if not papers:
         return None
@@ -253,12 +253,6 @@ def generate_citation_graph(
     return output_file
 
 
-def _get_status(paper) -> str:
-    """Get status value as string."""
-    status = paper.status
-    return status.value if hasattr(status, "value") else status
-
-
 def _wrap_text(text: str, width: int = 30) -> str:
     """Wrap text at word boundaries to fit within width.
 
@@ -305,3 +305,43 @@ class TestAPIAggregator:
         result = aggregator.identify_paper(paper)
         
         assert result.doi == "10.1234/found"
+
+    @patch('snowball.apis.aggregator.SemanticScholarClient')
+    @patch('snowball.apis.aggregator.OpenCitationsClient')
+    def test_get_references_hydrates_opencitations_results(self, mock_oc, mock_s2):
+        """Test that DOI-only OpenCitations references are filled in with one batch call."""
+        stub = Paper(
+            id="stub", doi="10.1234/ref", title="Paper 10.1234/ref", source=PaperSource.BACKWARD
+        )
+        full = Paper(
+            id="full",
+            doi="10.1234/ref",
+            title="Real Reference Title",
+            year=2020,
+            semantic_scholar_id="s2-ref",
+            source=PaperSource.SEED
+        )
+
+        mock_oc_instance = Mock()
+        mock_oc_instance.get_references.return_value = [stub]
+        mock_oc.return_value = mock_oc_instance
+
+        mock_s2_instance = Mock()
+        mock_s2_instance.get_papers_batch.return_value = [full]
+        mock_s2.return_value = mock_s2_instance
+
+        aggregator = APIAggregator(use_apis=["semantic_scholar", "opencitations"])
+        paper = Paper(id="test", title="Test", doi="10.1234/test", source=PaperSource.SEED)
+
+        refs = aggregator.get_references(paper)
+
+        assert refs == [stub]
+        assert stub.title == "Real Reference Title"
+        assert stub.year == 2020
+        assert stub.semantic_scholar_id == "s2-ref"
+        mock_s2_instance.get_papers_batch.assert_called_once_with(["DOI:10.1234/ref"])
+
+    def test_fetch_papers_batch_without_semantic_scholar(self):
+        """Test that batch fetch returns no results when S2 is disabled."""
+        aggregator = APIAggregator(use_apis=["arxiv"])
+        assert aggregator.fetch_papers_batch(["DOI:10.1/a", "DOI:10.1/b"]) == [None, None]
@@ -1,8 +1,14 @@
 """Tests for base API client interface."""
 
+import time
+from unittest.mock import Mock, patch
+
 import pytest
 
-from snowball.apis.base import BaseAPIClient, APIClientError, RateLimitError, APINotFoundError
+from snowball.apis.base import (
+    BaseAPIClient, APIClientError, RateLimitError, APINotFoundError, RateLimiter,
+    send_with_retry,
+)
 
 
 class TestAPIClientErrors:
@@ -41,3 +47,61 @@ class TestBaseAPIClient:
 
         with pytest.raises(TypeError):
             IncompleteClient()
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter class."""
+
+    def test_first_request_does_not_wait(self):
+        """Test that the first request goes out immediately."""
+        limiter = RateLimiter()
+        start = time.monotonic()
+        limiter.wait(1.0)
+        assert time.monotonic() - start < 0.5
+
+    def test_spaces_consecutive_requests(self):
+        """Test that consecutive requests are spaced by the delay."""
+        limiter = RateLimiter()
+        limiter.wait(0.05)
+        start = time.monotonic()
+        limiter.wait(0.05)
+        assert time.monotonic() - start >= 0.04
+
+
+class TestSendWithRetry:
+    """Tests for send_with_retry helper."""
+
+    def _response(self, status_code, headers=None):
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        return response
+
+    @patch("snowball.apis.base.time.sleep")
+    def test_retries_after_429(self, mock_sleep):
+        """Test that a 429 is retried, honouring Retry-After."""
+        client = Mock()
+        client.get.side_effect = [
+            self._response(429, {"Retry-After": "2"}),
+            self._response(200),
+        ]
+
+        response = send_with_retry(client, "GET", "http://x", RateLimiter(), 0)
+
+        assert response.status_code == 200
+        assert client.get.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("snowball.apis.base.time.sleep")
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        """Test that the last 429 is returned once retries are exhausted."""
+        client = Mock()
+        client.get.return_value = self._response(429)
+
+        response = send_with_retry(
+            client, "GET", "http://x", RateLimiter(), 0, max_retries=2, backoff=1.0
+        )
+
+        assert response.status_code == 429
+        assert client.get.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
@@ -0,0 +1,97 @@
+"""Tests for the on-disk API response cache."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from snowball.apis.base import RateLimiter, send_with_retry
+from snowball.apis.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache class."""
+
+    @pytest.fixture
+    def cache_dir(self):
+        """Create a temporary cache directory."""
+        with tempfile.TemporaryDirectory() as d:
+            yield Path(d) / ".http_cache"
+
+    def test_round_trip(self, cache_dir):
+        """Test that a stored response is returned with the same body."""
+        cache = ResponseCache(cache_dir)
+        key = cache.make_key("GET", "http://x/paper", {"fields": "title"})
+        cache.set(key, httpx.Response(200, json={"title": "Cached"}))
+
+        cached = cache.get(key)
+
+        assert cached is not None
+        assert cached.status_code == 200
+        assert cached.json() == {"title": "Cached"}
+
+    def test_key_depends_on_params(self):
+        """Test that different query parameters give different keys."""
+        assert ResponseCache.make_key("GET", "http://x", {"a": 1}) != \
+            ResponseCache.make_key("GET", "http://x", {"a": 2})
+
+    def test_errors_and_no_store_are_not_cached(self, cache_dir):
+        """Test that non-200 and no-store responses are skipped."""
+        cache = ResponseCache(cache_dir)
+        cache.set("error", httpx.Response(500, text="oops"))
+        cache.set("nostore", httpx.Response(200, json={}, headers={"Cache-Control": "no-store"}))
+
+        assert cache.get("error") is None
+        assert cache.get("nostore") is None
+
+    def test_expired_entry_is_ignored_unless_offline(self, cache_dir):
+        """Test that expired entries are misses online but still served offline."""
+        cache = ResponseCache(cache_dir, default_ttl=-1)
+        cache.set("key", httpx.Response(200, json={"a": 1}))
+
+        assert cache.get("key") is None
+        assert ResponseCache(cache_dir, offline=True).get("key") is not None
+
+    def test_send_with_retry_uses_cache(self, cache_dir):
+        """Test that a cached response avoids a second network request."""
+        cache = ResponseCache(cache_dir)
+        client = Mock()
+        client.get.return_value = httpx.Response(200, json={"a": 1})
+
+        for _ in range(2):
+            response = send_with_retry(
+                client, "GET", "http://x", RateLimiter(), 0, params={"q": 1}, cache=cache
+            )
+            assert response.json() == {"a": 1}
+
+        assert client.get.call_count == 1
+
+    def test_bypass_skips_cached_responses(self, cache_dir):
+        """Test that a bypassed request refetches and stores the fresh response."""
+        cache = ResponseCache(cache_dir)
+        client = Mock()
+        client.get.side_effect = [
+            httpx.Response(200, json={"a": 1}),
+            httpx.Response(200, json={"a": 2}),
+        ]
+
+        send_with_retry(client, "GET", "http://x", RateLimiter(), 0, cache=cache)
+        with cache.bypass():
+            fresh = send_with_retry(client, "GET", "http://x", RateLimiter(), 0, cache=cache)
+        cached = send_with_retry(client, "GET", "http://x", RateLimiter(), 0, cache=cache)
+
+        assert fresh.json() == {"a": 2}
+        assert cached.json() == {"a": 2}
+        assert client.get.call_count == 2
+
+    def test_offline_miss_returns_504(self, cache_dir):
+        """Test that offline mode never hits the network."""
+        cache = ResponseCache(cache_dir, offline=True)
+        client = Mock()
+
+        response = send_with_retry(client, "GET", "http://x", RateLimiter(), 0, cache=cache)
+
+        assert response.status_code == 504
+        client.get.assert_not_called()
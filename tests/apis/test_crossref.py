@@ -326,15 +326,19 @@ class TestCrossRefMakeRequest:
 
         assert result == {"message": {"DOI": "10.1234/test"}}
 
+    @patch('snowball.apis.base.time.sleep')
     @patch('httpx.Client.get')
-    def test_make_request_rate_limit(self, mock_get, client):
+    def test_make_request_rate_limit(self, mock_get, mock_sleep, client):
         """Test API request with rate limit error."""
         mock_response = Mock()
         mock_response.status_code = 429
+        mock_response.headers = {}
         mock_get.return_value = mock_response
 
         with pytest.raises(RateLimitError):
             client._make_request("works/10.1234/test")
+        # 429s are retried with backoff before giving up
+        assert mock_get.call_count == 4
 
     @patch('httpx.Client.get')
     def test_make_request_not_found(self, mock_get, client):
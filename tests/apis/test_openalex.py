@@ -452,15 +452,19 @@ class TestOpenAlexMakeRequest:
 
         assert result == {"id": "W1234"}
 
+    @patch('snowball.apis.base.time.sleep')
     @patch('httpx.Client.get')
-    def test_make_request_rate_limit(self, mock_get, client):
+    def test_make_request_rate_limit(self, mock_get, mock_sleep, client):
         """Test API request with rate limit error."""
         mock_response = Mock()
         mock_response.status_code = 429
+        mock_response.headers = {}
         mock_get.return_value = mock_response
 
         with pytest.raises(RateLimitError):
             client._make_request("works/W1234")
+        # 429s are retried with backoff before giving up
+        assert mock_get.call_count == 4
 
     @patch('httpx.Client.get')
     def test_make_request_not_found(self, mock_get, client):
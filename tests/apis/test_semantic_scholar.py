@@ -1,5 +1,8 @@
 """Tests for Semantic Scholar API client."""
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -180,18 +183,77 @@ class TestSemanticScholarClient:
         assert result.year == 2023
         assert result.citation_count == 100
 
+    @patch.object(SemanticScholarClient, '_make_request')
+    def test_get_papers_batch(self, mock_request, client, mock_paper_response):
+        """Test fetching several papers in one batch request."""
+        mock_request.return_value = [mock_paper_response, None]
+
+        papers = client.get_papers_batch(["DOI:10.1234/test.doi", "DOI:10.9999/missing"])
+
+        assert len(papers) == 2
+        assert papers[0].title == "Test Paper Title"
+        assert papers[1] is None
+        mock_request.assert_called_once()
+        assert mock_request.call_args.kwargs["json_body"] == {
+            "ids": ["DOI:10.1234/test.doi", "DOI:10.9999/missing"]
+        }
+
+    @patch.object(SemanticScholarClient, '_make_request')
+    def test_get_papers_batch_chunks_ids(self, mock_request, client):
+        """Test that ids are split into chunks of BATCH_SIZE."""
+        mock_request.side_effect = lambda *args, **kwargs: [None] * len(kwargs["json_body"]["ids"])
+        ids = [f"id-{i}" for i in range(SemanticScholarClient.BATCH_SIZE + 1)]
+
+        papers = client.get_papers_batch(ids)
+
+        assert len(papers) == len(ids)
+        assert mock_request.call_count == 2
+
 
 class TestSemanticScholarClientRateLimit:
     """Tests for rate limiting behavior."""
 
+    @patch('snowball.apis.base.time.sleep')
     @patch('httpx.Client.get')
-    def test_rate_limit_error(self, mock_get):
+    def test_rate_limit_error(self, mock_get, mock_sleep):
         """Test handling of rate limit response."""
         mock_response = Mock()
         mock_response.status_code = 429
+        mock_response.headers = {}
         mock_get.return_value = mock_response
         
         client = SemanticScholarClient(rate_limit_delay=0)
         
         with pytest.raises(RateLimitError):
             client._make_request("test/endpoint")
+        # 429s are retried with backoff before giving up
+        assert mock_get.call_count == 4
+
+    @patch('httpx.Client.get')
+    def test_concurrent_requests_respect_delay(self, mock_get):
+        """Test that threads sharing a client are spaced by rate_limit_delay."""
+        request_times = []
+
+        def record(*args, **kwargs):
+            request_times.append(time.monotonic())
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {}
+            return response
+
+        mock_get.side_effect = record
+        client = SemanticScholarClient(rate_limit_delay=0.05)
+
+        threads = [
+            threading.Thread(target=client._make_request, args=("test/endpoint",))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        request_times.sort()
+        gaps = [b - a for a, b in zip(request_times, request_times[1:])]
+        assert len(request_times) == 4
+        assert all(gap >= 0.045 for gap in gaps)
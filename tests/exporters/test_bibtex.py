@@ -1,5 +1,7 @@
 """Tests for BibTeX export functionality."""
 
+import io
+
 import pytest
 
 from snowball.exporters.bibtex import BibTeXExporter
@@ -45,6 +47,26 @@ class TestBibTeXExporter:
         result = exporter.export([], only_included=False)
         assert result == ""
 
+    def test_write_matches_export(self, exporter, paper_for_export, tmp_path):
+        """Test that streaming to a file produces the same document as export."""
+        second = paper_for_export.model_copy(update={"id": "test-id-2", "year": 2024})
+        output_path = tmp_path / "papers.bib"
+
+        count = exporter.write(iter([paper_for_export, second]), output_path)
+
+        assert count == 2
+        assert output_path.read_text() == exporter.export([paper_for_export, second])
+
+    def test_write_to_file_object(self, exporter, paper_for_export):
+        """Test that entries can be streamed into an already open file."""
+        second = paper_for_export.model_copy(update={"id": "test-id-2", "year": 2024})
+        buffer = io.StringIO()
+
+        count = exporter.write_to(iter([paper_for_export, second]), buffer)
+
+        assert count == 2
+        assert buffer.getvalue() == exporter.export([paper_for_export, second])
+
     def test_export_single_paper(self, exporter, paper_for_export):
         """Test exporting a single paper."""
         result = exporter.export([paper_for_export], only_included=True)
@@ -121,6 +121,14 @@ class TestCSVExporter:
         assert "Semantic_Scholar_ID" in content
         assert "Tags" in content
 
+    def test_export_from_generator(self, exporter, papers_for_export, output_path):
+        """Test that papers can be streamed from any iterable."""
+        exporter.export((p for p in papers_for_export), output_path, only_included=False)
+
+        lines = output_path.read_text().splitlines()
+        assert lines[0].startswith("Title,Authors,Year")
+        assert len(lines) == len(papers_for_export) + 1
+
     def test_export_empty_list(self, exporter, output_path):
         """Test exporting an empty list."""
         exporter.export([], output_path, only_included=False)
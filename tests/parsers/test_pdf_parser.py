@@ -1,7 +1,14 @@
 """Tests for PDF parsing functionality."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from snowball.parsers import pdf_parser
 from snowball.parsers.pdf_parser import PDFParser, PDFParseResult
 
 
@@ -43,6 +50,39 @@ class TestPDFParser:
         assert parser.grobid_available is False
 
 
+class TestPDFParserPythonFallback:
+    """Tests for the pypdfium2 fallback parser."""
+
+    def test_pdfium_calls_are_serialized(self):
+        """Concurrent fallback parses never enter PDFium at the same time."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def get_text_range():
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return "A Sufficiently Long Paper Title For Heuristics"
+
+        def make_document(path):
+            document = MagicMock()
+            document.__len__.return_value = 1
+            textpage = document.__getitem__.return_value.get_textpage.return_value
+            textpage.get_text_range = get_text_range
+            return document
+
+        parser = PDFParser(use_grobid=False)
+        with patch.object(pdf_parser.pdfium, "PdfDocument", side_effect=make_document):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(parser.parse, [Path(f"{i}.pdf") for i in range(8)]))
+
+        assert state["peak"] == 1
+        assert all(result.title for result in results)
+
+
 class TestPDFParserHeuristics:
     """Tests for PDF parsing heuristic methods."""
 
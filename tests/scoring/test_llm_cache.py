@@ -0,0 +1,47 @@
+"""Tests for the LLM score cache."""
+
+from snowball.models import Paper, PaperSource
+from snowball.scoring.llm_cache import CACHE_FILE, ScoreCache
+
+
+def make_paper(title="Paper", abstract=None):
+    """Create a paper with the given title and abstract."""
+    return Paper(id="p1", title=title, abstract=abstract, source=PaperSource.SEED)
+
+
+class TestScoreCache:
+    """Tests for ScoreCache."""
+
+    def test_key_depends_on_model_question_and_text(self):
+        """Test that any input to the prompt changes the key."""
+        key = ScoreCache.make_key("m", "rq", make_paper())
+
+        assert ScoreCache.make_key("m", "rq", make_paper()) == key
+        assert ScoreCache.make_key("other", "rq", make_paper()) != key
+        assert ScoreCache.make_key("m", "other", make_paper()) != key
+        assert ScoreCache.make_key("m", "rq", make_paper(title="Other")) != key
+        assert ScoreCache.make_key("m", "rq", make_paper(abstract="Text")) != key
+
+    def test_memory_only_without_dir(self):
+        """Test that a cache without a directory keeps scores in memory."""
+        cache = ScoreCache()
+        cache.set("k", 0.5)
+        cache.save()
+
+        assert cache.get("k") == 0.5
+        assert cache.get("missing") is None
+
+    def test_saved_scores_reload(self, tmp_path):
+        """Test that saved scores are read back and the directory is git-ignored."""
+        cache = ScoreCache(tmp_path)
+        cache.set("k", 0.5)
+        cache.save()
+
+        assert ScoreCache(tmp_path).get("k") == 0.5
+        assert (tmp_path / ".gitignore").read_text() == "*\n"
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        """Test that an unreadable cache file is ignored."""
+        (tmp_path / CACHE_FILE).write_text("{not json")
+
+        assert ScoreCache(tmp_path).get("k") is None
@@ -1,21 +1,33 @@
 """Tests for LLM-based relevance scoring."""
 
 import json
+import re
+import subprocess
+import sys
+import threading
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
 from snowball.models import Paper, PaperSource
 
 
+def make_response(content):
+    """Create a mock chat completion whose reply is content."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    return response
+
+
 class TestLLMScorer:
     """Tests for LLMScorer class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_rq(self):
         """Sample research question for testing."""
         return "How does machine learning improve healthcare diagnosis?"
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_papers(self):
         """Sample papers for testing."""
         return [
@@ -41,6 +53,18 @@ class TestLLMScorer:
             with pytest.raises(ValueError, match="API key required"):
                 LLMScorer(api_key=None)
 
+    def test_import_defers_optional_packages(self):
+        """Test that importing the scorer loads neither openai nor tiktoken."""
+        code = (
+            "import sys, snowball.scoring.llm_scorer; "
+            "print(sorted({'openai', 'tiktoken'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
     def test_accepts_api_key_param(self):
         """Test that LLMScorer accepts API key as parameter."""
         from snowball.scoring.llm_scorer import LLMScorer
@@ -56,6 +80,36 @@ class TestLLMScorer:
             scorer = LLMScorer()
             assert scorer.api_key == "env-key"
 
+    def test_client_uses_persistent_http_client(self, sample_rq, sample_papers):
+        """Test that one pooled HTTP client serves every batch until closed."""
+        import httpx
+        from snowball.scoring.llm_scorer import LLMScorer
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = make_response("[0.5]")
+
+        with patch("openai.OpenAI", return_value=mock_client) as openai_class:
+            scorer = LLMScorer(api_key="test-key", batch_size=1)
+            scorer.score_papers(sample_rq, sample_papers)
+            scorer.close()
+
+        openai_class.assert_called_once()
+        assert isinstance(openai_class.call_args.kwargs["http_client"], httpx.Client)
+        assert mock_client.chat.completions.create.call_count == 2
+        mock_client.close.assert_called_once()
+
+    def test_client_keeps_long_timeout(self):
+        """Test that the pooled client does not shorten the API call timeout."""
+        pytest.importorskip("openai")
+        from snowball.scoring.llm_scorer import REQUEST_TIMEOUT, LLMScorer
+
+        scorer = LLMScorer(api_key="test-key")
+        try:
+            assert scorer.client.timeout == REQUEST_TIMEOUT
+            assert scorer.client.timeout.read == 600.0
+        finally:
+            scorer.close()
+
     def test_empty_papers_list(self, sample_rq):
         """Test handling of empty papers list."""
         from snowball.scoring.llm_scorer import LLMScorer
@@ -104,6 +158,23 @@ class TestLLMScorer:
         assert results[0][1] == 0.7
         assert results[1][1] == 0.5
 
+    def test_handles_text_around_scores(self, sample_rq, sample_papers):
+        """Test that scoring finds the scores array inside surrounding text."""
+        from snowball.scoring.llm_scorer import LLMScorer
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Here are the scores:\n[0.6, 0.2]\nDone."
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_response
+
+        with patch("openai.OpenAI", return_value=mock_client):
+            scorer = LLMScorer(api_key="test-key")
+            results = scorer.score_papers(sample_rq, sample_papers)
+
+        assert [score for _, score in results] == [0.6, 0.2]
+
     def test_clamps_scores_to_valid_range(self, sample_rq, sample_papers):
         """Test that scores outside 0-1 range are clamped."""
         from snowball.scoring.llm_scorer import LLMScorer
@@ -185,6 +256,181 @@ class TestLLMScorer:
         assert calls[-1][0] == len(sample_papers)
 
 
+    def test_batches_scored_concurrently_in_order(self, sample_rq):
+        """Test that batches are sent concurrently and results keep paper order."""
+        from snowball.scoring.llm_scorer import BATCH_SIZE, LLMScorer
+
+        papers = [
+            Paper(id=f"p{i}", title=f"Paper {i}", source=PaperSource.SEED)
+            for i in range(BATCH_SIZE * 2 + 5)
+        ]
+        # Both full batches must be in flight at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            indices = [int(i) for i in re.findall(r"Title: Paper (\d+)", prompt)]
+            if len(indices) == BATCH_SIZE:
+                barrier.wait()
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = json.dumps([i / 100 for i in indices])
+            return response
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = create
+
+        with patch("openai.OpenAI", return_value=mock_client):
+            scorer = LLMScorer(api_key="test-key")
+            calls = []
+            results = scorer.score_papers(
+                sample_rq, papers, lambda current, total: calls.append((current, total))
+            )
+
+        assert [paper.id for paper, _ in results] == [paper.id for paper in papers]
+        assert [score for _, score in results] == [i / 100 for i in range(len(papers))]
+        assert mock_client.chat.completions.create.call_count == 3
+        assert [current for current, _ in calls] == sorted(current for current, _ in calls)
+        assert calls[-1] == (len(papers), len(papers))
+
+
+    def test_cache_hit_skips_api(self, sample_rq, sample_papers):
+        """Test that scoring the same papers again is answered from the cache."""
+        from snowball.scoring.llm_scorer import LLMScorer
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "[0.8, 0.3]"
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_response
+
+        with patch("openai.OpenAI", return_value=mock_client):
+            scorer = LLMScorer(api_key="test-key")
+            first = scorer.score_papers(sample_rq, sample_papers)
+            second = scorer.score_papers(sample_rq, sample_papers)
+
+        assert mock_client.chat.completions.create.call_count == 1
+        assert second == first
+
+    def test_cache_persists_and_skips_failures(self, sample_rq, sample_papers, tmp_path):
+        """Test that only usable scores are cached, and kept across scorers."""
+        from snowball.scoring.llm_scorer import LLMScorer
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = [
+            make_response("[0.8]"),
+            make_response("not valid json"),
+            make_response("[0.4]"),
+        ]
+
+        with patch("openai.OpenAI", return_value=mock_client):
+            results = LLMScorer(api_key="test-key", cache_dir=tmp_path, batch_size=1).score_papers(
+                sample_rq, sample_papers
+            )
+            rescored = LLMScorer(api_key="test-key", cache_dir=tmp_path).score_papers(
+                sample_rq, sample_papers
+            )
+
+        assert [score for _, score in results] == [0.8, 0.0]
+        assert [score for _, score in rescored] == [0.8, 0.4]
+        prompt = mock_client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+        assert sample_papers[1].title in prompt
+        assert sample_papers[0].title not in prompt
+
+    def test_batch_size_sets_papers_per_call(self, sample_rq):
+        """Test that papers are sent batch_size at a time."""
+        from snowball.scoring.llm_scorer import LLMScorer
+
+        papers = [Paper(id=f"p{i}", title=f"Paper {i}", source=PaperSource.SEED) for i in range(5)]
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = [
+            make_response("[0.1, 0.2]"),
+            make_response("[0.3, 0.4]"),
+            make_response("[0.5]"),
+        ]
+
+        with patch("openai.OpenAI", return_value=mock_client):
+            scorer = LLMScorer(api_key="test-key", batch_size=2)
+            with patch("snowball.scoring.llm_scorer.SCORE_WORKERS", 1):
+                results = scorer.score_papers(sample_rq, papers)
+
+        assert [score for _, score in results] == [0.1, 0.2, 0.3, 0.4, 0.5]
+        assert mock_client.chat.completions.create.call_count == 3
+
+    def test_rejects_invalid_batch_size(self):
+        """Test that batches must hold at least one paper."""
+        from snowball.scoring.llm_scorer import LLMScorer
+
+        with pytest.raises(ValueError, match="batch_size"):
+            LLMScorer(api_key="test-key", batch_size=0)
+
+    def test_count_mismatch_retries_halves(self, sample_rq):
+        """Test that a reply with the wrong number of scores is retried in halves."""
+        from snowball.scoring.llm_scorer import LLMScorer
+
+        papers = [Paper(id=f"p{i}", title=f"Paper {i}", source=PaperSource.SEED) for i in range(4)]
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = [
+            make_response("[0.1, 0.2, 0.3]"),
+            make_response("[0.1, 0.2]"),
+            make_response("[0.3, 0.4]"),
+        ]
+
+        with patch("openai.OpenAI", return_value=mock_client):
+            results = LLMScorer(api_key="test-key").score_papers(sample_rq, papers)
+
+        assert [score for _, score in results] == [0.1, 0.2, 0.3, 0.4]
+        prompts = [
+            call.kwargs["messages"][0]["content"]
+            for call in mock_client.chat.completions.create.call_args_list
+        ]
+        assert "Paper 1" in prompts[1] and "Paper 2" not in prompts[1]
+        assert "Paper 2" in prompts[2] and "Paper 1" not in prompts[2]
+
+    def test_prompt_builder_matches_template(self, sample_rq):
+        """Test that specialized prompts match the formatted template, braces included."""
+        from snowball.scoring.llm_scorer import PROMPT_TEMPLATE, make_prompt_builder
+
+        rq = sample_rq + " {papers} {0}"
+        entries = ["[1] Title: A\n", "[2] Title: {B}\n"]
+
+        assert make_prompt_builder(rq)(entries) == PROMPT_TEMPLATE.format(
+            research_question=rq, papers="\n".join(entries)
+        )
+
+    def test_packs_respects_budget(self, sample_rq):
+        """Test that batches are packed under the prompt token budget."""
+        from snowball.scoring.llm_scorer import PROMPT_TEMPLATE, LLMScorer, make_prompt_builder
+
+        papers = [
+            Paper(id=f"p{i}", title=f"Paper {i}", abstract="x" * 1000, source=PaperSource.SEED)
+            for i in range(100)
+        ]
+        scorer = LLMScorer(api_key="test-key", batch_size=100, max_prompt_tokens=5000)
+
+        with patch.object(scorer, "_count_tokens", side_effect=lambda text: len(text) // 4):
+            batches = scorer._pack(make_prompt_builder(sample_rq), papers)
+            budget = 5000 - len(PROMPT_TEMPLATE.format(research_question=sample_rq, papers="")) // 4
+
+            assert [position for batch in batches for position in batch] == list(range(100))
+            assert len(batches) >= 5
+            for batch in batches:
+                prompt_papers = "\n".join(
+                    scorer._paper_text(number + 1, papers[position])
+                    for number, position in enumerate(batch)
+                )
+                assert len(prompt_papers) // 4 <= budget
+
+    def test_pack_keeps_oversized_paper(self, sample_rq, sample_papers):
+        """Test that a paper larger than the budget is still sent on its own."""
+        from snowball.scoring.llm_scorer import LLMScorer, make_prompt_builder
+
+        scorer = LLMScorer(api_key="test-key", max_prompt_tokens=1)
+
+        assert scorer._pack(make_prompt_builder(sample_rq), sample_papers) == [[0], [1]]
+
+
 class TestGetScorerLLM:
     """Tests for get_scorer with LLM method."""
 
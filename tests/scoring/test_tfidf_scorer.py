@@ -1,18 +1,19 @@
 """Tests for TF-IDF based relevance scoring."""
 
 import pytest
+from unittest.mock import patch
 from snowball.scoring.tfidf_scorer import TFIDFScorer
 from snowball.scoring import get_scorer
 from snowball.models import Paper, PaperSource
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_rq():
     """Sample research question for testing."""
     return "How does machine learning improve healthcare diagnosis?"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_papers():
     """Sample papers with varying relevance to the RQ."""
     return [
@@ -136,6 +137,50 @@ class TestTFIDFScorer:
         assert score < 0.3, "Unrelated text should have low score"
 
 
+    def test_scores_match_cosine_similarity(self, sample_rq, sample_papers):
+        """Test that scores are the cosine similarity of TF-IDF vectors."""
+        pytest.importorskip("sklearn")
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        scorer = TFIDFScorer()
+        results = scorer.score_papers(sample_rq, sample_papers)
+
+        documents = [sample_rq] + [scorer.get_paper_text(p) for p in sample_papers]
+        matrix = TfidfVectorizer(
+            stop_words="english", max_features=5000, ngram_range=(1, 2)
+        ).fit_transform(documents)
+        expected = cosine_similarity(matrix[0:1], matrix[1:]).flatten()
+
+        assert [score for _, score in results] == pytest.approx(expected.tolist())
+        assert all(isinstance(score, float) for _, score in results)
+
+    def test_tfidf_cache_reuses_vectors(self, sample_rq, sample_papers):
+        """Test that papers are only tokenized again when new or edited."""
+        pytest.importorskip("sklearn")
+        scorer = TFIDFScorer()
+        first = scorer.score_papers(sample_rq, sample_papers)
+
+        new_paper = Paper(
+            id="p-new", title="Diagnosis with neural networks", source=PaperSource.SEED
+        )
+        with patch.object(scorer, "_analyze", wraps=scorer._analyze) as analyze:
+            again = scorer.score_papers(sample_rq, sample_papers)
+            scorer.score_papers(sample_rq, sample_papers + [new_paper])
+            edited = sample_papers[0].model_copy(update={"abstract": "An edited abstract."})
+            scorer.score_papers(sample_rq, [edited] + sample_papers[1:])
+
+        analyzed = [call.args[0] for call in analyze.call_args_list]
+        assert again == first
+        assert analyzed == [
+            sample_rq,
+            sample_rq,
+            scorer.get_paper_text(new_paper),
+            sample_rq,
+            scorer.get_paper_text(edited),
+        ]
+
+
 class TestGetScorer:
     """Tests for the get_scorer factory function."""
 
@@ -1,9 +1,13 @@
 """Tests for JSON storage functionality."""
 
 import json
+from unittest.mock import patch
 
-from snowball.storage.json_storage import JSONStorage
-from snowball.models import PaperStatus
+import pytest
+
+from snowball.storage import json_storage
+from snowball.storage.json_storage import JSONStorage, _write_json_object, json_dumps, model_dumps
+from snowball.models import Paper, PaperSource, PaperStatus, FilterCriteria
 
 
 class TestJSONStorage:
@@ -217,3 +221,261 @@ class TestJSONStorage:
             assert paper.id in index
             assert "title" in index[paper.id]
             assert "status" in index[paper.id]
+
+    def test_load_all_papers_from_disk(self, storage, sample_papers):
+        """Test that a fresh storage instance loads all papers written to disk."""
+        storage.save_papers(sample_papers)
+        storage.flush()
+
+        fresh = JSONStorage(storage.project_dir)
+        loaded = fresh.load_all_papers()
+
+        assert {p.id for p in loaded} == {p.id for p in sample_papers}
+        assert {p.title for p in loaded} == {p.title for p in sample_papers}
+
+    def test_get_statistics_tracks_status_changes(self, storage_with_papers):
+        """Test that cached statistics follow status updates."""
+        before = storage_with_papers.get_statistics()
+        pending = storage_with_papers.get_papers_by_status(PaperStatus.PENDING)[0]
+
+        storage_with_papers.update_paper_status(pending.id, PaperStatus.INCLUDED)
+        after = storage_with_papers.get_statistics()
+
+        assert after["total"] == before["total"]
+        assert after["by_status"]["included"] == before["by_status"]["included"] + 1
+        assert after["by_status"]["pending"] == before["by_status"]["pending"] - 1
+
+    def test_get_statistics_counts_new_papers(self, storage, sample_paper):
+        """Test that cached statistics include papers saved after the first call."""
+        assert storage.get_statistics()["total"] == 0
+
+        storage.save_paper(sample_paper)
+        stats = storage.get_statistics()
+
+        assert stats["total"] == 1
+        assert stats["by_status"] == {"pending": 1}
+        assert stats["by_source"] == {"seed": 1}
+
+    def test_load_papers_filters_cold_cache(self, storage, sample_papers):
+        """Test that load_papers applies predicates when reading from disk."""
+        storage.save_papers(sample_papers)
+        storage.flush()
+
+        fresh = JSONStorage(storage.project_dir)
+        included = fresh.load_papers(status_in={PaperStatus.INCLUDED})
+        recent = fresh.load_papers(filter_criteria=FilterCriteria(min_year=2022))
+
+        assert [p.id for p in included] == ["paper-1"]
+        # Papers with unknown year pass, as in FilterEngine
+        assert {p.id for p in recent} == {"paper-1", "paper-3", "paper-4"}
+
+    def test_load_papers_filters_warm_cache(self, storage_with_papers):
+        """Test that load_papers gives the same results from the in-memory cache."""
+        papers = storage_with_papers.load_papers(
+            filter_criteria=FilterCriteria(min_citations=100),
+            status_in={PaperStatus.INCLUDED, PaperStatus.PENDING},
+        )
+
+        assert {p.id for p in papers} == {"paper-1", "paper-4"}
+
+    def test_iter_papers_cold_cache(self, storage, sample_papers):
+        """Test that iter_papers streams papers from disk without filling the cache."""
+        storage.save_papers(sample_papers)
+        storage.flush()
+
+        fresh = JSONStorage(storage.project_dir)
+        papers = fresh.iter_papers()
+
+        assert next(papers).id in {p.id for p in sample_papers}
+        assert len(list(papers)) == len(sample_papers) - 1
+        assert [p.id for p in fresh.iter_papers(status_in={PaperStatus.INCLUDED})] == ["paper-1"]
+        assert fresh._papers_cache is None
+
+    def test_iter_papers_warm_cache(self, storage_with_papers, sample_papers):
+        """Test that iter_papers serves the cache and tolerates saves while iterating."""
+        seen = []
+        for paper in storage_with_papers.iter_papers(status_in={PaperStatus.PENDING}):
+            seen.append(paper.id)
+            storage_with_papers.save_paper(
+                Paper(id=f"new-{paper.id}", title="New", source=PaperSource.FORWARD)
+            )
+
+        assert set(seen) == {"paper-2", "paper-4"}
+
+    def test_load_papers_window(self, storage_with_papers):
+        """Test that consecutive windows line up with a full stable sort."""
+        def key(p):
+            return p.citation_count or 0
+
+        for reverse in (False, True):
+            expected = sorted(storage_with_papers.load_all_papers(), key=key, reverse=reverse)
+            windows = [
+                storage_with_papers.load_papers_window(key, offset, 2, reverse=reverse)
+                for offset in (0, 2, 4)
+            ]
+
+            assert [p.id for w in windows for p in w] == [p.id for p in expected]
+            assert windows[2] == []
+
+    def test_load_papers_window_filters(self, storage_with_papers):
+        """Test that status and predicate filters apply before windowing."""
+        papers = storage_with_papers.load_papers_window(
+            lambda p: p.id, 0, 10,
+            status_in={PaperStatus.PENDING, PaperStatus.INCLUDED},
+            predicate=lambda p: p.id != "paper-1",
+        )
+
+        assert [p.id for p in papers] == ["paper-2", "paper-4"]
+
+    def test_load_papers_window_rejects_negative(self, storage):
+        """Test that negative offsets and limits are rejected."""
+        with pytest.raises(ValueError):
+            storage.load_papers_window(lambda p: p.id, -1, 10)
+        with pytest.raises(ValueError):
+            storage.load_papers_window(lambda p: p.id, 0, -1)
+
+    def test_get_statistics_cold_cache(self, storage, sample_papers):
+        """Test that cold statistics are read from the raw files without loading papers."""
+        storage.save_papers(sample_papers)
+        storage.flush()
+
+        fresh = JSONStorage(storage.project_dir)
+        stats = fresh.get_statistics()
+
+        assert stats["total"] == 4
+        assert stats["by_status"] == {"included": 1, "pending": 2, "excluded": 1}
+        assert stats["by_iteration"] == {"0": 1, "1": 2, "2": 1}
+        assert fresh._papers_cache is None
+
+    def test_repeated_saves_are_written_once(self, storage, sample_paper):
+        """Test that saving a paper again before it reaches disk queues one write."""
+        # Stop the writer so saves accumulate in the queue
+        storage.shutdown()
+
+        for notes in ("first", "second", "third"):
+            sample_paper.notes = notes
+            storage.save_paper(sample_paper)
+        assert storage._write_queue.qsize() == 1
+
+        storage._shutdown_flag.clear()
+        storage._start_writer_thread()
+        storage.flush()
+
+        fresh = JSONStorage(storage.project_dir)
+        assert fresh.load_paper(sample_paper.id).notes == "third"
+
+    def test_load_migrates_maybe_status(self, storage, sample_paper):
+        """Test that the deprecated 'maybe' status is loaded as pending."""
+        data = sample_paper.model_dump(mode='json')
+        data["status"] = "maybe"
+        (storage.papers_dir / f"{sample_paper.id}.json").write_text(json.dumps(data))
+
+        fresh = JSONStorage(storage.project_dir)
+        assert fresh.load_paper(sample_paper.id).status == "pending"
+
+    def test_get_revision_counts_saves(self, storage, sample_paper):
+        """Test that each save of a paper bumps its revision."""
+        assert storage.get_revision(sample_paper.id) == 0
+
+        storage.save_paper(sample_paper)
+        storage.update_paper_status(sample_paper.id, PaperStatus.INCLUDED)
+
+        assert storage.get_revision(sample_paper.id) == 2
+
+    def test_get_version_changes_on_save_and_invalidate(self, storage, sample_paper):
+        """Test that the storage version moves on any save or cache reload."""
+        start = storage.get_version()
+
+        storage.save_paper(sample_paper)
+        after_save = storage.get_version()
+        storage.invalidate_cache()
+
+        assert start < after_save < storage.get_version()
+
+
+class TestJSONDumps:
+    """Tests for json_dumps helper."""
+
+    @pytest.mark.parametrize("indent", [True, False])
+    def test_stdlib_fallback_matches_orjson(self, sample_paper, indent):
+        """Test that both JSON backends write identical bytes."""
+        pytest.importorskip("orjson")
+        sample_paper.authors[0].name = "Jörg Müller"
+        data = sample_paper.model_dump(mode='json')
+
+        fast = json_dumps(data, indent=indent)
+        with patch.object(json_storage, "orjson", None):
+            fallback = json_dumps(data, indent=indent)
+
+        assert fallback == fast
+        assert b"M\\u00fcller" in fallback
+
+    def test_indented_output_matches_stdlib_default(self, sample_paper):
+        """Test that indented output keeps the stdlib's default format, escapes included."""
+        sample_paper.authors[0].name = "Jörg Müller"
+        data = sample_paper.model_dump(mode='json')
+
+        expected = json.dumps(data, indent=2, default=str).encode("utf-8")
+
+        assert json_dumps(data, indent=True) == expected
+
+    @pytest.mark.parametrize("value", [0.0, 1e-4, 0.25, 1 / 3, 12345.678, 1e15])
+    def test_plain_floats_match_across_backends(self, value):
+        """Test that floats written without an exponent have the same bytes in both backends."""
+        pytest.importorskip("orjson")
+        fast = json_dumps({"x": value})
+        with patch.object(json_storage, "orjson", None):
+            fallback = json_dumps({"x": value})
+
+        assert fallback == fast
+        assert json.loads(fast)["x"] == value
+
+    @pytest.mark.parametrize("indent", [True, False])
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_model_dumps_matches_json_dumps(self, sample_paper, indent, use_orjson):
+        """Test that models serialize to the same bytes as their dumped dicts."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        sample_paper.authors[0].name = "Jörg Müller"
+        sample_paper.relevance_score = 0.25
+
+        with patch.object(json_storage, "orjson", json_storage.orjson if use_orjson else None):
+            expected = json_dumps(sample_paper.model_dump(mode='json'), indent=indent)
+            assert model_dumps(sample_paper, indent=indent) == expected
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("score", [1e-5, 1e-4, 0.25, 1 / 3])
+    def test_model_dumps_float_values(self, sample_paper, use_orjson, score):
+        """Test that scores read back exactly, and plain floats match json_dumps."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        sample_paper.relevance_score = score
+
+        with patch.object(json_storage, "orjson", json_storage.orjson if use_orjson else None):
+            data = model_dumps(sample_paper, indent=True)
+            expected = json_dumps(sample_paper.model_dump(mode='json'), indent=True)
+
+        assert json.loads(data)["relevance_score"] == score
+        if score >= 1e-4:
+            assert data == expected
+
+    @pytest.mark.parametrize("entries", [0, 1, 3])
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_write_json_object_matches_json_dumps(self, tmp_path, entries, use_orjson):
+        """Test that streamed objects match the indented dump of the whole dict."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        data = {
+            f"id-{i}": {
+                "title": f"Line\nbreak \"{i}\" Müller",
+                "year": 2000 + i,
+                "tags": ["a"],
+                "raw": {},
+            }
+            for i in range(entries)
+        }
+        path = tmp_path / "index.json"
+
+        with patch.object(json_storage, "orjson", json_storage.orjson if use_orjson else None):
+            _write_json_object(path, data.items())
+            assert path.read_bytes() == json_dumps(data, indent=True)
@@ -0,0 +1,99 @@
+"""Tests for SQLite storage functionality."""
+
+import pytest
+
+from snowball.storage import open_storage, JSONStorage, SQLiteStorage
+from snowball.models import PaperStatus, FilterCriteria
+
+
+@pytest.fixture
+def sqlite_storage(temp_project_dir):
+    """Create a SQLiteStorage instance with a temporary directory."""
+    storage = SQLiteStorage(temp_project_dir)
+    yield storage
+    storage.shutdown()
+
+
+class TestSQLiteStorage:
+    """Tests for SQLiteStorage class."""
+
+    def test_creates_database(self, sqlite_storage):
+        """Test that init creates the database file."""
+        assert sqlite_storage.db_file.exists()
+        assert SQLiteStorage.exists_in(sqlite_storage.project_dir)
+        assert not sqlite_storage.papers_dir.exists()
+
+    def test_save_and_load_project(self, sqlite_storage, sample_project):
+        """Test that project metadata still round-trips."""
+        sqlite_storage.save_project(sample_project)
+        assert sqlite_storage.load_project().name == sample_project.name
+
+    def test_papers_persist_across_instances(self, sqlite_storage, sample_papers):
+        """Test that a fresh instance loads all saved papers from the database."""
+        sqlite_storage.save_papers(sample_papers)
+        sqlite_storage.flush()
+
+        fresh = SQLiteStorage(sqlite_storage.project_dir)
+        loaded = fresh.load_all_papers()
+
+        assert {p.id for p in loaded} == {p.id for p in sample_papers}
+        assert fresh.load_paper("paper-2").title == "Deep Learning Approaches"
+        assert fresh.load_paper("missing") is None
+
+    def test_load_papers_uses_sql_filters(self, sqlite_storage, sample_papers):
+        """Test that cold filtered loads match the JSON storage semantics."""
+        sqlite_storage.save_papers(sample_papers)
+        sqlite_storage.flush()
+
+        fresh = SQLiteStorage(sqlite_storage.project_dir)
+        included = fresh.load_papers(status_in={PaperStatus.INCLUDED})
+        recent = fresh.load_papers(filter_criteria=FilterCriteria(min_year=2022))
+
+        assert [p.id for p in included] == ["paper-1"]
+        assert {p.id for p in recent} == {"paper-1", "paper-3", "paper-4"}
+
+    def test_iter_papers_cold_cache(self, sqlite_storage, sample_papers):
+        """Test that iter_papers filters on the status column without filling the cache."""
+        sqlite_storage.save_papers(sample_papers)
+        sqlite_storage.flush()
+
+        fresh = SQLiteStorage(sqlite_storage.project_dir)
+
+        assert {p.id for p in fresh.iter_papers()} == {p.id for p in sample_papers}
+        assert [p.id for p in fresh.iter_papers(status_in={PaperStatus.INCLUDED})] == ["paper-1"]
+        assert list(fresh.iter_papers(status_in=set())) == []
+        assert fresh._papers_cache is None
+
+    def test_statistics_from_columns(self, sqlite_storage, sample_papers):
+        """Test that statistics are computed from the database and kept in sync."""
+        sqlite_storage.save_papers(sample_papers)
+        sqlite_storage.flush()
+
+        fresh = SQLiteStorage(sqlite_storage.project_dir)
+        stats = fresh.get_statistics()
+
+        assert stats["total"] == 4
+        assert stats["by_status"] == {"included": 1, "pending": 2, "excluded": 1}
+        assert stats["by_iteration"] == {"0": 1, "1": 2, "2": 1}
+
+        fresh.update_paper_status("paper-2", PaperStatus.INCLUDED)
+        assert fresh.get_statistics()["by_status"]["included"] == 2
+
+
+class TestOpenStorage:
+    """Tests for open_storage factory."""
+
+    def test_defaults_to_json(self, temp_project_dir):
+        """Test that projects without a database use JSON storage."""
+        storage = open_storage(temp_project_dir)
+        assert type(storage) is JSONStorage
+
+    def test_detects_sqlite(self, temp_project_dir):
+        """Test that projects with a database reopen as SQLite storage."""
+        open_storage(temp_project_dir, backend="sqlite").shutdown()
+        assert isinstance(open_storage(temp_project_dir), SQLiteStorage)
+
+    def test_unknown_backend(self, temp_project_dir):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            open_storage(temp_project_dir, backend="xml")
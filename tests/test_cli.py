@@ -4,9 +4,12 @@ import pytest
 from unittest.mock import Mock, patch
 import sys
 import tempfile
+from argparse import Namespace
 from pathlib import Path
 
-from snowball.cli import main, init_project, add_seed, run_snowball, export_results
+from snowball.cli import (
+    main, init_project, add_seed, run_snowball, export_results, show_stats, get_api_config,
+)
 
 
 class TestCLIHelpers:
@@ -29,12 +32,21 @@ class TestCLIHelpers:
         args.min_year = 2020
         args.max_year = 2024
         args.research_question = None
+        args.storage = "json"
 
         init_project(args)
 
         assert project_dir.exists()
         assert (project_dir / "project.json").exists()
 
+    def test_api_config_cache(self, temp_dir):
+        """Test that responses are cached in the project unless --no-cache is given."""
+        cached = get_api_config(Namespace(directory=str(temp_dir)))
+        uncached = get_api_config(Namespace(directory=str(temp_dir), no_cache=True))
+
+        assert cached["cache_dir"] == temp_dir / ".http_cache"
+        assert uncached["cache_dir"] is None
+
     def test_init_project_with_existing_directory(self, temp_dir):
         """Test init_project fails with existing non-empty directory."""
         # Create a file in the directory to make it non-empty
@@ -47,6 +59,7 @@ class TestCLIHelpers:
         args.min_year = None
         args.max_year = None
         args.research_question = None
+        args.storage = "json"
 
         with pytest.raises(SystemExit):
             init_project(args)
@@ -62,6 +75,7 @@ class TestCLIHelpers:
         args.min_year = None
         args.max_year = None
         args.research_question = None
+        args.storage = "json"
 
         init_project(args)
         
@@ -227,6 +241,40 @@ class TestCLIExport:
         assert bib_file.exists()
 
 
+class TestCLIStats:
+    """Tests for stats command."""
+
+    def test_json_lists_iteration_counters(self, temp_project_dir, sample_project, capsys):
+        """Test that JSON stats include every iteration counter."""
+        import json
+        from snowball.models import IterationStats
+        from snowball.storage.json_storage import JSONStorage
+
+        sample_project.iteration_stats[1] = IterationStats(
+            iteration=1, discovered=5, backward=3, forward=2, for_review=4, reviewed=1
+        )
+        JSONStorage(temp_project_dir).save_project(sample_project)
+
+        args = Mock()
+        args.directory = str(temp_project_dir)
+        args.format = "json"
+        show_stats(args)
+
+        details = json.loads(capsys.readouterr().out)["iteration_stats"]
+        assert details == {
+            "1": {
+                "discovered": 5,
+                "backward": 3,
+                "forward": 2,
+                "auto_excluded": 0,
+                "for_review": 4,
+                "manual_included": 0,
+                "manual_excluded": 0,
+                "reviewed": 1,
+            }
+        }
+
+
 class TestCLIMain:
     """Tests for main CLI entry point."""
 
@@ -165,6 +165,28 @@ class TestPaper:
         assert restored_paper.title == sample_paper.title
         assert restored_paper.status == sample_paper.status
 
+    def test_status_assignment_stored_as_string(self, sample_paper):
+        """Test that assigning an enum status keeps a plain string value."""
+        sample_paper.status = PaperStatus.INCLUDED
+        assert type(sample_paper.status) is str
+        assert sample_paper.status == "included"
+
+    def test_paper_id_lists_share_strings(self):
+        """Test that equal paper IDs in ID lists are one shared string."""
+        source_id = "".join(["source-", "paper-1"])
+        first = Paper(id="p1", title="A", source=PaperSource.BACKWARD, source_paper_ids=[source_id])
+        second = Paper.model_validate(
+            {
+                "id": "p2",
+                "title": "B",
+                "source": "backward",
+                "source_paper_ids": ["source-" + "paper-1"],
+            }
+        )
+
+        assert first.source_paper_ids == ["source-paper-1"]
+        assert first.source_paper_ids[0] is second.source_paper_ids[0]
+
     def test_paper_with_none_values(self):
         """Test paper with optional fields as None."""
         paper = Paper(
@@ -8,6 +8,8 @@ from snowball.paper_utils import (
     filter_papers,
     sort_papers,
     get_sort_key,
+    make_sort_key,
+    sort_key_uses_status,
     format_authors,
     truncate_title,
     paper_to_dict,
@@ -277,6 +279,22 @@ class TestGetSortKey:
         assert key[0] == 0
         assert key[1] == (1, "included")
 
+    def test_make_sort_key_sorts_papers(self, paper, paper_with_nones):
+        """Test that the column key function sorts like get_sort_key."""
+        papers = [paper, paper_with_nones]
+        columns = ("Status", "Title", "Year", "Cite", "Rel", "Refs", "Source", "Iter", "Obs", "Other")
+        for column in columns:
+            key_fn = make_sort_key(column)
+            assert [key_fn(p) for p in papers] == [get_sort_key(p, column) for p in papers]
+
+    def test_sort_key_uses_status(self):
+        """Test which columns sort by status, including the fallback key."""
+        assert sort_key_uses_status("Status")
+        assert sort_key_uses_status("PDF")
+        assert sort_key_uses_status("UnknownColumn")
+        assert not sort_key_uses_status("Year")
+        assert not sort_key_uses_status("Title")
+
 
 class TestFormatAuthors:
     """Tests for format_authors function."""
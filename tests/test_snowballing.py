@@ -1,7 +1,7 @@
 """Tests for core snowballing functionality."""
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from pathlib import Path
 import tempfile
 
@@ -127,6 +127,23 @@ class TestSnowballEngine:
         finally:
             pdf_path.unlink(missing_ok=True)
 
+    def test_add_seeds_from_pdfs(self, engine, sample_project, mock_pdf_parser):
+        """Test adding several seed PDFs keeps input order and skips failures."""
+        def parse(pdf_path):
+            result = PDFParseResult()
+            result.title = None if pdf_path.name == "bad.pdf" else f"Title of {pdf_path.stem}"
+            return result
+
+        mock_pdf_parser.parse.side_effect = parse
+        pdf_paths = [Path("a.pdf"), Path("bad.pdf"), Path("b.pdf")]
+        seed_count = len(sample_project.seed_paper_ids)
+
+        results = engine.add_seeds_from_pdfs(pdf_paths, sample_project)
+
+        assert [path for path, _ in results] == pdf_paths
+        assert [p.title if p else None for _, p in results] == ["Title of a", None, "Title of b"]
+        assert len(sample_project.seed_paper_ids) == seed_count + 2
+
 
 class TestSnowballEngineIteration:
     """Tests for snowballing iteration logic."""
@@ -200,6 +217,21 @@ class TestSnowballEngineIteration:
         updated_project = storage_with_seeds.load_project()
         assert updated_project.current_iteration == 1
 
+    def test_run_snowball_iteration_reports_progress(
+        self, storage_with_seeds, mock_api_with_results
+    ):
+        """Test that progress is reported once per source paper."""
+        engine = SnowballEngine(storage_with_seeds, mock_api_with_results)
+        project = storage_with_seeds.load_project()
+        calls = []
+
+        engine.run_snowball_iteration(
+            project, progress_callback=lambda current, total: calls.append((current, total))
+        )
+
+        total = len(project.seed_paper_ids)
+        assert calls == [(i, total) for i in range(1, total + 1)]
+
     def test_run_snowball_iteration_deduplicates(
         self, storage_with_seeds, mock_api_with_results
     ):
@@ -256,6 +288,69 @@ class TestSnowballEngineIteration:
         assert stats["auto_excluded"] == 1
         assert stats["for_review"] == 1
 
+    def test_run_snowball_iteration_multiple_sources(self, temp_project_dir):
+        """Test that concurrently fetched results stay attached to their source paper."""
+        storage = JSONStorage(temp_project_dir)
+        seed_ids = [f"seed-{i}" for i in range(6)]
+        for seed_id in seed_ids:
+            storage.save_paper(Paper(
+                id=seed_id,
+                title=f"Seed Paper {seed_id}",
+                source=PaperSource.SEED,
+                snowball_iteration=0
+            ))
+        project = ReviewProject(name="Test", seed_paper_ids=seed_ids)
+        storage.save_project(project)
+
+        api = Mock(spec=APIAggregator)
+        api.get_references.side_effect = lambda paper: [Paper(
+            id=f"ref-of-{paper.id}",
+            doi=f"10.1234/ref-of-{paper.id}",
+            title=f"Reference of {paper.id}",
+            source=PaperSource.BACKWARD
+        )]
+        api.get_citations.return_value = []
+
+        engine = SnowballEngine(storage, api)
+        stats = engine.run_snowball_iteration(project)
+
+        assert stats["backward"] == len(seed_ids)
+        for seed_id in seed_ids:
+            ref = storage.load_paper(f"ref-of-{seed_id}")
+            assert ref.source_paper_ids == [seed_id]
+
+    def test_run_snowball_iteration_skips_repeat_discoveries(self, temp_project_dir):
+        """Test that a paper reached from several sources is only checked once."""
+        storage = JSONStorage(temp_project_dir)
+        seed_ids = ["seed-a", "seed-b", "seed-c"]
+        for seed_id in seed_ids:
+            storage.save_paper(Paper(
+                id=seed_id,
+                title=f"Seed Paper {seed_id}",
+                source=PaperSource.SEED,
+                snowball_iteration=0
+            ))
+        project = ReviewProject(name="Test", seed_paper_ids=seed_ids)
+        storage.save_project(project)
+
+        api = Mock(spec=APIAggregator)
+        api.get_references.side_effect = lambda paper: [Paper(
+            id=f"shared-via-{paper.id}",
+            doi="10.1234/SHARED",
+            title="Shared Reference",
+            source=PaperSource.BACKWARD
+        )]
+        api.get_citations.return_value = []
+
+        engine = SnowballEngine(storage, api)
+        with patch.object(
+            storage, "find_duplicate_paper", wraps=storage.find_duplicate_paper
+        ) as find_duplicate:
+            stats = engine.run_snowball_iteration(project)
+
+        assert stats["added"] == 1
+        assert find_duplicate.call_count == 1
+
     def test_run_snowball_iteration_no_source_papers(self, temp_project_dir):
         """Test iteration with no source papers."""
         storage = JSONStorage(temp_project_dir)
@@ -318,6 +413,18 @@ class TestSnowballEngineHelpers:
         assert engine._is_new_paper(new_paper, seen) is True
         assert engine._is_new_paper(existing_paper, seen) is False
 
+    def test_is_new_paper_normalizes_doi(self, engine):
+        """Test that DOI URL prefixes and case don't defeat deduplication."""
+        seen = set()
+        engine._mark_seen(Paper(
+            id="a", doi="10.1234/ABC", title="A", source=PaperSource.SEED
+        ), seen)
+
+        same = Paper(
+            id="b", doi="https://doi.org/10.1234/abc", title="B", source=PaperSource.SEED
+        )
+        assert engine._is_new_paper(same, seen) is False
+
     def test_mark_seen(self, engine):
         """Test marking papers as seen."""
         seen = set()
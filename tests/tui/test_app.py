@@ -0,0 +1,303 @@
+"""Tests for the Snowball TUI application."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from rich.text import Text
+from textual.widgets import DataTable, ProgressBar
+from textual.widgets.data_table import ColumnKey
+
+from snowball.models import Paper, PaperSource, PaperStatus, ReviewProject
+from snowball.snowballing import SnowballEngine
+from snowball.storage import open_storage
+from snowball.tui.app import TITLE_COLUMN_WIDTH, SnowballApp, run_tui
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """Create apps over a project in a temporary directory holding the given papers."""
+    storages = []
+
+    def make(papers):
+        storage = open_storage(tmp_path, backend="json")
+        storages.append(storage)
+        project = ReviewProject(name="x")
+        storage.save_project(project)
+        for paper in papers:
+            storage.save_paper(paper)
+        return SnowballApp(tmp_path, storage, SnowballEngine(storage, Mock()), project)
+
+    yield make
+    for storage in storages:
+        storage.shutdown()
+
+
+def row_ids(table):
+    """Get the paper IDs of a table's rows, in display order."""
+    return [row_key.value for row_key in table.rows]
+
+
+class TestBuildRow:
+    """Tests for table row construction."""
+
+    def test_cells_are_text(self):
+        """Every cell is a Text so the table never parses markup."""
+        paper = Paper(
+            id="p1", title="On [bold] and [/] in titles", source=PaperSource.SEED, year=2020
+        )
+        row = SnowballApp._build_row(Mock(project=ReviewProject(name="x")), paper)
+
+        assert all(isinstance(cell, Text) for cell in row)
+        assert row[1].plain == "On [bold] and [/] in titles"
+
+    def test_long_titles_cut_when_painted(self, make_app):
+        """Long titles are kept whole and cut to the title column width."""
+        title = "A " * 200
+        app = make_app([Paper(id="p1", title=title, source=PaperSource.SEED)])
+
+        async def run():
+            async with app.run_test(size=(200, 30)) as pilot:
+                await pilot.pause()
+                table = app.query_one(DataTable)
+                column = table.columns[ColumnKey("Title")]
+                assert column.get_render_width(table) == TITLE_COLUMN_WIDTH + 2 * table.cell_padding
+                assert table.get_cell("p1", "Title").plain == title
+
+        asyncio.run(run())
+
+    def test_title_column_fits_short_titles(self, make_app):
+        """The title column is only as wide as the longest title."""
+        app = make_app([
+            Paper(id="p1", title="Short title", source=PaperSource.SEED),
+            Paper(id="p2", title="A slightly longer title", source=PaperSource.SEED),
+        ])
+
+        async def run():
+            async with app.run_test(size=(200, 30)) as pilot:
+                await pilot.pause()
+                table = app.query_one(DataTable)
+                return table.columns[ColumnKey("Title")].width
+
+        assert asyncio.run(run()) == len("A slightly longer title")
+
+
+class TestPaperDetails:
+    """Tests for the detail panel markup."""
+
+    def test_details_cached_until_saved(self, make_app):
+        """Details are reused until the paper is saved again."""
+        paper = Paper(id="p1", title="Paper", source=PaperSource.SEED)
+        app = make_app([paper])
+
+        details = app._format_paper_details(paper)
+        assert app._format_paper_details(paper) is details
+
+        app.engine.update_paper_review("p1", PaperStatus.INCLUDED, "")
+        updated = app._format_paper_details(paper)
+
+        assert updated is not details
+        assert "included" in updated
+
+
+class TestStatusUpdates:
+    """Tests for reviewing papers from the table."""
+
+    def test_fallback_sort_reorders_after_status_change(self, make_app):
+        """Columns sorted by the (iteration, status) fallback reorder on review."""
+        app = make_app([
+            Paper(id=f"p{i}", title=f"Paper {i}", source=PaperSource.SEED, pdf_path=f"p{i}.pdf")
+            for i in range(6)
+        ])
+
+        async def run():
+            async with app.run_test() as pilot:
+                table = app.query_one("#papers-table", DataTable)
+                app.sort_column = "PDF"
+                app._refresh_table()
+                await pilot.pause()
+                table.move_cursor(row=3)
+                await pilot.pause()
+                await pilot.press("left")
+                await pilot.pause()
+                shown = row_ids(table)
+                app._refresh_table()
+                await pilot.pause()
+                return shown, row_ids(table)
+
+        shown, refreshed = asyncio.run(run())
+
+        assert shown == refreshed
+        assert "[#f85149]Excluded:[/#f85149] Paper" in app._event_log[-1]
+
+
+class TestRowHighlight:
+    """Tests for following the table cursor."""
+
+    def test_repeated_highlight_is_skipped(self, make_app):
+        """A repeated highlight of the current row does not reload its paper."""
+        app = make_app([
+            Paper(id=f"p{i}", title=f"Paper {i}", source=PaperSource.SEED) for i in range(3)
+        ])
+
+        async def run():
+            async with app.run_test() as pilot:
+                table = app.query_one("#papers-table", DataTable)
+                table.move_cursor(row=1)
+                await pilot.pause()
+                row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
+                with patch.object(app.storage, "load_paper", wraps=app.storage.load_paper) as load:
+                    app.on_data_table_row_highlighted(DataTable.RowHighlighted(table, 1, row_key))
+                    skipped = load.call_count
+                    table.move_cursor(row=2)
+                    await pilot.pause()
+                    return skipped, load.call_count, app.current_paper.id, row_ids(table)[2]
+
+        skipped, loads, current_id, third_id = asyncio.run(run())
+
+        assert skipped == 0
+        assert loads == 1
+        assert current_id == third_id
+
+
+class TestTableRows:
+    """Tests for filling the papers table."""
+
+    def test_rows_load_in_windows(self, make_app):
+        """Rows are loaded a window at a time as the cursor reaches the last row."""
+        papers = [
+            Paper(id=f"p{i}", title=f"Paper {i}", source=PaperSource.SEED, year=2000 + i % 7)
+            for i in range(200)
+        ]
+        app = make_app(papers)
+
+        async def run():
+            async with app.run_test(size=(100, 30)) as pilot:
+                table = app.query_one("#papers-table", DataTable)
+                app.sort_column = "Year"
+                app.sort_ascending = False
+                app._refresh_table()
+                await pilot.pause()
+                windows = [row_ids(table)]
+                while len(windows[-1]) < 200 and len(windows) < 10:
+                    table.move_cursor(row=table.row_count - 1)
+                    await pilot.pause()
+                    windows.append(row_ids(table))
+                return windows
+
+        windows = asyncio.run(run())
+        expected = [p.id for p in sorted(papers, key=lambda p: p.year, reverse=True)]
+
+        assert len(windows) > 2
+        assert windows[-1] == expected
+        for shown, more in zip(windows, windows[1:]):
+            assert len(more) > len(shown)
+            assert more[:len(shown)] == shown
+
+    def test_mount_reads_each_file_once(self, make_app):
+        """Papers are read from disk once at mount, then served from the cache."""
+        app = make_app([
+            Paper(id=f"p{i}", title=f"Paper {i}", source=PaperSource.SEED) for i in range(100)
+        ])
+        app.storage.flush()
+        app.storage.invalidate_cache()
+
+        async def run():
+            with patch.object(
+                app.storage, "_load_paper_file", wraps=app.storage._load_paper_file
+            ) as load:
+                async with app.run_test(size=(100, 30)) as pilot:
+                    await pilot.pause()
+                    mounted = load.call_count
+                    table = app.query_one("#papers-table", DataTable)
+                    table.move_cursor(row=table.row_count - 1)
+                    await pilot.pause()
+                    app.sort_column = "Title"
+                    app._refresh_table()
+                    await pilot.pause()
+                    return mounted, load.call_count
+
+        mounted, total = asyncio.run(run())
+
+        assert mounted == 100
+        assert total == 100
+
+
+class TestExport:
+    """Tests for exporting from the TUI."""
+
+    def test_export_runs_in_worker(self, make_app, tmp_path):
+        """Export writes every file from a background worker."""
+        app = make_app([
+            Paper(
+                id="p1", title="Included Paper", source=PaperSource.SEED, status=PaperStatus.INCLUDED
+            ),
+            Paper(id="p2", title="Pending Paper", source=PaperSource.FORWARD),
+        ])
+
+        async def run():
+            async with app.run_test() as pilot:
+                await pilot.press("x")
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+
+        asyncio.run(run())
+
+        output_dir = tmp_path / "output"
+        assert "Included Paper" in (output_dir / "included_papers.bib").read_text()
+        assert "Pending Paper" in (output_dir / "all_papers.csv").read_text()
+        assert (output_dir / "citation_graph.tex").exists()
+        assert (output_dir / "citation_graph_standalone.tex").exists()
+        assert "Exported" in app._event_log[-1]
+
+
+class TestSnowball:
+    """Tests for running snowball iterations from the TUI."""
+
+    def test_snowball_runs_in_worker(self, make_app):
+        """The iteration runs in a worker and reports its progress while running."""
+        app = make_app([])
+        app.engine = Mock()
+
+        def run_iteration(project, progress_callback):
+            progress_callback(1, 2)
+            return {"added": 0}
+
+        app.engine.run_snowball_iteration.side_effect = run_iteration
+
+        async def run():
+            async with app.run_test() as pilot:
+                await pilot.press("s")
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                return app.query_one("#snowball-progress", ProgressBar)
+
+        progress = asyncio.run(run())
+
+        assert progress.progress == 1
+        assert progress.total == 2
+        assert not progress.display
+        assert "Snowball" in app._event_log[-1]
+
+
+class TestRunTUI:
+    """Tests for starting the TUI."""
+
+    def test_default_loop_without_uvloop(self, tmp_path):
+        """Without uvloop, the app runs without a loop argument."""
+        with patch("snowball.tui.app.uvloop", None), patch.object(SnowballApp, "run") as run:
+            run_tui(tmp_path, Mock(), Mock(), ReviewProject(name="x"))
+
+        run.assert_called_once_with()
+
+    def test_no_loop_for_old_textual(self, tmp_path):
+        """A Textual without the loop parameter is not passed the uvloop loop."""
+        uvloop = Mock()
+
+        def run(self, *, headless=False):
+            pass
+
+        with patch("snowball.tui.app.uvloop", uvloop), patch.object(SnowballApp, "run", run):
+            run_tui(tmp_path, Mock(), Mock(), ReviewProject(name="x"))
+
+        uvloop.new_event_loop.assert_not_called()